@@ -21,6 +21,9 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 from app.db import Base
 from app.models.summary import Summary
+from app.models.summary_lease import SummaryLease
+from app.models.summary_job import SummaryJob
+from app.models.chunk_summary import ChunkSummary
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
@@ -0,0 +1,33 @@
+"""create summary leases table
+
+Revision ID: 3c1f2a9d7e41
+Revises: bdfba05e28b3
+Create Date: 2026-10-18 10:12:03.482113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f2a9d7e41'
+down_revision: Union[str, Sequence[str], None] = 'bdfba05e28b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('summary_leases',
+    sa.Column('id', sa.String(length=64), nullable=False),
+    sa.Column('holder', sa.String(length=64), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('summary_leases')
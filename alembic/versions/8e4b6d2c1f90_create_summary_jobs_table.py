@@ -0,0 +1,39 @@
+"""create summary jobs table
+
+Revision ID: 8e4b6d2c1f90
+Revises: 3c1f2a9d7e41
+Create Date: 2026-10-18 11:02:47.915236
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b6d2c1f90'
+down_revision: Union[str, Sequence[str], None] = '3c1f2a9d7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('summary_jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('url', sa.String(length=2048), nullable=False),
+    sa.Column('words_limit', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_summary_jobs_status'), 'summary_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_summary_jobs_status'), table_name='summary_jobs')
+    op.drop_table('summary_jobs')
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+from app.dto.summary.create_summary_request import CreateSummaryRequest
+
+
+class CreateSummaryBatchRequest(BaseModel):
+    items: list[CreateSummaryRequest] = Field(..., min_length=1, max_length=500)
@@ -0,0 +1,14 @@
+from typing import Optional
+from pydantic import BaseModel, HttpUrl
+
+
+class CreateSummaryBatchItemResponse(BaseModel):
+    url: HttpUrl
+    summary: Optional[str] = None
+    created: bool = False
+    error: Optional[str] = None
+    degraded: bool = False
+
+
+class CreateSummaryBatchResponse(BaseModel):
+    items: list[CreateSummaryBatchItemResponse]
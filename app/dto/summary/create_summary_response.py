@@ -2,4 +2,5 @@ from app.dto.summary.get_summary_response import GetSummaryResponse
 
 
 class CreateSummaryResponse(GetSummaryResponse):
-    pass
+    # True when the backend was overloaded and a cheaper, unstored summary was served
+    degraded: bool = False
@@ -0,0 +1,19 @@
+from urllib.parse import urlparse, unquote
+from pydantic import BaseModel, Field, HttpUrl, field_validator
+
+
+class LookupSummariesRequest(BaseModel):
+    urls: list[HttpUrl] = Field(..., min_length=1, max_length=500)
+
+    @field_validator('urls')
+    @classmethod
+    def validate_wikipedia_urls(cls, urls: list[HttpUrl]) -> list[str]:
+        """Validate that every URL is from Wikipedia, normalized like CreateSummaryRequest.url"""
+        normalized = []
+        for url in urls:
+            url_str = str(url)
+            domain = urlparse(url_str).netloc.lower()
+            if not (domain.endswith('.wikipedia.org') or domain == 'wikipedia.org'):
+                raise ValueError(f"Only Wikipedia URLs are allowed")
+            normalized.append(unquote(url_str))
+        return normalized
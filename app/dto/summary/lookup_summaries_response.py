@@ -0,0 +1,8 @@
+from pydantic import BaseModel, HttpUrl
+
+from app.dto.summary.get_summary_response import GetSummaryResponse
+
+
+class LookupSummariesResponse(BaseModel):
+    summaries: list[GetSummaryResponse]
+    missing: list[HttpUrl]
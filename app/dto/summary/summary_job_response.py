@@ -0,0 +1,10 @@
+from typing import Optional
+from pydantic import BaseModel, HttpUrl
+
+
+class SummaryJobResponse(BaseModel):
+    job_id: str
+    status: str
+    url: HttpUrl
+    summary: Optional[str] = None
+    error: Optional[str] = None
@@ -5,16 +5,24 @@ env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
 
 from fastapi import FastAPI
-import uvicorn
 from app.routes import router
+from app.services.container import lifespan
+from app.shared.metrics.profiling import ProfilingMiddleware
+from app.shared.metrics.server_timing import ServerTimingMiddleware
 
 
 app = FastAPI(
     title="Summary API",
     description="An API to generate summaries from text inputs.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 app.include_router(router)
+app.add_middleware(ServerTimingMiddleware)
+# Outermost, so profiles cover the Server-Timing bookkeeping as well
+app.add_middleware(ProfilingMiddleware)
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
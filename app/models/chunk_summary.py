@@ -0,0 +1,17 @@
+# models/chunk_summary.py
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.sql import func
+
+from app.db import Base
+
+
+class ChunkSummary(Base):
+    __tablename__ = "chunk_summaries"
+
+    key = Column(String(64), primary_key=True)  # sha256 of model name + chunk text
+    model = Column(String(255), nullable=False)
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ChunkSummary(key={self.key}, model={self.model})>"
@@ -0,0 +1,29 @@
+# models/summary_job.py
+from enum import Enum
+
+from sqlalchemy import Column, String, Text, Integer, DateTime
+from sqlalchemy.sql import func
+
+from app.db import Base
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class SummaryJob(Base):
+    __tablename__ = "summary_jobs"
+
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    url = Column(String(2048), nullable=False)
+    words_limit = Column(Integer, nullable=False)
+    status = Column(String(16), nullable=False, default=JobStatus.PENDING.value, index=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<SummaryJob(id={self.id}, status={self.status})>"
@@ -0,0 +1,16 @@
+# models/summary_lease.py
+from sqlalchemy import Column, String, DateTime
+
+from app.db import Base
+
+
+class SummaryLease(Base):
+    """Short-lived claim on a summary id, shared by every API worker."""
+    __tablename__ = "summary_leases"
+
+    id = Column(String(64), primary_key=True)  # Summary id being computed
+    holder = Column(String(64), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<SummaryLease(id={self.id}, holder={self.holder})>"
@@ -1,9 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from app.routes.summary import router as summary_router
+from app.shared.metrics.metrics import render_latest
 router = APIRouter()
 @router.get("/healthcheck")
 async def healthcheck():
     return {
         "message": "Because he's the hero Gotham deserves, but not the one it needs right now. So we'll hunt him. Because he can take it. Because he's not our hero. He's a silent guardian, a watchful protector. A dark knight."}
 
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    content, content_type = render_latest()
+    return Response(content=content, media_type=content_type)
+
 router.include_router(summary_router)
\ No newline at end of file
@@ -1,13 +1,31 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Header, Query, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi_restful.cbv import cbv
 from fastapi import status as http_status
+import json
+import logging
+from typing import AsyncContextManager, Callable
 from urllib.parse import unquote, urlparse
 
+from app.dto.summary.create_summary_batch_request import CreateSummaryBatchRequest
+from app.dto.summary.create_summary_batch_response import (
+    CreateSummaryBatchItemResponse,
+    CreateSummaryBatchResponse,
+)
 from app.dto.summary.create_summary_request import CreateSummaryRequest
 from app.dto.summary.create_summary_response import CreateSummaryResponse
 from app.dto.summary.get_summary_response import GetSummaryResponse
-from app.services.container import get_summary_service
-from app.services.summary.summary import SummaryService
+from app.dto.summary.lookup_summaries_request import LookupSummariesRequest
+from app.dto.summary.lookup_summaries_response import LookupSummariesResponse
+from app.dto.summary.summary_job_response import SummaryJobResponse
+from app.models.summary_job import JobStatus
+from app.services.container import get_summary_job_service, get_summary_service, get_summary_service_session
+from app.services.jobs.summary_jobs import SummaryJobService
+from app.services.summary.summary import DegradedSummary, NoArticleTextError, SummaryService
+from app.shared.concurrency.admission import OverloadedError
+from app.shared.http.caching import cache_control, if_none_match, strong_etag
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/summary", tags=["summary"])
 
@@ -30,35 +48,186 @@ def validate_url_input(url2search: str = Query(..., description="URL to get summ
     return decoded_url
 
 
+def format_sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @cbv(router)
 class View:
-    @router.get("/", status_code=http_status.HTTP_200_OK,)
+    @router.get(
+        "/",
+        status_code=http_status.HTTP_200_OK,
+        responses={http_status.HTTP_304_NOT_MODIFIED: {"description": "The summary matches If-None-Match"}},
+    )
     async def get_summary_by_url(
         self,
+        response: Response,
         url2search: str = Depends(validate_url_input),
+        if_none_match_header: str | None = Header(None, alias="If-None-Match"),
         service: SummaryService = Depends(get_summary_service)
     ) -> GetSummaryResponse:
         summary_service_data = await service.get_summary_by_url(url2search)
-        if not  summary_service_data:
+        if not summary_service_data or not summary_service_data.summary:
             raise HTTPException(
                 status_code=http_status.HTTP_404_NOT_FOUND,
                 detail="Summary not found for the provided URL."
             )
 
+        # Stored summaries never change in place, so the row identifies the representation
+        headers = {
+            "ETag": strong_etag(
+                summary_service_data.id, summary_service_data.created_at, summary_service_data.summary
+            ),
+            "Cache-Control": cache_control(),
+        }
+        if if_none_match(if_none_match_header, headers["ETag"]):
+            return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
         return GetSummaryResponse(
             summary=summary_service_data.summary,
             url=summary_service_data.url
         )
 
-    @router.post("/", status_code=http_status.HTTP_201_CREATED,)
+    @router.post(
+        "/",
+        status_code=http_status.HTTP_201_CREATED,
+        responses={
+            http_status.HTTP_202_ACCEPTED: {"model": SummaryJobResponse},
+            http_status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": "The page has no article text to summarize"},
+            http_status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Summarization backend overloaded; see Retry-After"},
+        },
+    )
     async def create_summary(
             self,
+            request: Request,
             summary_payload: CreateSummaryRequest,
-            service: SummaryService = Depends(get_summary_service)
+            async_job: bool = Query(False, description="Return 202 with a job id instead of waiting for the summary"),
+            service: SummaryService = Depends(get_summary_service),
+            job_service: SummaryJobService = Depends(get_summary_job_service),
     ) -> CreateSummaryResponse:
-        summary_service_data = await service.create_summary(
-            url=str(summary_payload.url),
-            words_limit=summary_payload.words_limit
+        if async_job:
+            job = await job_service.submit(str(summary_payload.url), summary_payload.words_limit)
+            job_response = SummaryJobResponse(job_id=job.id, status=job.status, url=job.url)
+            return JSONResponse(
+                status_code=http_status.HTTP_202_ACCEPTED,
+                content=job_response.model_dump(mode="json"),
+                headers={"Location": f"{request.url.path.rstrip('/')}/jobs/{job.id}"},
+            )
+
+        try:
+            summary_service_data = await service.create_summary(
+                url=str(summary_payload.url),
+                words_limit=summary_payload.words_limit
+            )
+        except OverloadedError as exc:
+            raise HTTPException(
+                status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(exc),
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+        except NoArticleTextError:
+            raise HTTPException(
+                status_code=http_status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="The page has no article text to summarize.",
+            )
+        return CreateSummaryResponse(
+            summary=summary_service_data.summary,
+            url=summary_service_data.url,
+            degraded=isinstance(summary_service_data, DegradedSummary),
+        )
+
+    @router.get("/stream", response_class=StreamingResponse,)
+    async def stream_summary(
+        self,
+        url2search: str = Depends(validate_url_input),
+        words_limit: int = Query(100, description="Approximate number of words of the final summary"),
+        service_session: Callable[[], AsyncContextManager[SummaryService]] = Depends(get_summary_service_session),
+    ) -> StreamingResponse:
+        async def events():
+            try:
+                async with service_session() as service:
+                    async for event in service.stream_summary(url2search, words_limit):
+                        payload = {key: value for key, value in event.items() if key != "event"}
+                        if event["event"] == "summary":
+                            payload["url"] = url2search
+                        yield format_sse(event["event"], payload)
+            except OverloadedError as exc:
+                yield format_sse("error", {"detail": str(exc), "retry_after": exc.retry_after})
+            except NoArticleTextError:
+                yield format_sse("error", {"detail": "The page has no article text to summarize."})
+            except Exception:
+                # The event reaches the client; keep backend details in the logs
+                logger.exception("Streaming the summary of %s failed", url2search)
+                yield format_sse("error", {"detail": "Summary could not be created."})
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @router.get("/jobs/{job_id}", status_code=http_status.HTTP_200_OK,)
+    async def get_summary_job(
+        self,
+        job_id: str,
+        service: SummaryService = Depends(get_summary_service),
+        job_service: SummaryJobService = Depends(get_summary_job_service),
+    ) -> SummaryJobResponse:
+        job = await job_service.get_job(job_id)
+        if not job:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="Summary job not found."
+            )
+
+        summary = None
+        if job.status == JobStatus.SUCCEEDED.value:
+            summary_service_data = await service.get_summary_by_url(job.url)
+            summary = summary_service_data.summary if summary_service_data else None
+
+        return SummaryJobResponse(
+            job_id=job.id,
+            status=job.status,
+            url=job.url,
+            summary=summary,
+            error=job.error,
         )
-        return CreateSummaryResponse(summary=summary_service_data.summary, url=summary_service_data.url)
 
+    @router.post("/lookup", status_code=http_status.HTTP_200_OK,)
+    async def lookup_summaries(
+            self,
+            lookup_payload: LookupSummariesRequest,
+            service: SummaryService = Depends(get_summary_service)
+    ) -> LookupSummariesResponse:
+        """Read the stored summaries of many URLs at once; nothing is generated"""
+        results = await service.get_summaries_by_urls(lookup_payload.urls)
+        return LookupSummariesResponse(
+            summaries=[
+                GetSummaryResponse(summary=summary_data.summary, url=url)
+                for url, summary_data in results.items()
+                if summary_data is not None
+            ],
+            missing=[url for url, summary_data in results.items() if summary_data is None],
+        )
+
+    @router.post("/batch", status_code=http_status.HTTP_200_OK,)
+    async def create_summaries(
+            self,
+            batch_payload: CreateSummaryBatchRequest,
+            service: SummaryService = Depends(get_summary_service)
+    ) -> CreateSummaryBatchResponse:
+        results = await service.create_summaries(
+            [(str(item.url), item.words_limit) for item in batch_payload.items]
+        )
+        return CreateSummaryBatchResponse(items=[
+            CreateSummaryBatchItemResponse(
+                url=result.url,
+                summary=result.summary,
+                created=result.created,
+                error=result.error,
+                degraded=result.degraded,
+            )
+            for result in results
+        ])
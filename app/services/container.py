@@ -1,29 +1,139 @@
-from fastapi import Depends
-from requests import Session
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable
 
+from fastapi import Depends, FastAPI, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.jobs.summary_jobs import SummaryJobService
+from app.services.language_models.chunk_summary_cache import ChunkSummaryCache
 from app.services.language_models.language_models import LanguageModelsService
 from app.services.scrap.scrap_service import ScrapService
 from app.services.summary.summary import SummaryService
-from app.services.summary.summary_repository import SummaryRepository
-from app.shared.databases.connection import get_db
+from app.services.summary.summary_cache import CachedSummaryRepository, SummaryCache
+from app.services.summary.summary_repository import SummaryRepository, SummaryRepositoryInterface
+from app.shared.concurrency.admission import AdmissionController
+from app.shared.concurrency.single_flight import SingleFlight
+from app.shared.databases.connection import SessionLocal, get_db
+from app.shared.metrics.metrics import SERVICE_STATS
+from app.shared.requests.page_cache import PageCache
 from app.shared.requests.requests import RequestService
 
 
-def get_request_service() -> RequestService:
-    return RequestService()
+class ServiceContainer:
+    """Holds the services shared by every request during the app lifespan.
+
+    Stateless or connection-holding services are built once per worker here,
+    while per-request objects (DB session, repository) stay in the
+    dependency functions below.
+    """
+    def __init__(self):
+        page_cache = PageCache.from_env()
+        self.request_service = RequestService(page_cache=page_cache)
+        self.scrap_service = ScrapService(self.request_service, page_cache=page_cache)
+        self.chunk_summary_cache = ChunkSummaryCache(SessionLocal) if ChunkSummaryCache.enabled() else None
+        self.language_models_service = LanguageModelsService(chunk_cache=self.chunk_summary_cache)
+        self.single_flight = SingleFlight()
+        self.admission = AdmissionController.from_env(executor=self.language_models_service.executor)
+        self.summary_cache = SummaryCache()
+        self.summary_job_service = SummaryJobService(SessionLocal, self.build_summary_service)
+        self._register_stats()
+
+    def _register_stats(self) -> None:
+        """Expose the stats() of the shared services on /metrics."""
+        models = self.language_models_service
+        provider = models.provider.value
+        SERVICE_STATS.register("executor", provider, models.executor.stats)
+        SERVICE_STATS.register("caller", provider, models.caller.stats)
+        if models.chunk_batcher is not None:
+            SERVICE_STATS.register("batcher", provider, models.chunk_batcher.stats)
+        SERVICE_STATS.register("lru_cache", "summary", self.summary_cache.stats)
+        if self.chunk_summary_cache is not None:
+            SERVICE_STATS.register("cache", "chunk", self.chunk_summary_cache.stats)
+        SERVICE_STATS.register("admission", "summary", self.admission.stats)
+
+    def build_summary_service(self, db: AsyncSession) -> SummaryService:
+        """Build a SummaryService bound to the given session, outside a request."""
+        return SummaryService(
+            CachedSummaryRepository(SummaryRepository(db), self.summary_cache),
+            self.scrap_service,
+            self.language_models_service,
+            single_flight=self.single_flight,
+            admission=self.admission,
+            repository_scope=self.summary_repository_session,
+        )
+
+    @asynccontextmanager
+    async def summary_repository_session(self) -> AsyncIterator[SummaryRepositoryInterface]:
+        """Yield a summary repository with its own DB session."""
+        async with SessionLocal() as db:
+            yield CachedSummaryRepository(SummaryRepository(db), self.summary_cache)
+
+    @asynccontextmanager
+    async def summary_service_session(self) -> AsyncIterator[SummaryService]:
+        """Yield a SummaryService with its own DB session, for work that
+        outlives the request dependencies (e.g. streamed responses)."""
+        async with SessionLocal() as db:
+            yield self.build_summary_service(db)
+
+    async def start(self) -> None:
+        """Start the background workers of the shared services."""
+        await self.summary_job_service.start()
+
+    async def aclose(self) -> None:
+        """Release the resources held by the shared services."""
+        SERVICE_STATS.clear()
+        await self.summary_job_service.stop()
+        await self.request_service.aclose()
+        self.language_models_service.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the service container on startup and close it on shutdown."""
+    app.state.container = ServiceContainer()
+    await app.state.container.start()
+    try:
+        yield
+    finally:
+        await app.state.container.aclose()
+
+def get_container(request: Request) -> ServiceContainer:
+    return request.app.state.container
+
+def get_request_service(container: ServiceContainer = Depends(get_container)) -> RequestService:
+    return container.request_service
+
+def get_scrap_service(container: ServiceContainer = Depends(get_container)) -> ScrapService:
+    return container.scrap_service
+
+def get_summary_repository(
+    db: AsyncSession = Depends(get_db),
+    container: ServiceContainer = Depends(get_container),
+) -> SummaryRepositoryInterface:
+    return CachedSummaryRepository(SummaryRepository(db), container.summary_cache)
 
-def get_scrap_service(request_service: RequestService = Depends(get_request_service)) -> ScrapService:
-    return ScrapService(request_service)
+def get_language_models_service(container: ServiceContainer = Depends(get_container)) -> LanguageModelsService:
+    return container.language_models_service
 
-def get_summary_repository(db: Session = Depends(get_db)) -> SummaryRepository:
-    return SummaryRepository(db)
+def get_summary_job_service(container: ServiceContainer = Depends(get_container)) -> SummaryJobService:
+    return container.summary_job_service
 
-def get_language_models_service() -> LanguageModelsService:
-    return LanguageModelsService()
+def get_summary_service_session(
+    container: ServiceContainer = Depends(get_container),
+) -> Callable[[], AsyncContextManager[SummaryService]]:
+    return container.summary_service_session
 
 def get_summary_service(
-    summary_repository: SummaryRepository = Depends(get_summary_repository),
+    summary_repository: SummaryRepositoryInterface = Depends(get_summary_repository),
     scrap_service: ScrapService = Depends(get_scrap_service),
-    language_models_service: LanguageModelsService = Depends(get_language_models_service)
+    language_models_service: LanguageModelsService = Depends(get_language_models_service),
+    container: ServiceContainer = Depends(get_container),
 ) -> SummaryService:
-    return SummaryService(summary_repository, scrap_service, language_models_service)
\ No newline at end of file
+    return SummaryService(
+        summary_repository,
+        scrap_service,
+        language_models_service,
+        single_flight=container.single_flight,
+        admission=container.admission,
+        repository_scope=container.summary_repository_session,
+    )
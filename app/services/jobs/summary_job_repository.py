@@ -0,0 +1,64 @@
+import uuid
+from abc import ABC, abstractmethod
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.summary_job import JobStatus, SummaryJob
+
+
+class SummaryJobRepositoryInterface(ABC):
+    @abstractmethod
+    async def create_job(self, url: str, words_limit: int) -> SummaryJob:
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> SummaryJob | None:
+        pass
+
+    @abstractmethod
+    async def update_status(self, job_id: str, status: JobStatus, error: str | None = None) -> None:
+        pass
+
+    @abstractmethod
+    async def get_unfinished_job_ids(self) -> list[str]:
+        pass
+
+class SummaryJobRepository(SummaryJobRepositoryInterface):
+    """Repository to persist asynchronous summary jobs."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_job(self, url: str, words_limit: int) -> SummaryJob:
+        """Create a pending job record."""
+        job = SummaryJob(
+            id=uuid.uuid4().hex,
+            url=url,
+            words_limit=words_limit,
+            status=JobStatus.PENDING.value,
+        )
+        self.db.add(job)
+        await self.db.commit()
+        await self.db.refresh(job)
+        return job
+
+    async def get_job(self, job_id: str) -> SummaryJob | None:
+        """Retrieve a job by its ID."""
+        result = await self.db.execute(select(SummaryJob).where(SummaryJob.id == job_id))
+        return result.scalars().first()
+
+    async def update_status(self, job_id: str, status: JobStatus, error: str | None = None) -> None:
+        """Move a job to a new status."""
+        await self.db.execute(
+            update(SummaryJob).where(SummaryJob.id == job_id).values(status=status.value, error=error)
+        )
+        await self.db.commit()
+
+    async def get_unfinished_job_ids(self) -> list[str]:
+        """List jobs that were pending or running, oldest first."""
+        result = await self.db.execute(
+            select(SummaryJob.id)
+            .where(SummaryJob.status.in_([JobStatus.PENDING.value, JobStatus.RUNNING.value]))
+            .order_by(SummaryJob.created_at)
+        )
+        return list(result.scalars().all())
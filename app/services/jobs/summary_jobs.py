@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import os
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.summary_job import JobStatus, SummaryJob
+from app.services.jobs.summary_job_repository import SummaryJobRepository
+from app.services.summary.summary import DegradedSummary, NoArticleTextError, SummaryService
+from app.shared.concurrency.admission import OverloadedError
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryJobService:
+    """Run summary jobs on a pool of in-process asyncio workers.
+
+    Jobs are persisted through SummaryJobRepository, so jobs a previous
+    process left pending or running are queued again on start. Duplicate
+    work across API workers is absorbed by SummaryService's summary lease.
+    Jobs never settle for a degraded summary: while the backend is
+    overloaded they go back to pending and are queued again later.
+    """
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+            service_factory: Callable[[AsyncSession], SummaryService],
+            workers: int | None = None,
+    ):
+        self.session_factory = session_factory
+        self.service_factory = service_factory
+        self.workers = workers if workers is not None else int(os.getenv("SUMMARY_JOB_WORKERS", "2"))
+        self.retry_seconds = float(os.getenv("SUMMARY_JOB_RETRY_SECONDS", "5"))
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._queued: set[str] = set()
+        self._tasks: list[asyncio.Task] = []
+        self._retries: set[asyncio.TimerHandle] = set()
+
+    async def start(self) -> None:
+        """Start the workers and re-queue unfinished jobs in the background."""
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._recover()))
+
+    async def stop(self) -> None:
+        """Cancel the workers; interrupted jobs are recovered on next start."""
+        for handle in self._retries:
+            handle.cancel()
+        self._retries.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, url: str, words_limit: int) -> SummaryJob:
+        """Persist a new job and queue it for the workers."""
+        async with self.session_factory() as db:
+            job = await SummaryJobRepository(db).create_job(url, words_limit)
+        self._enqueue(job.id)
+        return job
+
+    async def get_job(self, job_id: str) -> SummaryJob | None:
+        async with self.session_factory() as db:
+            return await SummaryJobRepository(db).get_job(job_id)
+
+    async def run_job(self, job_id: str) -> None:
+        """Run one job through SummaryService and record its outcome."""
+        async with self.session_factory() as db:
+            jobs = SummaryJobRepository(db)
+            job = await jobs.get_job(job_id)
+            if job is None or job.status in (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value):
+                return
+
+            await jobs.update_status(job_id, JobStatus.RUNNING)
+            try:
+                summary_data = await self.service_factory(db).create_summary(
+                    url=job.url, words_limit=job.words_limit, degrade=False
+                )
+                if isinstance(summary_data, DegradedSummary):
+                    # Coalesced with a request that degraded; nothing was stored
+                    raise OverloadedError("Only a degraded summary was available", self.retry_seconds)
+            except OverloadedError as exc:
+                logger.info("Summary job %s deferred: %s", job_id, exc)
+                await db.rollback()
+                await jobs.update_status(job_id, JobStatus.PENDING)
+                self._retry_later(job_id, max(exc.retry_after, self.retry_seconds))
+            except NoArticleTextError as exc:
+                logger.info("Summary job %s failed: %s", job_id, exc)
+                await db.rollback()
+                await jobs.update_status(
+                    job_id, JobStatus.FAILED, error="The page has no article text to summarize."
+                )
+            except Exception:
+                # The job's error is returned to clients; keep backend details in the logs
+                logger.exception("Summary job %s failed", job_id)
+                await db.rollback()
+                await jobs.update_status(job_id, JobStatus.FAILED, error="Summary could not be created.")
+            else:
+                await jobs.update_status(job_id, JobStatus.SUCCEEDED)
+
+    def _retry_later(self, job_id: str, delay: float) -> None:
+        def enqueue():
+            self._retries.discard(handle)
+            self._enqueue(job_id)
+
+        handle = asyncio.get_running_loop().call_later(delay, enqueue)
+        self._retries.add(handle)
+
+    def _enqueue(self, job_id: str) -> None:
+        if job_id not in self._queued:
+            self._queued.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def _recover(self) -> None:
+        try:
+            async with self.session_factory() as db:
+                job_ids = await SummaryJobRepository(db).get_unfinished_job_ids()
+        except Exception:
+            logger.exception("Could not load unfinished summary jobs")
+            return
+        for job_id in job_ids:
+            self._enqueue(job_id)
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self.run_job(job_id)
+            except Exception:
+                logger.exception("Could not run summary job %s", job_id)
+            finally:
+                self._queued.discard(job_id)
+                self._queue.task_done()
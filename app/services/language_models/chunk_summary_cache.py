@@ -0,0 +1,68 @@
+import hashlib
+import logging
+import os
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.services.language_models.chunk_summary_repository import ChunkSummaryRepository
+from app.shared.metrics.metrics import observe_stage, record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkSummaryCache:
+    """Persistent memo of chunk summaries keyed on (model name, chunk text hash).
+
+    Unchanged chunks of a refreshed or resubmitted article reuse their stored
+    summary, so only edited chunks reach the inference backend. Database
+    errors are logged and treated as misses; the cache never fails a summary.
+    """
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.getenv("CHUNK_SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    async def get_many(self, model: str, texts: list[str]) -> dict[str, str]:
+        """Return the stored summary of every known chunk, keyed by chunk text."""
+        keys = {self.key(model, text): text for text in texts}
+        try:
+            with observe_stage("db_read"):
+                async with self.session_factory() as db:
+                    stored = await ChunkSummaryRepository(db).get_summaries_by_keys(list(keys))
+        except Exception:
+            logger.warning("Chunk summary cache lookup failed", exc_info=True)
+            stored = {}
+
+        found = {keys[key]: summary for key, summary in stored.items()}
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        record_cache_lookup("chunk", hit=True, count=len(found))
+        record_cache_lookup("chunk", hit=False, count=len(keys) - len(found))
+        return found
+
+    async def put_many(self, model: str, summaries: dict[str, str]) -> None:
+        """Store chunk summaries, keyed by chunk text."""
+        rows = {self.key(model, text): summary for text, summary in summaries.items()}
+        try:
+            with observe_stage("db_write"):
+                async with self.session_factory() as db:
+                    await ChunkSummaryRepository(db).create_summaries(model, rows)
+        except Exception:
+            logger.warning("Chunk summary cache write failed", exc_info=True)
+
+    def stats(self) -> dict:
+        """Return the hit/miss counters and hit rate."""
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.chunk_summary import ChunkSummary
+
+
+class ChunkSummaryRepositoryInterface(ABC):
+    @abstractmethod
+    async def get_summaries_by_keys(self, keys: list[str]) -> dict[str, str]:
+        pass
+
+    @abstractmethod
+    async def create_summaries(self, model: str, summaries: dict[str, str]) -> None:
+        pass
+
+class ChunkSummaryRepository(ChunkSummaryRepositoryInterface):
+    """Repository to persist summaries of individual text chunks."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_summaries_by_keys(self, keys: list[str]) -> dict[str, str]:
+        """Map each stored key among ``keys`` to its summary, in one query."""
+        if not keys:
+            return {}
+        result = await self.db.execute(
+            select(ChunkSummary.key, ChunkSummary.summary).where(ChunkSummary.key.in_(keys))
+        )
+        return dict(result.all())
+
+    async def create_summaries(self, model: str, summaries: dict[str, str]) -> None:
+        """Bulk insert key -> summary rows, skipping keys stored concurrently."""
+        if not summaries:
+            return
+        self.db.add_all([ChunkSummary(key=key, model=model, summary=summary) for key, summary in summaries.items()])
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            stored = await self.get_summaries_by_keys(list(summaries))
+            self.db.add_all([
+                ChunkSummary(key=key, model=model, summary=summary)
+                for key, summary in summaries.items()
+                if key not in stored
+            ])
+            await self.db.commit()
@@ -1,28 +1,111 @@
 import asyncio
+import logging
 import os
+import zlib
 
-from functools import partial
+from typing import TYPE_CHECKING, AsyncIterator
 from enum import Enum
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_core.documents import Document
 
-from huggingface_hub import InferenceClient
+from app.services.language_models.chunk_summary_cache import ChunkSummaryCache
+from app.shared.concurrency.inference_executor import InferenceExecutor, provider_setting
+from app.shared.concurrency.micro_batcher import MicroBatcher
+from app.shared.metrics.metrics import CHUNKS_DROPPED, REDUCE_CALLS, REDUCE_LEVELS, observe_stage
+from app.shared.concurrency.admission import OverloadedError
+from app.shared.resilience.circuit_breaker import CircuitBreaker
+from app.shared.resilience.resilient_caller import ResilientCaller, RetryPolicy
+
+if TYPE_CHECKING:
+    # langchain and huggingface_hub are most of the API's import time; they are
+    # imported where first used, and huggingface_hub only for that provider
+    from huggingface_hub import SummarizationOutput
+    from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+# Rough BART token count per English word, used to turn words_limit into max_length
+TOKENS_PER_WORD = 1.4
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 100
+# On average one paragraph in this many closes its chunk, once the chunk holds MIN_CHUNK_SIZE characters
+PARAGRAPH_ANCHOR_PERIOD = 4
+MIN_CHUNK_SIZE = CHUNK_SIZE // 4
 
 
 class LLMProvider(Enum):
     OPENAI = "openai"
     HUGGINGFACE = "huggingface"
+    # Extractive TextRank on the CPU, no network
+    LOCAL = "local"
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Timeouts, connection errors, 429 and 5xx (e.g. 503 "model loading") are worth retrying."""
+    import requests
+    from huggingface_hub.errors import InferenceTimeoutError
+
+    if isinstance(exc, (TimeoutError, InferenceTimeoutError, requests.ConnectionError)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
 
 
 class LanguageModelsService:
     """Service to interact with different LLM providers for text summarization."""
-    def __init__(self):
+    def __init__(self, chunk_cache: ChunkSummaryCache | None = None, executor: InferenceExecutor | None = None):
         provider = os.getenv("LLM_PROVIDER", "huggingface").lower()
         self.provider = LLMProvider(provider)
-        self.model_name = "facebook/bart-large-cnn"
-        self.client = InferenceClient(
-            api_key=os.getenv("HF_TOKEN"),
-            model=self.model_name,
+        if self.provider == LLMProvider.LOCAL:
+            from app.services.language_models.textrank import TextRankSummarizer
+
+            self.local_summarizer = TextRankSummarizer()
+            self.model_name = self.local_summarizer.name
+            self.client = None
+        else:
+            from huggingface_hub import InferenceClient
+
+            self.local_summarizer = None
+            self.model_name = "facebook/bart-large-cnn"
+            policy = RetryPolicy.from_env(self.provider.value)
+            # HF_INFERENCE_BASE_URL points the client at a dedicated endpoint or a fake server
+            base_url = os.getenv("HF_INFERENCE_BASE_URL")
+            self.client = InferenceClient(
+                api_key=os.getenv("HF_TOKEN"),
+                timeout=policy.timeout_seconds,
+                **({"base_url": base_url} if base_url else {"model": self.model_name}),
+            )
+        self.chunk_cache = chunk_cache
+        # Bounds the calls per article: max_chunks map calls plus the reduce tree
+        self.max_chunks = int(os.getenv("SUMMARY_MAX_CHUNKS", "64"))
+        self.reduce_fan_in = int(os.getenv("SUMMARY_REDUCE_FAN_IN", "4"))
+        if self.reduce_fan_in < 2:
+            raise ValueError("SUMMARY_REDUCE_FAN_IN must be at least 2")
+        # An endpoint accepting {"inputs": [...]} lets concurrent chunk calls share one request
+        self.batch_url = os.getenv("HF_INFERENCE_BATCH_URL") if self.client is not None else None
+        self.chunk_batcher = None
+        if self.batch_url:
+            import requests
+
+            self._batch_session = requests.Session()
+            self.chunk_batcher = MicroBatcher(
+                self._summarize_batch,
+                max_batch_size=int(provider_setting(self.provider.value, "BATCH_MAX_SIZE", "16")),
+                max_wait_seconds=float(provider_setting(self.provider.value, "BATCH_WAIT_MS", "10")) / 1000,
+            )
+        self.dropped_chunks = 0
+        self.failed_chunks = 0
+        # Blocking client calls run here, bounded and rate limited per provider
+        self.executor = executor or InferenceExecutor.from_env(self.provider.value)
+        # Remote calls get timeouts, retries, hedging and a per-provider circuit breaker
+        self.caller = ResilientCaller(
+            self.executor,
+            RetryPolicy.from_env(self.provider.value),
+            CircuitBreaker(
+                self.provider.value,
+                failure_threshold=int(provider_setting(self.provider.value, "CIRCUIT_FAILURE_THRESHOLD", "5")),
+                reset_seconds=float(provider_setting(self.provider.value, "CIRCUIT_RESET_SECONDS", "30")),
+            ),
+            is_retryable=is_retryable,
         )
         # TODO read language from domain to choose model accordingly
         # TODO using langchain.llm to manage different providers
@@ -40,42 +123,266 @@ class LanguageModelsService:
         #         huggingfacehub_api_token=os.getenv("HF_TOKEN")
         #     )
 
+    def close(self) -> None:
+        """Stop the inference executor and close pooled batch connections."""
+        self.executor.shutdown()
+        if self.chunk_batcher is not None:
+            self._batch_session.close()
+
     async def summarize_chunk(self, doc):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            partial(self.client.summarization, doc.page_content, truncation='do_not_truncate')
+        with observe_stage("chunk_inference"):
+            if self.chunk_batcher is not None:
+                return await self.chunk_batcher.submit(doc.page_content)
+            return await self.caller.call(self.client.summarization, doc.page_content, truncation='do_not_truncate')
+
+    async def _summarize_batch(self, texts: list[str]) -> list["SummarizationOutput"]:
+        """Summarize chunks collected from concurrent requests in one batched call."""
+        return await self.caller.call(self._post_batch, texts)
+
+    def _post_batch(self, texts: list[str]) -> list["SummarizationOutput"]:
+        response = self._batch_session.post(
+            self.batch_url,
+            json={"inputs": texts, "parameters": {"truncation": "do_not_truncate"}},
+            headers={"Authorization": f"Bearer {os.getenv('HF_TOKEN')}"},
+            timeout=self.caller.policy.timeout_seconds,
         )
+        response.raise_for_status()
+        from huggingface_hub import SummarizationOutput
 
-    async def generate_summary(self, text: str, words_limit: int) -> str:
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=100
+        return [SummarizationOutput(summary_text=item["summary_text"]) for item in response.json()]
+
+    async def _iter_chunk_summaries(self, docs: list["Document"]) -> AsyncIterator[tuple[int, str]]:
+        """Yield ``(index, summary)`` for every chunk.
+
+        Chunks memoized in the chunk cache come first; the others are sent to
+        the backend concurrently (identical chunks only once) and yielded as
+        their calls complete, then stored in the cache. A chunk that still
+        fails after retries is skipped, unless no chunk succeeds at all or
+        the provider is overloaded (open circuit, saturated executor).
+        """
+        texts = [doc.page_content for doc in docs]
+        cached = await self.chunk_cache.get_many(self.model_name, texts) if self.chunk_cache else {}
+        pending: dict[str, list[int]] = {}
+        for index, text in enumerate(texts):
+            if text in cached:
+                yield index, cached[text]
+            else:
+                pending.setdefault(text, []).append(index)
+
+        from langchain_core.documents import Document
+
+        async def summarize(text: str) -> tuple[str, str]:
+            response = await self.summarize_chunk(Document(page_content=text))
+            return text, response.summary_text
+
+        tasks = [asyncio.ensure_future(summarize(text)) for text in pending]
+        computed = {}
+        error = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    text, chunk_summary = await next_done
+                except OverloadedError:
+                    # Open circuit or saturated executor: the whole article is overloaded
+                    raise
+                except Exception as exc:
+                    self.failed_chunks += 1
+                    CHUNKS_DROPPED.labels("failed").inc()
+                    logger.warning("Chunk summary failed, summarizing the article without it: %r", exc)
+                    error = exc
+                    continue
+                computed[text] = chunk_summary
+                for index in pending[text]:
+                    yield index, chunk_summary
+        finally:
+            # The caller may stop early (e.g. a client disconnect); drop the remaining work
+            for task in tasks:
+                task.cancel()
+
+        if error is not None and not computed and not cached:
+            raise error
+        if self.chunk_cache and computed:
+            await self.chunk_cache.put_many(self.model_name, computed)
+
+    def _split_text(self, text: str) -> list["Document"]:
+        """Split the article into chunks of whole paragraphs.
+
+        Paragraphs are packed up to CHUNK_SIZE characters, and a chunk of at
+        least MIN_CHUNK_SIZE characters also ends after any paragraph whose
+        hash is a multiple of PARAGRAPH_ANCHOR_PERIOD, so runs of short
+        paragraphs are not cut into tiny chunks. Boundaries therefore depend
+        only on nearby paragraphs: editing one paragraph changes its own
+        chunk (and at most the others up to the next anchor), so the rest of
+        the article still hits the chunk summary cache. Chunks do not overlap
+        for the same reason; only a paragraph longer than CHUNK_SIZE is
+        split, with overlap, inside itself.
+        """
+        from langchain_core.documents import Document
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+        text_splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+        with observe_stage("split"):
+            chunks, current, size = [], [], 0
+            for paragraph in text.split("\n"):
+                paragraph = paragraph.strip()
+                if not paragraph:
+                    continue
+                if current and (size + 1 + len(paragraph) > CHUNK_SIZE or len(paragraph) > CHUNK_SIZE):
+                    chunks.append("\n".join(current))
+                    current, size = [], 0
+                if len(paragraph) > CHUNK_SIZE:
+                    chunks.extend(text_splitter.split_text(paragraph))
+                    continue
+                current.append(paragraph)
+                size += len(paragraph) + (1 if size else 0)
+                if size >= MIN_CHUNK_SIZE and zlib.crc32(paragraph.encode("utf-8")) % PARAGRAPH_ANCHOR_PERIOD == 0:
+                    chunks.append("\n".join(current))
+                    current, size = [], 0
+            if current:
+                chunks.append("\n".join(current))
+            return [Document(page_content=chunk) for chunk in chunks]
+
+    def _select_chunks(self, split_docs: list["Document"]) -> list["Document"]:
+        """Keep at most max_chunks chunks, spread evenly over the whole article.
+
+        An article over the cap is sampled from its first to its last chunk,
+        so the summary still covers every part of it within the same call
+        budget; the skipped chunks are logged and counted.
+        """
+        skipped = len(split_docs) - self.max_chunks
+        if skipped <= 0:
+            return split_docs
+        self.dropped_chunks += skipped
+        CHUNKS_DROPPED.labels("over_cap").inc(skipped)
+        logger.warning(
+            "Article has %d chunks; summarizing %d spread across it (SUMMARY_MAX_CHUNKS)",
+            len(split_docs), self.max_chunks,
         )
-        docs = [Document(page_content=text)]
-        split_docs = text_splitter.split_documents(docs)
+        if self.max_chunks == 1:
+            return split_docs[:1]
+        last = len(split_docs) - 1
+        return [split_docs[round(i * last / (self.max_chunks - 1))] for i in range(self.max_chunks)]
+
+    async def _summarize_text(self, text: str, words_limit: int | None = None, truncation: str = 'only_first') -> str:
+        """One summarization call on the inference executor.
+
+        With ``words_limit`` the model is asked for at most that many words'
+        worth of tokens.
+        """
+        generate_parameters = None
+        if words_limit is not None:
+            generate_parameters = {"max_length": max(int(words_limit * TOKENS_PER_WORD), 1)}
+        response = await self.caller.call(
+            self.client.summarization,
+            text,
+            truncation=truncation,
+            generate_parameters=generate_parameters,
+        )
+        return response.summary_text
+
+    async def _summarize_short_text(self, doc: "Document", words_limit: int) -> str:
+        prompt = f"Write a concise summary in approximately {words_limit} words:\n\n{doc.page_content}"
+        summary = await self._summarize_text(prompt, words_limit, truncation='do_not_truncate')
+        return self._fit_words(summary, words_limit)
+
+    async def _combine_summaries(self, chunk_summaries: list[str], words_limit: int) -> str:
+        """Tree-reduce chunk summaries into one summary of at most words_limit words.
+
+        Each level joins ``reduce_fan_in`` neighbouring summaries and
+        summarizes the groups in parallel, so n chunk summaries take about
+        (n - 1) / (fan_in - 1) calls over log_fan_in(n) levels. A lone
+        trailing summary is carried up without a call. No summaries (e.g.
+        every chunk came back empty) combine to "".
+        """
+        if not chunk_summaries:
+            return ""
+
+        async def reduce_group(group: list[str], limit: int | None) -> str:
+            if len(group) == 1:
+                return group[0]
+            REDUCE_CALLS.inc()
+            return await self._summarize_text("\n\n".join(group), limit)
+
+        level = chunk_summaries
+        with observe_stage("reduce"):
+            while len(level) > 1:
+                REDUCE_LEVELS.inc()
+                groups = [level[i:i + self.reduce_fan_in] for i in range(0, len(level), self.reduce_fan_in)]
+                # Only the root call is asked to fit words_limit
+                limit = words_limit if len(groups) == 1 else None
+                level = await asyncio.gather(*[reduce_group(group, limit) for group in groups])
+        return self._fit_words(level[0], words_limit)
+
+    @staticmethod
+    def _fit_words(summary: str, words_limit: int) -> str:
+        """Cut a summary to words_limit words, at a sentence end when there is one."""
+        words = summary.split()
+        if len(words) <= words_limit:
+            return summary
+        clipped = " ".join(words[:words_limit])
+        if clipped.endswith((".", "!", "?")):
+            return clipped
+        sentence_end = max(clipped.rfind(mark) for mark in (". ", "! ", "? "))
+        return clipped[:sentence_end + 1] if sentence_end > 0 else clipped
+
+    @staticmethod
+    def call_budget(chunks: int, fan_in: int) -> int:
+        """Number of inference calls used to summarize ``chunks`` chunks."""
+        if chunks <= 1:
+            return 1
+        calls = chunks
+        level = chunks
+        while level > 1:
+            calls += level // fan_in + (1 if level % fan_in > 1 else 0)
+            level = -(-level // fan_in)
+        return calls
+
+    async def generate_summary(self, text: str, words_limit: int) -> str:
+        if self.local_summarizer is not None:
+            return await self.executor.run(self.local_summarizer.summarize, text, words_limit)
+
+        split_docs = self._split_text(text)
+        if not split_docs:
+            # Nothing to summarize (empty or whitespace-only article)
+            return ""
 
         # For shorter documents, summarize directly
         if len(split_docs) == 1:
-                prompt = f"Write a concise summary in approximately {words_limit} words:\n\n{split_docs[0].page_content}"
-                response = self.client.summarization(prompt, truncation='do_not_truncate')
-                return response.summary_text
-        else:
-            # Summarize each chunk asynchronously
-            tasks = [self.summarize_chunk(doc) for doc in split_docs[:10]]  # Limit to first 10 chunks for performance
-            summaries = await asyncio.gather(*tasks)
-            chunk_summaries = [s.summary_text for s in summaries]
-
-            # Combine and create final summary
-            combined = "\n\n".join(chunk_summaries)
-            final_response = self.client.summarization(
-                combined,
-                truncation='do_not_truncate'
-            )
-            while len(final_response.summary_text.split()) > words_limit:
-                print("Final summary too long, re-summarizing...")
-                final_response = self.client.summarization(
-                    final_response.summary_text,
-                    truncation='only_first'
-                )
-            return final_response.summary_text
+            return await self._summarize_short_text(split_docs[0], words_limit)
+
+        # Map: summarize every chunk concurrently, then reduce level by level
+        docs = self._select_chunks(split_docs)
+        chunk_summaries = [""] * len(docs)
+        async for index, chunk_summary in self._iter_chunk_summaries(docs):
+            chunk_summaries[index] = chunk_summary
+
+        return await self._combine_summaries([summary for summary in chunk_summaries if summary], words_limit)
+
+    async def stream_summary(self, text: str, words_limit: int) -> AsyncIterator[dict]:
+        """Summarize like generate_summary, yielding progress as it happens.
+
+        Yields a ``{"event": "chunk", "index", "summary"}`` dict for every chunk
+        summary as soon as it completes, then a single
+        ``{"event": "summary", "summary"}`` dict with the combined result.
+        The local provider has no chunks and yields the summary alone.
+        """
+        if self.local_summarizer is not None:
+            yield {"event": "summary", "summary": await self.generate_summary(text, words_limit)}
+            return
+
+        split_docs = self._split_text(text)
+        if not split_docs:
+            yield {"event": "summary", "summary": ""}
+            return
+        if len(split_docs) == 1:
+            yield {"event": "summary", "summary": await self._summarize_short_text(split_docs[0], words_limit)}
+            return
+
+        docs = self._select_chunks(split_docs)
+        chunk_summaries = [""] * len(docs)
+        async for index, chunk_summary in self._iter_chunk_summaries(docs):
+            chunk_summaries[index] = chunk_summary
+            yield {"event": "chunk", "index": index, "summary": chunk_summary}
+
+        chunk_summaries = [summary for summary in chunk_summaries if summary]
+        yield {"event": "summary", "summary": await self._combine_summaries(chunk_summaries, words_limit)}
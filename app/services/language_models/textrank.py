@@ -0,0 +1,133 @@
+import os
+import re
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed by the local provider
+    np = None
+
+# Candidate sentence ends: Latin-style punctuation (with closing quotes and
+# citation marks like "[12]") followed by a space, CJK full stops, line breaks
+SENTENCE_END = re.compile(
+    r"(?P<spaced>[.!?…]+[\"'’”»)\]]*(?:\[\w+\])*\s+)"
+    r"|(?P<full_width>[。！？]+[」』）\"'”]*\s*)"
+    r"|\n+"
+)
+# Han and kana are written without spaces, so each character is one term
+CJK = "぀-ヿ㐀-䶿一-鿿豈-﫿"
+WORD = re.compile(rf"[{CJK}]|[^\W_{CJK}]+(?:'[^\W_{CJK}]+)?")
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had
+has have having he her here hers him his how i if in into is it its itself just me more most my
+no nor not now of off on once only or other our ours out over own same she should so some such
+than that the their theirs them then there these they this those through to too under until up
+very was we were what when where which while who whom why will with would you your yours
+""".split())
+
+
+class TextRankSummarizer:
+    """Extractive summarizer ranking sentences with TextRank over TF-IDF vectors.
+
+    Sentences become L2-normalized TF-IDF rows; their cosine similarities
+    form the graph whose stationary distribution (power iteration with
+    ``damping``) scores each sentence. The best sentences that fit in
+    ``words_limit`` are returned in article order. Only the first
+    ``max_sentences`` (TEXTRANK_MAX_SENTENCES) sentences are ranked, since the
+    similarity graph grows with their square; that keeps long articles to a
+    few milliseconds and megabytes.
+    """
+    name = "textrank"
+
+    def __init__(
+            self,
+            damping: float = 0.85,
+            tolerance: float = 1e-6,
+            max_iterations: int = 100,
+            max_sentences: int | None = None,
+    ):
+        if np is None:
+            raise RuntimeError("numpy is not installed; the local summarization provider needs it")
+        self.damping = damping
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.max_sentences = max_sentences or int(os.getenv("TEXTRANK_MAX_SENTENCES", "300"))
+
+    @staticmethod
+    def split_sentences(text: str, limit: int | None = None) -> list[str]:
+        """Split at sentence punctuation and line breaks, in any script.
+
+        After ".", "!" or "?" a sentence only ends when the next one does not
+        start in lower case, so abbreviations like "e.g. this" stay whole.
+        Scanning stops once ``limit`` sentences are found.
+        """
+        sentences, start = [], 0
+        for match in SENTENCE_END.finditer(text):
+            if limit is not None and len(sentences) >= limit:
+                return sentences
+            if match.group("spaced") and match.end() < len(text) and text[match.end()].islower():
+                continue
+            sentence = text[start:match.end()].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end()
+        if text[start:].strip():
+            sentences.append(text[start:].strip())
+        return sentences[:limit]
+
+    @staticmethod
+    def tfidf_matrix(sentences: list[str]) -> "np.ndarray":
+        """Return the L2-normalized TF-IDF matrix, one row per sentence."""
+        vocabulary: dict[str, int] = {}
+        rows, columns = [], []
+        for row, sentence in enumerate(sentences):
+            for word in WORD.findall(sentence.casefold()):
+                if word not in STOP_WORDS:
+                    rows.append(row)
+                    columns.append(vocabulary.setdefault(word, len(vocabulary)))
+
+        weights = np.zeros((len(sentences), max(len(vocabulary), 1)), dtype=np.float32)
+        np.add.at(weights, (np.array(rows, dtype=int), np.array(columns, dtype=int)), 1.0)
+        document_frequency = np.count_nonzero(weights, axis=0)
+        weights *= (np.log((1 + len(sentences)) / (1 + document_frequency)) + 1).astype(np.float32)
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        return np.divide(weights, norms, out=weights, where=norms > 0)
+
+    def rank(self, sentences: list[str]) -> "np.ndarray":
+        """Return the TextRank score of every sentence."""
+        n = len(sentences)
+        vectors = self.tfidf_matrix(sentences)
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0.0)
+
+        # Row-stochastic transitions; sentences without edges jump uniformly
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        transitions = np.divide(similarity, out_weight, out=np.full_like(similarity, 1.0 / n), where=out_weight > 0)
+
+        scores = np.full(n, 1.0 / n)
+        for _ in range(self.max_iterations):
+            updated = (1 - self.damping) / n + self.damping * (transitions.T @ scores)
+            converged = np.abs(updated - scores).sum() < self.tolerance
+            scores = updated
+            if converged:
+                break
+        return scores
+
+    def summarize(self, text: str, words_limit: int) -> str:
+        sentences = self.split_sentences(text, self.max_sentences)
+        if not sentences:
+            return ""
+        if len(sentences) == 1:
+            return " ".join(sentences[0].split()[:words_limit])
+
+        scores = self.rank(sentences)
+        chosen, words = [], 0
+        for index in np.argsort(-scores, kind="stable"):
+            length = len(sentences[index].split())
+            if words + length <= words_limit:
+                chosen.append(index)
+                words += length
+        if not chosen:
+            # Even the best sentence is too long; keep its first words_limit words
+            return " ".join(sentences[int(np.argmax(scores))].split()[:words_limit])
+        return " ".join(sentences[index] for index in sorted(chosen))
@@ -0,0 +1,134 @@
+import os
+from abc import ABC, abstractmethod
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; BeautifulSoup is always available
+    etree = None
+
+CONTENT_ID = "mw-content-text"
+# Elements whose text never belongs to the article body
+SKIPPED_TAGS = frozenset({"script", "style", "nav", "footer", "header", "aside", "form"})
+
+
+class ContentExtractor(ABC):
+    """Turns a fetched Wikipedia page into the article text to summarize."""
+    name: str
+
+    @abstractmethod
+    def extract(self, html: bytes | str) -> str:
+        pass
+
+
+class BeautifulSoupExtractor(ContentExtractor):
+    """Builds the full DOM with html.parser; slow but tolerant of any page."""
+    name = "bs4"
+
+    def extract(self, html: bytes | str) -> str:
+        # Imported here: with lxml configured, bs4 is only needed for odd pages
+        from bs4 import BeautifulSoup as bs
+
+        soup = bs(html, 'html.parser')
+        for tag in soup(list(SKIPPED_TAGS)):
+            tag.decompose()
+
+        content = soup.find('div', {'id': CONTENT_ID})
+        if not content:
+            return soup.get_text()
+        paragraphs = content.find_all('p')
+        return '\n'.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+
+
+class _ParagraphCollector:
+    """lxml parser target collecting <p> text inside #mw-content-text.
+
+    Receives start/end/data events while libxml2 parses, so no tree is ever
+    built. ``close`` returns the paragraphs, or None if the page has no
+    content div.
+    """
+    def __init__(self):
+        self.found = False
+        self.content_depth = 0
+        self.paragraph_depth = 0
+        self.skip_depth = 0
+        self.current: list[str] = []
+        self.paragraphs: list[str] = []
+
+    def start(self, tag, attrib):
+        if self.content_depth:
+            self.content_depth += 1
+        elif tag == "div" and attrib.get("id") == CONTENT_ID and not self.found:
+            self.found = True
+            self.content_depth = 1
+            return
+
+        if not self.content_depth:
+            return
+        if tag in SKIPPED_TAGS:
+            self.skip_depth += 1
+        elif tag == "p":
+            self.paragraph_depth += 1
+
+    def end(self, tag):
+        if not self.content_depth:
+            return
+        self.content_depth -= 1
+        if tag in SKIPPED_TAGS:
+            self.skip_depth -= 1
+        elif tag == "p" and self.paragraph_depth:
+            self.paragraph_depth -= 1
+            if not self.paragraph_depth:
+                text = "".join(self.current).strip()
+                if text:
+                    self.paragraphs.append(text)
+                self.current = []
+
+    def data(self, data):
+        if self.paragraph_depth and not self.skip_depth:
+            self.current.append(data)
+
+    def close(self):
+        return self.paragraphs if self.found else None
+
+
+class LxmlExtractor(ContentExtractor):
+    """Single streaming pass over the page with lxml's parser target interface.
+
+    Pages without a #mw-content-text div fall back to ``fallback``.
+    """
+    name = "lxml"
+
+    def __init__(self, fallback: ContentExtractor | None = None):
+        if etree is None:
+            raise RuntimeError("lxml is not installed; use the bs4 content extractor")
+        self.fallback = fallback or BeautifulSoupExtractor()
+
+    def extract(self, html: bytes | str) -> str:
+        if isinstance(html, str):
+            html = html.encode("utf-8")
+        parser = etree.HTMLParser(target=_ParagraphCollector(), encoding="utf-8")
+        parser.feed(html)
+        paragraphs = parser.close()
+        if paragraphs is None:
+            return self.fallback.extract(html)
+        return "\n".join(paragraphs)
+
+
+EXTRACTORS = {
+    LxmlExtractor.name: LxmlExtractor,
+    BeautifulSoupExtractor.name: BeautifulSoupExtractor,
+}
+
+
+def get_extractor(name: str | None = None) -> ContentExtractor:
+    """Build the extractor named by ``name`` or CONTENT_EXTRACTOR (default lxml).
+
+    Falls back to BeautifulSoup when lxml is not installed.
+    """
+    name = (name or os.getenv("CONTENT_EXTRACTOR", LxmlExtractor.name)).lower()
+    if name == LxmlExtractor.name and etree is None:
+        name = BeautifulSoupExtractor.name
+    try:
+        return EXTRACTORS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown content extractor: {name}") from None
@@ -1,24 +1,153 @@
-from bs4 import BeautifulSoup as bs, BeautifulSoup
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, unquote, urlparse
 
+import httpx
+
+from app.services.scrap.extractors import ContentExtractor, SKIPPED_TAGS, get_extractor
+from app.shared.metrics.metrics import observe_stage, record_cache_lookup
+from app.shared.requests.page_cache import PageCache
 from app.shared.requests.requests import RequestService
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapMode:
+    HTML = "html"
+    API = "api"
+
+
+@dataclass
+class Article:
+    """Article text plus what we know about the page it came from."""
+    text: str
+    title: str | None = None
+    revision_id: int | None = None
+    source: str = ScrapMode.HTML
+
 
 class ScrapService:
 
-    def __init__(self, request_service: RequestService):
+    def __init__(
+            self,
+            request_service: RequestService,
+            extractor: ContentExtractor | None = None,
+            mode: str | None = None,
+            api_url_template: str | None = None,
+            page_cache: PageCache | None = None,
+    ):
         self.request_service = request_service
+        # Extracted text is cached by body digest, so unchanged pages are not re-parsed
+        self.page_cache = page_cache
+        self.extractor = extractor or get_extractor()
+        self.mode = (mode or os.getenv("SCRAP_MODE", ScrapMode.HTML)).lower()
+        # {scheme} and {host} come from the article URL; point it at a stub server in tests
+        self.api_url_template = api_url_template or os.getenv(
+            "WIKIPEDIA_API_URL", "{scheme}://{host}/w/api.php"
+        )
 
-    async def scrap_data(self, url: str) -> BeautifulSoup:
+    async def scrap_data(self, url: str) -> "BeautifulSoup":
         """Scrape text content from any web page.
 
         This is a generic scraper that removes common non-content elements
         and extracts the main text from the page.
         """
+        from bs4 import BeautifulSoup as bs
+
         html = await self.request_service.get_data(url, json_response=False)
         soup = bs(html, 'html.parser')
 
         # Remove unwanted elements (scripts, styles, navigation, etc.)
-        for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'form']):
+        for tag in soup(list(SKIPPED_TAGS)):
             tag.decompose()
 
-        return soup
\ No newline at end of file
+        return soup
+
+    async def extract_text(self, url: str) -> str:
+        """Return the article text of a Wikipedia page (see fetch_article)."""
+        article = await self.fetch_article(url)
+        return article.text
+
+    async def fetch_article(self, url: str) -> Article:
+        """Fetch a Wikipedia article in the configured SCRAP_MODE.
+
+        In "api" mode the plain-text extract is requested from the MediaWiki
+        action API; any failure there falls back to scraping the HTML page.
+        """
+        if self.mode == ScrapMode.API:
+            try:
+                return await self._fetch_api_article(url)
+            except (httpx.HTTPError, ValueError, KeyError, TypeError) as exc:
+                logger.warning("MediaWiki API fetch failed for %s, scraping HTML instead: %s", url, exc)
+        return await self._fetch_html_article(url)
+
+    async def _fetch_html_article(self, url: str) -> Article:
+        with observe_stage("fetch"):
+            html = await self.request_service.get_data(url, json_response=False)
+        if self.page_cache is None:
+            return Article(text=await self._extract(html))
+
+        digest = PageCache.digest(html)
+        kind = f"text:{self.extractor.name}"
+        text = await asyncio.to_thread(self.page_cache.get_derived, digest, kind)
+        record_cache_lookup("extracted_text", hit=text is not None)
+        if text is None:
+            text = await self._extract(html)
+            await asyncio.to_thread(self.page_cache.put_derived, digest, kind, text)
+        return Article(text=text)
+
+    async def _extract(self, html: bytes) -> str:
+        """Parse the article text in a worker thread, keeping the event loop free."""
+        with observe_stage("extract"):
+            return await asyncio.to_thread(self.extractor.extract, html)
+
+    async def _fetch_api_article(self, url: str) -> Article:
+        parsed = urlparse(url)
+        api_url = self.api_url_template.format(scheme=parsed.scheme, host=parsed.netloc)
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "prop": "extracts|revisions",
+            "explaintext": "1",
+            "exsectionformat": "plain",
+            "rvprop": "ids",
+            "redirects": "1",
+            "titles": self._title_from_url(url),
+        }
+        with observe_stage("fetch"):
+            data = await self.request_service.get_data(api_url, params=params)
+
+        pages = data["query"]["pages"]
+        if not pages:
+            raise ValueError(f"No page returned for {params['titles']!r}")
+        page = pages[0]
+        text = (page.get("extract") or "").strip()
+        if page.get("missing") or page.get("invalid") or not text:
+            raise ValueError(f"No extract for page {params['titles']!r}")
+
+        revisions = page.get("revisions") or [{}]
+        return Article(
+            text=text,
+            title=page.get("title"),
+            revision_id=revisions[0].get("revid"),
+            source=ScrapMode.API,
+        )
+
+    @staticmethod
+    def _title_from_url(url: str) -> str:
+        """Read the page title from /wiki/<title> or /w/index.php?title=<title> URLs."""
+        parsed = urlparse(url)
+        if parsed.path.startswith("/wiki/"):
+            title = parsed.path[len("/wiki/"):]
+        else:
+            title = parse_qs(parsed.query).get("title", [""])[0]
+        if not title:
+            raise ValueError(f"Cannot read a page title from {url}")
+        return unquote(title).replace("_", " ")
@@ -1,9 +1,43 @@
+import asyncio
 import hashlib
+import logging
+import os
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import AsyncContextManager, AsyncIterator, Callable
 
 from app.services.scrap.scrap_service import ScrapService
 from app.services.summary.summary_repository import SummaryRepositoryInterface
 from app.services.language_models.language_models import LanguageModelsService
+from app.shared.concurrency.admission import AdmissionController, OverloadedError
+from app.shared.concurrency.single_flight import SingleFlight
+from app.shared.metrics.metrics import DEGRADED_SUMMARIES, observe_stage
 
+logger = logging.getLogger(__name__)
+
+
+class NoArticleTextError(Exception):
+    """Raised when a page has no article text, or its summary came out empty; nothing is stored."""
+
+
+@dataclass
+class SummaryBatchResult:
+    """Outcome of one item of a batch request."""
+    url: str
+    summary: str | None = None
+    created: bool = False
+    error: str | None = None
+    degraded: bool = False
+
+
+@dataclass
+class DegradedSummary:
+    """Cheap summary served instead of the full pipeline under overload; never stored."""
+    id: str
+    url: str
+    summary: str
 
 
 class SummaryService:
@@ -13,10 +47,24 @@ class SummaryService:
             summary_repository:  SummaryRepositoryInterface,
             scrap_service: ScrapService,
             language_models_service: LanguageModelsService,
+            single_flight: SingleFlight | None = None,
+            admission: AdmissionController | None = None,
+            repository_scope: Callable[[], AsyncContextManager[SummaryRepositoryInterface]] | None = None,
     ):
         self.summary_repository = summary_repository
+        # Opens a repository on its own DB session for work shared by coalesced callers
+        self.repository_scope = repository_scope
         self.scrap_service = scrap_service
         self.language_models_service = language_models_service
+        # Shared across requests by the container so concurrent callers coalesce
+        self.single_flight = single_flight or SingleFlight()
+        # Shared by the container too; the default never refuses a pipeline
+        self.admission = admission or AdmissionController()
+        # textrank (local extractive) or lead (first paragraph) when degrading
+        self.degraded_strategy = os.getenv("DEGRADED_SUMMARY_STRATEGY", "textrank").lower()
+        self.lease_seconds = float(os.getenv("SUMMARY_LEASE_SECONDS", "120"))
+        self.lease_poll_interval = float(os.getenv("SUMMARY_LEASE_POLL_INTERVAL", "0.5"))
+        self.batch_concurrency = int(os.getenv("SUMMARY_BATCH_CONCURRENCY", "4"))
 
     def _generate_summary_id(self, url: str) -> str:
         """Generate a unique ID from URL"""
@@ -25,12 +73,26 @@ class SummaryService:
     async def get_summary_by_url(self, url: str) -> dict:
         """Get summary for the given URL"""
         summary_id = self._generate_summary_id(url)
-        summary_data = self.summary_repository.get_summary_by_id(summary_id)
+        summary_data = await self.summary_repository.get_summary_by_id(summary_id)
 
         return summary_data
 
-    async def create_summary(self, url: str, words_limit: int) -> dict:
-        """Create summary for the given URL"""
+    async def get_summaries_by_urls(self, urls: list[str]) -> dict[str, dict | None]:
+        """Get the stored summary of every URL, or None, with one query.
+
+        The result keeps the order of ``urls``, without duplicates.
+        """
+        summary_ids = {url: self._generate_summary_id(url) for url in urls}
+        rows = await self.summary_repository.get_summaries_by_ids(list(dict.fromkeys(summary_ids.values())))
+        found = {row.id: row for row in rows if row.summary}
+        return {url: found.get(summary_id) for url, summary_id in summary_ids.items()}
+
+    async def create_summary(self, url: str, words_limit: int, degrade: bool = True) -> dict:
+        """Create summary for the given URL
+
+        With ``degrade=False`` an overloaded backend raises OverloadedError
+        even in degrade mode, for callers that need a stored summary.
+        """
         summary_id = self._generate_summary_id(url)
 
         # Check if summary already exists
@@ -38,14 +100,269 @@ class SummaryService:
         if summary_data and summary_data.summary:
             return summary_data
 
-        # Scrape content and generate summary
-        soup_content = await self.scrap_service.scrap_data(url)
-        content = soup_content.find('div', {'id': 'mw-content-text'})
-        text_content = soup_content.get_text()
-        if content:
-            paragraphs = content.find_all('p')
-            text_content = '\n'.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+        # Concurrent callers for the same URL share one computation
+        return await self.single_flight.do(
+            summary_id,
+            partial(self._compute_summary, summary_id, url, words_limit, degrade),
+        )
+
+    async def _compute_summary(
+            self,
+            summary_id: str,
+            url: str,
+            words_limit: int,
+            degrade: bool = True,
+            on_event: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """Run the scrape + summarize pipeline while holding the cross-worker lease.
+
+        Coalesced callers share this work, so it must not use the session of
+        the request that started it: that request may finish, or be
+        cancelled, while the others still wait. With ``repository_scope`` it
+        runs on a session of its own. ``on_event`` receives the chunk events
+        of a streamed summary.
+        """
+        if self.repository_scope is None:
+            return await self._compute_summary_with(
+                self.summary_repository, summary_id, url, words_limit, degrade, on_event
+            )
+        async with self.repository_scope() as repository:
+            return await self._compute_summary_with(repository, summary_id, url, words_limit, degrade, on_event)
+
+    async def _compute_summary_with(
+            self,
+            repository: SummaryRepositoryInterface,
+            summary_id: str,
+            url: str,
+            words_limit: int,
+            degrade: bool,
+            on_event: Callable[[dict], None] | None,
+    ) -> dict:
+        holder = uuid.uuid4().hex
+        while not await repository.acquire_lease(summary_id, holder, self.lease_seconds):
+            # Another worker is computing it; wait for its row or for the lease to lapse
+            await asyncio.sleep(self.lease_poll_interval)
+            summary_data = await repository.get_summary_by_id(summary_id)
+            if summary_data and summary_data.summary:
+                return summary_data
+
+        try:
+            summary_data = await repository.get_summary_by_id(summary_id)
+            if summary_data and summary_data.summary:
+                return summary_data
+
+            async with self._renewing_lease(repository, summary_id, holder):
+                summary = await self._summarize_url(url, words_limit, degrade, on_event)
+            if isinstance(summary, DegradedSummary):
+                return summary
+
+            return await repository.create_summary(summary_id, url, summary)
+        finally:
+            await repository.release_lease(summary_id, holder)
+
+    @asynccontextmanager
+    async def _renewing_lease(self, repository: SummaryRepositoryInterface, summary_id: str, holder: str):
+        """Renew the lease every third of its ttl while the pipeline runs.
+
+        A pipeline queued behind a busy backend can outlast SUMMARY_LEASE_SECONDS;
+        without renewal another worker would take the lease over and compute
+        the same summary. Renewal stops before the block exits, so it never
+        shares the repository's session with the caller's next query.
+        """
+        stopped = asyncio.Event()
+
+        async def renew():
+            while True:
+                try:
+                    await asyncio.wait_for(stopped.wait(), self.lease_seconds / 3)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+                try:
+                    if not await repository.renew_lease(summary_id, holder, self.lease_seconds):
+                        logger.warning("Summary lease of %s was taken over by another worker", summary_id)
+                        return
+                except Exception:
+                    logger.warning("Could not renew the summary lease of %s", summary_id, exc_info=True)
+
+        renewal = asyncio.create_task(renew())
+        try:
+            yield
+        finally:
+            stopped.set()
+            await renewal
+
+    async def _extract_text(self, url: str) -> str:
+        """Scrape the page and return its article text"""
+        text_content = await self.scrap_service.extract_text(url)
+        if not text_content.strip():
+            raise NoArticleTextError(f"No article text found at {url}")
+        return text_content
+
+    async def _summarize_url(
+            self,
+            url: str,
+            words_limit: int,
+            degrade: bool = True,
+            on_event: Callable[[dict], None] | None = None,
+    ) -> str | DegradedSummary:
+        """Scrape the page and generate its summary, without touching the database.
+
+        Raises OverloadedError when admission is refused, or returns a
+        DegradedSummary instead in degrade mode (unless ``degrade`` is False).
+        Raises NoArticleTextError when there is nothing to summarize. With
+        ``on_event`` the summary is streamed and every chunk event passed on.
+        """
+        text_content = None
+        try:
+            # Refuse before scraping, so rejected requests cost no fetch or parse
+            self.admission.check()
+            text_content = await self._extract_text(url)
+            async with self.admission.admit():
+                with observe_stage("summarize"):
+                    if on_event is None:
+                        summary = await self.language_models_service.generate_summary(text_content, words_limit)
+                    else:
+                        summary = await self._stream_chunks(text_content, words_limit, on_event)
+            if not summary.strip():
+                raise NoArticleTextError(f"Summarizing {url} gave an empty summary")
+            return summary
+        except OverloadedError:
+            if not (degrade and self.admission.degrade):
+                raise
+            if text_content is None:
+                text_content = await self._extract_text(url)
+            return await self._degraded_summary(url, text_content, words_limit)
+
+    async def _stream_chunks(self, text_content: str, words_limit: int, on_event: Callable[[dict], None]) -> str:
+        """Stream the summary, passing chunk events on, and return the final summary."""
+        summary = ""
+        async for event in self.language_models_service.stream_summary(text_content, words_limit):
+            if event["event"] == "summary":
+                summary = event["summary"]
+            else:
+                on_event(event)
+        return summary
+
+    async def _degraded_summary(self, url: str, text_content: str, words_limit: int) -> DegradedSummary:
+        DEGRADED_SUMMARIES.inc()
+        with observe_stage("degraded_summary"):
+            summary = await asyncio.to_thread(self._degraded_text, text_content, words_limit)
+        return DegradedSummary(id=self._generate_summary_id(url), url=url, summary=summary)
+
+    def _degraded_text(self, text_content: str, words_limit: int) -> str:
+        """Summarize on the CPU: TextRank, or the lead paragraph if numpy is missing."""
+        if self.degraded_strategy == "textrank":
+            # Imported on first use, so numpy only loads once a summary is degraded
+            from app.services.language_models.textrank import TextRankSummarizer
+
+            try:
+                return TextRankSummarizer().summarize(text_content, words_limit)
+            except RuntimeError:
+                pass
+        lead = next((paragraph for paragraph in text_content.split("\n") if paragraph.strip()), "")
+        return " ".join(lead.split()[:words_limit])
+
+    async def stream_summary(self, url: str, words_limit: int) -> AsyncIterator[dict]:
+        """Yield chunk summaries as they complete, then the stored final summary.
+
+        Events are the dicts produced by LanguageModelsService.stream_summary.
+        The stream runs through the same single flight and lease as
+        create_summary: a caller that joins a computation already in flight
+        only gets its final summary. That summary is persisted before its
+        event is yielded, and the computation outlives a client that
+        disconnects, so the summary is still stored.
+        """
+        summary_id = self._generate_summary_id(url)
+        summary_data = await self.get_summary_by_url(url)
+        if summary_data and summary_data.summary:
+            yield {"event": "summary", "summary": summary_data.summary}
+            return
+
+        events: asyncio.Queue[dict] = asyncio.Queue()
+        computation = asyncio.ensure_future(self.single_flight.do(
+            summary_id,
+            partial(self._compute_summary, summary_id, url, words_limit, True, events.put_nowait),
+        ))
+        next_event = None
+        try:
+            while True:
+                next_event = asyncio.ensure_future(events.get())
+                await asyncio.wait({next_event, computation}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_event.done():
+                    break
+                yield next_event.result()
+            while not events.empty():
+                yield events.get_nowait()
+            summary_data = await computation
+        finally:
+            # Stops waiting only; the shared computation is shielded and goes on
+            for waiter in (next_event, computation):
+                if waiter is not None:
+                    waiter.cancel()
+
+        if isinstance(summary_data, DegradedSummary):
+            yield {"event": "summary", "summary": summary_data.summary, "degraded": True}
+        else:
+            yield {"event": "summary", "summary": summary_data.summary}
+
+    async def create_summaries(self, items: list[tuple[str, int]]) -> list[SummaryBatchResult]:
+        """Create summaries for many (url, words_limit) items at once.
+
+        Existing summaries are resolved with one query, and missing ones are
+        computed with at most ``batch_concurrency`` pipelines running at a
+        time. Each goes through the same single flight and lease as
+        create_summary, so it is shared with concurrent requests for the same
+        URL, here or on other workers. Failures are reported per item instead
+        of failing the whole batch.
+        """
+        pending: dict[str, tuple[str, int]] = {}
+        for url, words_limit in items:
+            pending.setdefault(self._generate_summary_id(url), (url, words_limit))
+
+        existing = {
+            row.id: row
+            for row in await self.summary_repository.get_summaries_by_ids(list(pending))
+            if row.summary
+        }
+        misses = [summary_id for summary_id in pending if summary_id not in existing]
+
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def summarize(summary_id: str) -> dict:
+            url, words_limit = pending[summary_id]
+            async with semaphore:
+                return await self.single_flight.do(
+                    summary_id, partial(self._compute_summary, summary_id, url, words_limit)
+                )
 
-        summary = await self.language_models_service.generate_summary(text_content, words_limit)
+        outcomes = await asyncio.gather(*[summarize(summary_id) for summary_id in misses], return_exceptions=True)
+        errors = {}
+        degraded = {}
+        created = {}
+        for summary_id, outcome in zip(misses, outcomes):
+            if isinstance(outcome, OverloadedError):
+                errors[summary_id] = "Summarization backend is overloaded; retry later."
+            elif isinstance(outcome, NoArticleTextError):
+                errors[summary_id] = "The page has no article text to summarize."
+            elif isinstance(outcome, Exception):
+                # The exception text can leak internals (hosts, SQL); it stays in the logs
+                logger.warning("Summary of %s failed", pending[summary_id][0], exc_info=outcome)
+                errors[summary_id] = "Summary could not be created."
+            elif isinstance(outcome, DegradedSummary):
+                degraded[summary_id] = outcome
+            else:
+                created[summary_id] = outcome
 
-        return self.summary_repository.create_summary(summary_id, url, summary)
+        results = []
+        for url, _ in items:
+            summary_id = self._generate_summary_id(url)
+            if summary_id in existing:
+                results.append(SummaryBatchResult(url=url, summary=existing[summary_id].summary))
+            elif summary_id in created:
+                results.append(SummaryBatchResult(url=url, summary=created[summary_id].summary, created=True))
+            elif summary_id in degraded:
+                results.append(SummaryBatchResult(url=url, summary=degraded[summary_id].summary, degraded=True))
+            else:
+                results.append(SummaryBatchResult(url=url, error=errors.get(summary_id, "Summary was not stored.")))
+        return results
@@ -0,0 +1,166 @@
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from app.services.summary.summary_repository import SummaryRepositoryInterface
+from app.shared.metrics.metrics import record_cache_lookup
+
+
+@dataclass(frozen=True)
+class CachedSummary:
+    """Detached, immutable copy of a stored summary."""
+    id: str
+    url: str
+    summary: str
+    created_at: datetime | None = None
+
+    @classmethod
+    def from_record(cls, record) -> "CachedSummary":
+        return cls(
+            id=record.id,
+            url=record.url,
+            summary=record.summary,
+            created_at=record.created_at,
+        )
+
+
+class SummaryCache:
+    """Bounded in-memory LRU cache of summaries with a per-entry TTL.
+
+    One instance is shared by every request of a worker; it is only touched
+    from the event loop thread, so it needs no locking.
+    """
+    def __init__(
+            self,
+            max_entries: int | None = None,
+            ttl_seconds: float | None = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "1024")
+        )
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("SUMMARY_CACHE_TTL_SECONDS", "300")
+        )
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, CachedSummary]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, summary_id: str) -> CachedSummary | None:
+        entry = self._entries.get(summary_id)
+        if entry is None:
+            self.misses += 1
+            record_cache_lookup("summary", hit=False)
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[summary_id]
+            self.evictions += 1
+            self.misses += 1
+            record_cache_lookup("summary", hit=False)
+            return None
+
+        self._entries.move_to_end(summary_id)
+        self.hits += 1
+        record_cache_lookup("summary", hit=True)
+        return value
+
+    def put(self, summary_id: str, value: CachedSummary) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[summary_id] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(summary_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, summary_id: str) -> None:
+        self._entries.pop(summary_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return the hit/miss/eviction counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+
+class CachedSummaryRepository(SummaryRepositoryInterface):
+    """Read-through cache in front of another summary repository."""
+    def __init__(self, repository: SummaryRepositoryInterface, cache: SummaryCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_summary_by_id(self, summary_id: str) -> CachedSummary | None:
+        """Serve a summary from the cache, loading it on a miss."""
+        cached = self.cache.get(summary_id)
+        if cached is not None:
+            return cached
+
+        result = await self.repository.get_summary_by_id(summary_id)
+        if result is None:
+            return None
+
+        cached = CachedSummary.from_record(result)
+        self.cache.put(summary_id, cached)
+        return cached
+
+    async def create_summary(self, summary_id: str, url: str, summary: str) -> CachedSummary:
+        """Store a summary and replace any cached copy with the stored row."""
+        self.cache.invalidate(summary_id)
+        result = await self.repository.create_summary(summary_id, url, summary)
+        cached = CachedSummary.from_record(result)
+        self.cache.put(summary_id, cached)
+        return cached
+
+    async def get_summaries_by_ids(self, summary_ids: list[str]) -> list[CachedSummary]:
+        """Serve what the cache holds and load the rest in one query."""
+        found = []
+        missing = []
+        for summary_id in summary_ids:
+            cached = self.cache.get(summary_id)
+            if cached is not None:
+                found.append(cached)
+            else:
+                missing.append(summary_id)
+
+        for result in await self.repository.get_summaries_by_ids(missing):
+            cached = CachedSummary.from_record(result)
+            self.cache.put(cached.id, cached)
+            found.append(cached)
+        return found
+
+    async def create_summaries(self, rows: list[tuple[str, str, str]]) -> list[CachedSummary]:
+        """Bulk store summaries and refresh their cache entries."""
+        for summary_id, _, _ in rows:
+            self.cache.invalidate(summary_id)
+        stored = []
+        for result in await self.repository.create_summaries(rows):
+            cached = CachedSummary.from_record(result)
+            self.cache.put(cached.id, cached)
+            stored.append(cached)
+        return stored
+
+    async def acquire_lease(self, summary_id: str, holder: str, ttl_seconds: float) -> bool:
+        return await self.repository.acquire_lease(summary_id, holder, ttl_seconds)
+
+    async def renew_lease(self, summary_id: str, holder: str, ttl_seconds: float) -> bool:
+        return await self.repository.renew_lease(summary_id, holder, ttl_seconds)
+
+    async def release_lease(self, summary_id: str, holder: str) -> None:
+        await self.repository.release_lease(summary_id, holder)
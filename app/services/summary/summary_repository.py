@@ -1,33 +1,154 @@
+import logging
 from abc import ABC, abstractmethod
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.summary import Summary
+from app.models.summary_lease import SummaryLease
+from app.shared.metrics.metrics import timed_stage
+
+logger = logging.getLogger(__name__)
 
 
 class SummaryRepositoryInterface(ABC):
     @abstractmethod
-    def get_summary_by_id(self, summary_id: str) -> dict | None:
+    async def get_summary_by_id(self, summary_id: str) -> dict | None:
+        pass
+
+    @abstractmethod
+    async def create_summary(self, summary_id: str, url: str, summary: str) -> dict:
+        pass
+
+    @abstractmethod
+    async def get_summaries_by_ids(self, summary_ids: list[str]) -> list[dict]:
+        pass
+
+    @abstractmethod
+    async def create_summaries(self, rows: list[tuple[str, str, str]]) -> list[dict]:
+        pass
+
+    @abstractmethod
+    async def acquire_lease(self, summary_id: str, holder: str, ttl_seconds: float) -> bool:
         pass
 
     @abstractmethod
-    def create_summary(self, summary_id: str, url: str, summary: str) -> dict:
+    async def renew_lease(self, summary_id: str, holder: str, ttl_seconds: float) -> bool:
+        pass
+
+    @abstractmethod
+    async def release_lease(self, summary_id: str, holder: str) -> None:
         pass
 
 class SummaryRepository(SummaryRepositoryInterface):
     """Repository to manage Summary data in the database."""
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_summary_by_id(self, summary_id: str) -> dict | None:
+    @timed_stage("db_read")
+    async def get_summary_by_id(self, summary_id: str) -> dict | None:
         """Retrieve a summary by its ID."""
-        result = self.db.query(Summary).filter(Summary.id == summary_id).first()
-        return result
+        result = await self.db.execute(select(Summary).where(Summary.id == summary_id))
+        return result.scalars().first()
+
 
+    @timed_stage("db_write")
+    async def create_summary(self, summary_id: str, url: str, summary: str) -> dict:
+        """Create a new summary record.
 
-    def create_summary(self, summary_id: str, url: str, summary: str) -> dict:
-        """Create a new summary record."""
+        If another worker inserted the same summary first, the stored row is
+        returned instead of failing on the unique constraint.
+        """
         db_summary = Summary(id=summary_id, url=url, summary=summary)
         self.db.add(db_summary)
-        self.db.commit()
-        self.db.refresh(db_summary)
-        return db_summary
\ No newline at end of file
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            existing = await self.get_summary_by_id(summary_id)
+            if existing is None:
+                raise
+            return existing
+        await self.db.refresh(db_summary)
+        return db_summary
+
+    @timed_stage("db_read")
+    async def get_summaries_by_ids(self, summary_ids: list[str]) -> list[dict]:
+        """Retrieve every stored summary among the given IDs in one query."""
+        if not summary_ids:
+            return []
+        result = await self.db.execute(select(Summary).where(Summary.id.in_(summary_ids)))
+        return list(result.scalars().all())
+
+    @timed_stage("db_write")
+    async def create_summaries(self, rows: list[tuple[str, str, str]]) -> list[dict]:
+        """Bulk insert (id, url, summary) rows in a single commit.
+
+        If the bulk commit hits a unique constraint (a row inserted
+        concurrently by another worker), the rows are retried one at a time:
+        rows stored meanwhile keep the stored version, and a row failing its
+        own insert is logged and left out of the result.
+        """
+        if not rows:
+            return []
+        summary_ids = [summary_id for summary_id, _, _ in rows]
+        self.db.add_all([Summary(id=summary_id, url=url, summary=summary) for summary_id, url, summary in rows])
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            stored_ids = {row.id for row in await self.get_summaries_by_ids(summary_ids)}
+            for summary_id, url, summary in rows:
+                if summary_id in stored_ids:
+                    continue
+                try:
+                    await self.create_summary(summary_id, url, summary)
+                except IntegrityError:
+                    logger.warning("Summary %s could not be stored", summary_id, exc_info=True)
+        return await self.get_summaries_by_ids(summary_ids)
+
+    async def acquire_lease(self, summary_id: str, holder: str, ttl_seconds: float) -> bool:
+        """Claim the right to compute a summary across all workers.
+
+        Inserts a lease row, or takes over an existing one that has expired.
+        Returns False while another holder owns a live lease.
+        """
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        self.db.add(SummaryLease(id=summary_id, holder=holder, expires_at=expires_at))
+        try:
+            await self.db.commit()
+            return True
+        except IntegrityError:
+            await self.db.rollback()
+
+        result = await self.db.execute(
+            update(SummaryLease)
+            .where(SummaryLease.id == summary_id, SummaryLease.expires_at < now)
+            .values(holder=holder, expires_at=expires_at)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def renew_lease(self, summary_id: str, holder: str, ttl_seconds: float) -> bool:
+        """Push back the expiry of a lease still owned by the given holder.
+
+        Returns False if the lease lapsed and another holder took it over.
+        """
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        result = await self.db.execute(
+            update(SummaryLease)
+            .where(SummaryLease.id == summary_id, SummaryLease.holder == holder)
+            .values(expires_at=expires_at)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def release_lease(self, summary_id: str, holder: str) -> None:
+        """Drop a lease, if it is still owned by the given holder."""
+        await self.db.execute(
+            delete(SummaryLease).where(SummaryLease.id == summary_id, SummaryLease.holder == holder)
+        )
+        await self.db.commit()
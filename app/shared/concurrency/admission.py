@@ -0,0 +1,88 @@
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from app.shared.concurrency.inference_executor import InferenceExecutor
+
+
+class AdmissionMode:
+    REJECT = "reject"
+    DEGRADE = "degrade"
+
+
+class OverloadedError(Exception):
+    """Raised when a pipeline is refused admission; retry after ``retry_after`` seconds."""
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Refuses new summarization pipelines while the backend is overloaded.
+
+    A pipeline is admitted while fewer than ``max_in_flight`` pipelines run
+    and the oldest call waiting on the inference executor has waited less
+    than ``max_queue_wait_seconds``. A limit of 0 disables that check. Both
+    signals drain as work completes, so admission recovers on its own.
+    ``mode`` tells callers whether to fail (reject) or serve a cheaper
+    summary (degrade) when refused.
+    """
+    def __init__(
+            self,
+            max_in_flight: int = 0,
+            max_queue_wait_seconds: float = 0,
+            retry_after_seconds: int = 5,
+            mode: str = AdmissionMode.REJECT,
+            executor: InferenceExecutor | None = None,
+    ):
+        if mode not in (AdmissionMode.REJECT, AdmissionMode.DEGRADE):
+            raise ValueError(f"Unknown admission mode: {mode}")
+        self.max_in_flight = max_in_flight
+        self.max_queue_wait_seconds = max_queue_wait_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.mode = mode
+        self.executor = executor
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls, executor: InferenceExecutor | None = None) -> "AdmissionController":
+        return cls(
+            max_in_flight=int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "64")),
+            max_queue_wait_seconds=float(os.getenv("ADMISSION_MAX_QUEUE_WAIT_SECONDS", "10")),
+            retry_after_seconds=int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "5")),
+            mode=os.getenv("ADMISSION_MODE", AdmissionMode.REJECT).lower(),
+            executor=executor,
+        )
+
+    @property
+    def degrade(self) -> bool:
+        return self.mode == AdmissionMode.DEGRADE
+
+    def check(self) -> None:
+        """Raise OverloadedError if a new pipeline would not be admitted."""
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            self._reject(f"{self.in_flight} summaries already in progress")
+        if self.max_queue_wait_seconds and self.executor is not None:
+            waited = self.executor.oldest_wait_seconds
+            if waited >= self.max_queue_wait_seconds:
+                self._reject(f"inference calls are queued for {waited:.1f}s")
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold an in-flight slot for the duration of the block, or raise OverloadedError."""
+        self.check()
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {"in_flight": self.in_flight, "admitted": self.admitted, "rejected": self.rejected}
+
+    def _reject(self, reason: str) -> None:
+        self.rejected += 1
+        raise OverloadedError(f"Summarization backend is overloaded: {reason}", self.retry_after_seconds)
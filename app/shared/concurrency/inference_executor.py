@@ -0,0 +1,154 @@
+import asyncio
+import itertools
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from app.shared.concurrency.rate_limiter import TokenBucket
+from app.shared.metrics.metrics import INFERENCE_QUEUE_WAIT_SECONDS
+
+
+def provider_setting(provider: str, name: str, default: str) -> str:
+    """Read <PROVIDER>_INFERENCE_<NAME>, falling back to INFERENCE_<NAME> and then ``default``."""
+    return os.getenv(f"{provider.upper()}_INFERENCE_{name}", os.getenv(f"INFERENCE_{name}", default))
+
+
+class InferenceExecutor:
+    """Dedicated thread pool for blocking inference calls to one provider.
+
+    Calls first wait for a concurrency slot (never more than ``max_workers``
+    are handed to the pool) and, when ``rate_per_second`` is set, for a
+    token-bucket token, so one worker process never exceeds the provider's
+    rate limit however many requests fan out to it. Waiting callers are
+    counted and timed; see ``stats``.
+    """
+    def __init__(
+            self,
+            name: str,
+            max_workers: int,
+            rate_per_second: float = 0,
+            burst: float | None = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.clock = clock
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"inference-{name}")
+        self._slots = asyncio.Semaphore(max_workers)
+        self._bucket = TokenBucket(rate_per_second, burst or max_workers, clock) if rate_per_second > 0 else None
+        self._waiting: dict[int, float] = {}
+        self._tickets = itertools.count()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @classmethod
+    def from_env(cls, provider: str) -> "InferenceExecutor":
+        """Build the executor of a provider from the INFERENCE_* environment variables.
+
+        Each setting can be overridden per provider, e.g.
+        HUGGINGFACE_INFERENCE_RATE_PER_SECOND takes precedence over
+        INFERENCE_RATE_PER_SECOND.
+        """
+        burst = provider_setting(provider, "BURST", "")
+        return cls(
+            name=provider,
+            max_workers=int(provider_setting(provider, "MAX_WORKERS", "8")),
+            rate_per_second=float(provider_setting(provider, "RATE_PER_SECOND", "0")),
+            burst=float(burst) if burst else None,
+        )
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``fn(*args, **kwargs)`` in the pool once a slot and a token are free."""
+        await self.acquire()
+        return await self.start(fn, *args, **kwargs)
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot and a rate-limit token.
+
+        The caller then owns the slot and must hand it to ``start``; a
+        cancelled wait holds nothing.
+        """
+        queued_at = self.clock()
+        ticket = next(self._tickets)
+        self._waiting[ticket] = queued_at
+        try:
+            await self._slots.acquire()
+            try:
+                if self._bucket is not None:
+                    await self._bucket.acquire()
+            except BaseException:
+                self._slots.release()
+                raise
+        finally:
+            del self._waiting[ticket]
+
+        wait = self.clock() - queued_at
+        self.total_wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        INFERENCE_QUEUE_WAIT_SECONDS.labels(provider=self.name).observe(wait)
+
+    def start(self, fn: Callable[..., Any], *args, **kwargs) -> "asyncio.Future":
+        """Submit ``fn`` to the pool on a slot taken with ``acquire``; return its future."""
+        self.in_flight += 1
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._pool.submit(partial(fn, *args, **kwargs))
+        except BaseException:
+            self.in_flight -= 1
+            self._slots.release()
+            raise
+
+        def done(finished):
+            try:
+                loop.call_soon_threadsafe(self._finished, finished)
+            except RuntimeError:  # the event loop is already closed
+                pass
+
+        # The slot is held until the thread is done, not until the caller stops
+        # waiting (a timeout or a lost hedge), so a slow backend stays visible
+        # in queue_depth and oldest_wait_seconds
+        future.add_done_callback(done)
+        return asyncio.wrap_future(future)
+
+    def _finished(self, future: Future) -> None:
+        self.in_flight -= 1
+        self._slots.release()
+        if future.cancelled() or future.exception() is not None:
+            self.failed += 1
+        else:
+            self.completed += 1
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiting)
+
+    @property
+    def oldest_wait_seconds(self) -> float:
+        """How long the longest waiting caller has been queued; 0 when nobody waits."""
+        if not self._waiting:
+            return 0.0
+        return self.clock() - min(self._waiting.values())
+
+    def stats(self) -> dict:
+        """Return the queue depth, in-flight count and wait-time counters."""
+        started = self.completed + self.failed + self.in_flight
+        return {
+            "provider": self.name,
+            "max_workers": self.max_workers,
+            "queue_depth": self.queue_depth,
+            "oldest_wait_seconds": self.oldest_wait_seconds,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "total_wait_seconds": self.total_wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+            "avg_wait_seconds": self.total_wait_seconds / started if started else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Coalesce concurrent calls sharing a key into a single computation.
+
+    The first caller for a key starts ``fn`` as a task; callers arriving while
+    it is in flight await that same task. The task is shielded, so a caller
+    that disconnects does not cancel the work the others are waiting on.
+    """
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+    @property
+    def in_flight_count(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away
+            task.exception()
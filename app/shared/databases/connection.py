@@ -1,43 +1,68 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import AsyncGenerator
+
+from app.shared.databases.instrumented_pool import InstrumentedAsyncAdaptedQueuePool
+
+# Sync drivers used by Alembic and the .env examples, mapped to their async counterparts
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Return the async-driver form of a database URL.
+
+    postgresql:// becomes postgresql+asyncpg:// and sqlite:// becomes
+    sqlite+aiosqlite://, so the same DATABASE_URL serves the API and Alembic.
+    URLs that already name an async driver are returned unchanged.
+    """
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
 
 # Database configuration from environment variables
-DATABASE_URL = os.getenv(
+DATABASE_URL = to_async_url(os.getenv(
     "DATABASE_URL",
-)
+))
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,  # Enable connection health checks
-    pool_size=5,  # Maximum number of connections to keep in the pool
-    max_overflow=10,  # Maximum number of connections that can be created beyond pool_size
-    echo=False,  # Set to True to log all SQL statements
-)
+engine_options = {
+    "echo": False,  # Set to True to log all SQL statements
+}
+if make_url(DATABASE_URL).get_backend_name() == "postgresql":
+    engine_options.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool,  # Exposes checkout wait on /metrics
+        pool_pre_ping=True,  # Enable connection health checks
+        pool_size=5,  # Maximum number of connections to keep in the pool
+        max_overflow=10,  # Maximum number of connections that can be created beyond pool_size
+    )
+
+# Create SQLAlchemy async engine
+engine = create_async_engine(DATABASE_URL, **engine_options)
 
 # Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(
-    autocommit=False,
+SessionLocal = async_sessionmaker(
+    bind=engine,
     autoflush=False,
-    bind=engine
+    expire_on_commit=False,  # Keep returned rows usable after commit
 )
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency function to get database session.
+    Dependency function to get an async database session.
     Yields a database session and ensures it's closed after use.
 
     Usage in FastAPI:
         @app.get("/items")
-        def read_items(db: Session = Depends(get_db)):
+        async def read_items(db: AsyncSession = Depends(get_db)):
             # Use db here
             pass
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
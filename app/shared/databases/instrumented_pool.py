@@ -0,0 +1,16 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.shared.metrics.metrics import DB_POOL_CHECKOUT_SECONDS
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool recording how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
@@ -0,0 +1,37 @@
+import hashlib
+import os
+from datetime import datetime
+
+
+def strong_etag(*parts: str | datetime | None) -> str:
+    """Quoted strong ETag over the given representation parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        value = part.isoformat() if isinstance(part, datetime) else str(part or "")
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def if_none_match(header: str | None, etag: str) -> bool:
+    """True when an If-None-Match header matches ``etag``.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    ``W/`` validators a CDN may have rewritten still match.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in header.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def cache_control(max_age: int | None = None) -> str:
+    """Cache-Control for stored summaries; SUMMARY_CACHE_MAX_AGE_SECONDS sets max-age."""
+    if max_age is None:
+        max_age = int(os.getenv("SUMMARY_CACHE_MAX_AGE_SECONDS", "300"))
+    if max_age <= 0:
+        # Caches may keep the body but must revalidate it (cheap with the ETag)
+        return "no-cache"
+    return f"public, max-age={max_age}"
@@ -0,0 +1,197 @@
+import functools
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from app.shared.metrics.server_timing import record_stage_timing
+
+T = TypeVar("T")
+
+# Covers fast DB reads up to multi-minute summaries of long articles
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+STAGE_SECONDS = Histogram(
+    "summary_stage_seconds",
+    "Time spent in each stage of the summarization pipeline.",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "summary_cache_lookups_total",
+    "Cache lookups by cache and result (hit or miss).",
+    ["cache", "result"],
+)
+REDUCE_LEVELS = Counter(
+    "summary_reduce_levels_total",
+    "Re-summarization levels run by the map-reduce combine step.",
+)
+REDUCE_CALLS = Counter(
+    "summary_reduce_calls_total",
+    "Inference calls made by the map-reduce combine step.",
+)
+CHUNKS_DROPPED = Counter(
+    "summary_chunks_dropped_total",
+    "Chunks left out of a summary, by reason (over_cap or failed).",
+    ["reason"],
+)
+DEGRADED_SUMMARIES = Counter(
+    "summary_degraded_total",
+    "Degraded summaries served while the inference backend was overloaded.",
+)
+INFERENCE_QUEUE_WAIT_SECONDS = Histogram(
+    "inference_executor_wait_seconds",
+    "Time an inference call waited for an executor slot and rate-limit token.",
+    ["provider"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time waited to check a connection out of the database pool.",
+    buckets=LATENCY_BUCKETS,
+)
+
+
+# Circuit states as gauge values: 0 closed, 1 half-open, 2 open
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def _hit_ratio(stats: dict) -> float:
+    lookups = stats["hits"] + stats["misses"]
+    return stats["hits"] / lookups if lookups else 0.0
+
+
+# kind -> (label name, [(metric name, type, help, stats key or function)])
+SERVICE_STATS_METRICS: dict[str, tuple[str, list[tuple[str, str, str, str | Callable[[dict], float]]]]] = {
+    "executor": ("provider", [
+        ("inference_executor_queue_depth", "gauge", "Inference calls waiting for an executor slot.", "queue_depth"),
+        ("inference_executor_oldest_wait_seconds", "gauge",
+         "How long the oldest waiting inference call has been queued.", "oldest_wait_seconds"),
+        ("inference_executor_in_flight", "gauge", "Inference calls running on executor threads.", "in_flight"),
+        ("inference_executor_max_workers", "gauge", "Executor threads per worker process.", "max_workers"),
+        ("inference_executor_completed", "counter", "Inference calls that returned.", "completed"),
+        ("inference_executor_failed", "counter", "Inference calls that raised or were cancelled.", "failed"),
+    ]),
+    "caller": ("provider", [
+        ("inference_circuit_state", "gauge", "Circuit breaker state: 0 closed, 1 half-open, 2 open.",
+         lambda stats: CIRCUIT_STATE_VALUES[stats["circuit"]]),
+        ("inference_circuit_consecutive_failures", "gauge",
+         "Consecutive failed inference calls counted by the circuit breaker.", "consecutive_failures"),
+        ("inference_retries", "counter", "Inference calls retried after a transient failure.", "retries"),
+        ("inference_hedges", "counter", "Duplicate inference calls sent for slow attempts.", "hedges"),
+    ]),
+    "batcher": ("provider", [
+        ("inference_batches", "counter", "Batched inference requests sent.", "batches"),
+        ("inference_batch_items", "counter", "Chunks sent in batched inference requests.", "items"),
+        ("inference_batch_avg_size", "gauge", "Average number of chunks per batched request.", "avg_batch_size"),
+    ]),
+    "cache": ("cache", [
+        ("summary_cache_hit_ratio", "gauge", "Share of lookups served by the cache since start.", _hit_ratio),
+    ]),
+    "lru_cache": ("cache", [
+        ("summary_cache_hit_ratio", "gauge", "Share of lookups served by the cache since start.", _hit_ratio),
+        ("summary_cache_entries", "gauge", "Entries held by the in-memory cache.", "size"),
+        ("summary_cache_evictions", "counter", "Entries evicted from the in-memory cache.", "evictions"),
+    ]),
+    "admission": ("controller", [
+        ("admission_in_flight", "gauge", "Summarization pipelines currently admitted.", "in_flight"),
+        ("admission_admitted", "counter", "Summarization pipelines admitted.", "admitted"),
+        ("admission_rejected", "counter", "Summarization pipelines refused as overloaded.", "rejected"),
+    ]),
+}
+
+
+class ServiceStatsCollector:
+    """Exports the ``stats()`` of the worker's long-lived services at scrape time.
+
+    The service container registers each executor, cache, admission
+    controller, resilient caller and batcher under a kind of
+    SERVICE_STATS_METRICS and a label value (provider or cache name).
+    """
+    def __init__(self):
+        self._sources: dict[tuple[str, str], Callable[[], dict]] = {}
+
+    def register(self, kind: str, label: str, stats: Callable[[], dict]) -> None:
+        if kind not in SERVICE_STATS_METRICS:
+            raise ValueError(f"Unknown stats kind: {kind}")
+        self._sources[(kind, label)] = stats
+
+    def clear(self) -> None:
+        self._sources.clear()
+
+    def describe(self) -> list:
+        # Metric names vary with the registered sources; skip the registry's name check
+        return []
+
+    def collect(self) -> Iterator[Any]:
+        families = {}
+        for (kind, label), stats_fn in list(self._sources.items()):
+            label_name, metrics = SERVICE_STATS_METRICS[kind]
+            stats = stats_fn()
+            for name, metric_type, documentation, source in metrics:
+                if name not in families:
+                    family_class = CounterMetricFamily if metric_type == "counter" else GaugeMetricFamily
+                    families[name] = family_class(name, documentation, labels=[label_name])
+                value = source(stats) if callable(source) else stats[source]
+                families[name].add_metric([label], float(value))
+        yield from families.values()
+
+
+SERVICE_STATS = ServiceStatsCollector()
+REGISTRY.register(SERVICE_STATS)
+
+
+@contextmanager
+def observe_stage(stage: str) -> Iterator[None]:
+    """Record the duration of the block in summary_stage_seconds{stage=...}
+    and in the current request's Server-Timing header."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.labels(stage).observe(elapsed)
+        record_stage_timing(stage, elapsed)
+
+
+def timed_stage(stage: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorate a coroutine function so each call is recorded as ``stage``."""
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> T:
+            with observe_stage(stage):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_cache_lookup(cache: str, hit: bool, count: int = 1) -> None:
+    if count:
+        CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc(count)
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Return the exposition text and its content type.
+
+    With several worker processes, set PROMETHEUS_MULTIPROC_DIR so every
+    worker's samples are aggregated. Service stats (queue depth, circuit
+    state, ...) are then those of the worker answering the scrape.
+    """
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(SERVICE_STATS)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
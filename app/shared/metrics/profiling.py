@@ -0,0 +1,86 @@
+import asyncio
+import hmac
+import logging
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:  # pyinstrument is optional (pip install .[profiling])
+    Profiler = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+
+
+class ProfilingMiddleware:
+    """Run single requests under pyinstrument's sampling profiler, on demand.
+
+    Disabled unless PROFILING_TOKEN is set. A request carrying that token in
+    the X-Profile-Token header is profiled and its report is written to
+    PROFILING_DIR as ``<id>.html`` (call tree and timeline) and
+    ``<id>.speedscope.json`` (flame graph for speedscope.app); the response
+    names it in an X-Profile header. One request is profiled at a time.
+    """
+    def __init__(
+            self,
+            app: ASGIApp,
+            token: str | None = None,
+            directory: str | Path | None = None,
+            interval: float | None = None,
+    ):
+        self.app = app
+        self.token = token if token is not None else os.getenv("PROFILING_TOKEN", "")
+        self.directory = Path(directory or os.getenv(
+            "PROFILING_DIR", Path(tempfile.gettempdir()) / "api_summarization_profiles"
+        ))
+        self.interval = interval if interval is not None else float(os.getenv("PROFILING_INTERVAL", "0.001"))
+        self._busy = False
+
+    def _requested(self, scope: Scope) -> bool:
+        if scope["type"] != "http" or not self.token:
+            return False
+        sent = dict(scope["headers"]).get(PROFILE_TOKEN_HEADER, b"")
+        return hmac.compare_digest(sent, self.token.encode("utf-8"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+        if Profiler is None or self._busy:
+            logger.warning("Profiling skipped for %s: %s", scope["path"],
+                           "pyinstrument is not installed" if Profiler is None else "another request is profiled")
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"x-profile", profile_id.encode("ascii"))]
+            await send(message)
+
+        self._busy = True
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            self._busy = False
+            await asyncio.to_thread(self._save, profiler, profile_id)
+
+    def _save(self, profiler: "Profiler", profile_id: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{profile_id}.html").write_text(profiler.output_html(), encoding="utf-8")
+        (self.directory / f"{profile_id}.speedscope.json").write_text(
+            profiler.output(SpeedscopeRenderer()), encoding="utf-8"
+        )
+        logger.info("Saved request profile %s to %s", profile_id, self.directory)
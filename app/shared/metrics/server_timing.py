@@ -0,0 +1,67 @@
+import time
+from contextvars import ContextVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Per-request {stage: [total seconds, count]}; shared by every task the request spawns
+_stage_timings: ContextVar[dict[str, list[float]] | None] = ContextVar("stage_timings", default=None)
+
+
+def start_request_timing() -> dict[str, list[float]]:
+    timings: dict[str, list[float]] = {}
+    _stage_timings.set(timings)
+    return timings
+
+
+def record_stage_timing(stage: str, seconds: float) -> None:
+    """Add a stage duration to the current request's timings, if one is being timed."""
+    timings = _stage_timings.get()
+    if timings is None:
+        return
+    entry = timings.setdefault(stage, [0.0, 0])
+    entry[0] += seconds
+    entry[1] += 1
+
+
+def format_server_timing(timings: dict[str, list[float]], total_seconds: float) -> str:
+    """Render timings as a Server-Timing header value, durations in milliseconds.
+
+    Stages that ran several times (e.g. concurrent chunk calls) report their
+    summed duration and the call count.
+    """
+    metrics = []
+    for stage, (seconds, count) in timings.items():
+        metric = f"{stage};dur={seconds * 1000:.1f}"
+        if count > 1:
+            metric += f';desc="{int(count)} calls"'
+        metrics.append(metric)
+    metrics.append(f"total;dur={total_seconds * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware:
+    """Add a Server-Timing header with per-stage durations to matching routes.
+
+    Stages are the ones recorded through ``observe_stage``. The header is
+    written when the response starts, so streamed responses only report the
+    stages finished before their first byte.
+    """
+    def __init__(self, app: ASGIApp, path_prefixes: tuple[str, ...] = ("/summary",)):
+        self.app = app
+        self.path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        timings = start_request_timing()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                header = format_server_timing(timings, time.perf_counter() - started)
+                message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
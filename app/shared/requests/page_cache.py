@@ -0,0 +1,215 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class CachedPage:
+    """Index entry of a cached URL."""
+    url: str
+    digest: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class PageCache:
+    """Compressed, content-addressed on-disk cache of fetched pages.
+
+    Bodies are zlib-compressed and stored once per SHA-256 digest under
+    ``blobs/``. A SQLite index maps each URL to its digest and HTTP
+    validators (ETag / Last-Modified) and records the last access, so the
+    least recently used URLs are evicted once the blobs exceed ``max_bytes``;
+    the total is kept in a ``usage`` row updated with every write, so eviction
+    never has to sum the whole index.
+    Text derived from a body (e.g. the extracted article) can be stored next
+    to it with ``put_derived`` and is dropped together with the blob.
+    The cache only saves work: an index error (e.g. "database is locked") is
+    logged and treated as a miss, or as a skipped write, never raised.
+
+    Methods block on disk I/O; call them through ``asyncio.to_thread``.
+    """
+    def __init__(self, directory: str | Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._blobs = self.directory / "blobs"
+        self._blobs.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.directory / "index.sqlite3", check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_pages_last_access ON pages (last_access);
+            CREATE INDEX IF NOT EXISTS ix_pages_digest ON pages (digest);
+            CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS derived (
+                digest TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (digest, kind)
+            );
+            CREATE TABLE IF NOT EXISTS usage (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL);
+            INSERT OR IGNORE INTO usage (id, bytes) VALUES (0,
+                (SELECT COALESCE(SUM(size), 0) FROM blobs)
+                + (SELECT COALESCE(SUM(LENGTH(data)), 0) FROM derived));
+        """)
+
+    @classmethod
+    def from_env(cls) -> "PageCache | None":
+        """Build the cache from PAGE_CACHE_DIR / PAGE_CACHE_MAX_BYTES, or None if unset."""
+        directory = os.getenv("PAGE_CACHE_DIR")
+        if not directory:
+            return None
+        return cls(directory, int(os.getenv("PAGE_CACHE_MAX_BYTES", str(512 * 1024 * 1024))))
+
+    @staticmethod
+    def digest(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def lookup(self, url: str) -> CachedPage | None:
+        """Return the index entry of a URL and mark it as recently used."""
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT digest, etag, last_modified FROM pages WHERE url = ?", (url,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._db.execute("UPDATE pages SET last_access = ? WHERE url = ?", (time.time(), url))
+                self._db.commit()
+            except sqlite3.Error:
+                self._index_failed("lookup")
+                return None
+        return CachedPage(url=url, digest=row[0], etag=row[1], last_modified=row[2])
+
+    def read(self, digest: str) -> bytes | None:
+        """Return a stored body, or None if it is no longer on disk."""
+        try:
+            return zlib.decompress(self._blob_path(digest).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def store(self, url: str, content: bytes, etag: str | None, last_modified: str | None) -> CachedPage | None:
+        """Store a body and its validators for a URL, evicting LRU entries if needed.
+
+        Returns None if the index could not be updated; nothing is cached then.
+        """
+        digest = self.digest(content)
+        with self._lock:
+            try:
+                self._store(url, digest, content, etag, last_modified)
+            except sqlite3.Error:
+                self._index_failed("store")
+                return None
+        return CachedPage(url=url, digest=digest, etag=etag, last_modified=last_modified)
+
+    def _store(self, url: str, digest: str, content: bytes, etag: str | None, last_modified: str | None) -> None:
+        if self._db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone() is None:
+            compressed = zlib.compress(content, 6)
+            path = self._blob_path(digest)
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, path)
+            self._db.execute("INSERT INTO blobs (digest, size) VALUES (?, ?)", (digest, len(compressed)))
+            self._add_usage(len(compressed))
+
+        previous = self._db.execute("SELECT digest FROM pages WHERE url = ?", (url,)).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO pages (url, digest, etag, last_modified, last_access) VALUES (?, ?, ?, ?, ?)",
+            (url, digest, etag, last_modified, time.time()),
+        )
+        if previous and previous[0] != digest:
+            self._drop_if_unreferenced(previous[0])
+        self._evict()
+        self._db.commit()
+
+    def get_derived(self, digest: str, kind: str) -> str | None:
+        """Return text previously derived from the body with this digest."""
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT data FROM derived WHERE digest = ? AND kind = ?", (digest, kind)
+                ).fetchone()
+            except sqlite3.Error:
+                self._index_failed("get_derived")
+                return None
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def put_derived(self, digest: str, kind: str, text: str) -> None:
+        """Store text derived from a cached body, evicting LRU entries if needed.
+
+        Ignored if the body is not cached.
+        """
+        data = zlib.compress(text.encode("utf-8"), 6)
+        with self._lock:
+            try:
+                if self._db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone() is None:
+                    return
+                previous = self._db.execute(
+                    "SELECT LENGTH(data) FROM derived WHERE digest = ? AND kind = ?", (digest, kind)
+                ).fetchone()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO derived (digest, kind, data) VALUES (?, ?, ?)", (digest, kind, data)
+                )
+                self._add_usage(len(data) - (previous[0] if previous else 0))
+                self._evict()
+                self._db.commit()
+            except sqlite3.Error:
+                self._index_failed("put_derived")
+
+    def size(self) -> int:
+        """Total compressed bytes held by bodies and derived text."""
+        with self._lock:
+            return self._size()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _index_failed(self, operation: str) -> None:
+        logger.warning("Page cache %s failed, continuing without the cache", operation, exc_info=True)
+        try:
+            self._db.rollback()
+        except sqlite3.Error:
+            pass
+
+    def _size(self) -> int:
+        return self._db.execute("SELECT bytes FROM usage WHERE id = 0").fetchone()[0]
+
+    def _add_usage(self, delta: int) -> None:
+        self._db.execute("UPDATE usage SET bytes = bytes + ? WHERE id = 0", (delta,))
+
+    def _evict(self) -> None:
+        while self._size() > self.max_bytes:
+            row = self._db.execute("SELECT url, digest FROM pages ORDER BY last_access LIMIT 1").fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM pages WHERE url = ?", (row[0],))
+            self._drop_if_unreferenced(row[1])
+
+    def _drop_if_unreferenced(self, digest: str) -> None:
+        if self._db.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+            return
+        freed = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs WHERE digest = ?", (digest,)).fetchone()[0]
+        freed += self._db.execute(
+            "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM derived WHERE digest = ?", (digest,)
+        ).fetchone()[0]
+        self._db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        self._db.execute("DELETE FROM derived WHERE digest = ?", (digest,))
+        self._add_usage(-freed)
+        self._blob_path(digest).unlink(missing_ok=True)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blobs / digest[:2] / f"{digest}.z"
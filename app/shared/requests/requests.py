@@ -1,22 +1,91 @@
-import requests as http_requests
+import asyncio
+import json
+import os
+
+import httpx
+
+from app.shared.metrics.metrics import record_cache_lookup
+from app.shared.requests.page_cache import PageCache
 
 
 class RequestService:
-    """Service for making HTTP requests."""
-    def __init__(self):
+    """Service for making HTTP requests.
+
+    Wraps a single ``httpx.AsyncClient`` so connections are kept alive and
+    pooled for the whole application lifespan. Call ``aclose`` on shutdown.
+    With a ``PageCache``, GET bodies are kept on disk and revalidated with
+    If-None-Match / If-Modified-Since instead of being downloaded again.
+    """
+    def __init__(self, client: httpx.AsyncClient | None = None, page_cache: PageCache | None = None):
         self.default_headers = {"User-Agent": 'api_summarization_test'}
         self.respect_robots = True
+        self.client = client or self._build_client()
+        self.page_cache = page_cache
+
+    @staticmethod
+    def _build_client() -> httpx.AsyncClient:
+        """Build the pooled client from the HTTP_* environment variables."""
+        limits = httpx.Limits(
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+            keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+        )
+        return httpx.AsyncClient(
+            limits=limits,
+            # HTTP/2 needs the optional "h2" package (pip install httpx[http2])
+            http2=os.getenv("HTTP2_ENABLED", "false").lower() == "true",
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            follow_redirects=True,
+        )
+
     async def get_data(self, url, json_response=True, params=None, headers: dict | None = None) -> str:
         req_headers = dict(self.default_headers)
         req_headers.update(headers or {})
-        response = http_requests.get(url, params=params, headers=req_headers, timeout=10)
+        if self.page_cache is not None:
+            content = await self._get_revalidated(url, params, req_headers)
+            return content if not json_response else json.loads(content)
+
+        response = await self.client.get(url, params=params, headers=req_headers)
         if not json_response:
             return response.content
 
         return response.json()
 
-    def post_data(self, url, data, headers: dict | None = None):
+    async def _get_revalidated(self, url, params, headers: dict) -> bytes:
+        """GET through the page cache, reusing the stored body on 304 Not Modified."""
+        cache_key = str(httpx.URL(url, params=params))
+        cached = await asyncio.to_thread(self.page_cache.lookup, cache_key)
+        conditional_headers = dict(headers)
+        if cached is not None:
+            if cached.etag:
+                conditional_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                conditional_headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self.client.get(url, params=params, headers=conditional_headers)
+        if response.status_code == 304 and cached is not None:
+            content = await asyncio.to_thread(self.page_cache.read, cached.digest)
+            if content is not None:
+                record_cache_lookup("page", hit=True)
+                return content
+            # Body was evicted between lookup and read; fetch it unconditionally
+            response = await self.client.get(url, params=params, headers=headers)
+
+        record_cache_lookup("page", hit=False)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            await asyncio.to_thread(self.page_cache.store, cache_key, response.content, etag, last_modified)
+        return response.content
+
+    async def post_data(self, url, data, headers: dict | None = None):
         req_headers = dict(self.default_headers)
         req_headers.update(headers or {})
-        response = http_requests.post(url, json=data, headers=req_headers, timeout=20)
-        return response.json()
\ No newline at end of file
+        response = await self.client.post(url, json=data, headers=req_headers, timeout=20)
+        return response.json()
+
+    async def aclose(self) -> None:
+        """Close the underlying client and its pooled connections."""
+        await self.client.aclose()
+        if self.page_cache is not None:
+            self.page_cache.close()
@@ -0,0 +1,69 @@
+import math
+import time
+from typing import Callable
+
+from app.shared.concurrency.admission import OverloadedError
+
+
+class CircuitState:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(OverloadedError):
+    """Raised without calling the backend while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one backend.
+
+    After ``failure_threshold`` failures in a row the circuit opens and
+    calls fail fast with CircuitOpenError for ``reset_seconds``. Then one
+    trial call is let through (half-open): success closes the circuit,
+    failure opens it again, and a trial that ends without an outcome
+    (cancelled) hands the probe to the next call.
+    """
+    def __init__(self, name: str, failure_threshold: int = 5, reset_seconds: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError unless a call may go to the backend now.
+
+        Returns True when the call is the half-open trial.
+        """
+        if self.state == CircuitState.OPEN:
+            remaining = self.opened_at + self.reset_seconds - self.clock()
+            if remaining > 0:
+                raise CircuitOpenError(f"{self.name} backend is unavailable (circuit open)", math.ceil(remaining))
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.HALF_OPEN:
+            if self._trial_in_flight:
+                raise CircuitOpenError(f"{self.name} backend is being probed (circuit half-open)", 1)
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        """End a trial call that produced no outcome, e.g. because it was cancelled."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self.opened_at = self.clock()
+        self._trial_in_flight = False
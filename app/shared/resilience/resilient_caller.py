@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import deque
+from typing import Any, Callable
+
+from app.shared.concurrency.admission import OverloadedError
+from app.shared.concurrency.inference_executor import InferenceExecutor, provider_setting
+from app.shared.resilience.circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+class QueueTimeoutError(OverloadedError):
+    """Raised when a call waited ``queue_timeout_seconds`` for a local executor slot.
+
+    The backend was never called, so it is neither retried nor counted
+    against the circuit breaker.
+    """
+
+
+class RetryPolicy:
+    """Per-call timeout, retry and hedging settings of one provider."""
+    def __init__(
+            self,
+            timeout_seconds: float = 30.0,
+            attempts: int = 3,
+            base_delay: float = 0.5,
+            max_delay: float = 8.0,
+            hedge_percentile: float = 0,
+            hedge_min_samples: int = 20,
+            queue_timeout_seconds: float = 60.0,
+    ):
+        self.timeout_seconds = timeout_seconds
+        # Bounds the local wait for an executor slot and token, before the call starts
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.attempts = max(attempts, 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # 0 disables hedging; e.g. 95 sends a duplicate once a call is slower than p95
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+
+    @classmethod
+    def from_env(cls, provider: str) -> "RetryPolicy":
+        return cls(
+            timeout_seconds=float(provider_setting(provider, "TIMEOUT_SECONDS", "30")),
+            attempts=int(provider_setting(provider, "RETRY_ATTEMPTS", "3")),
+            base_delay=float(provider_setting(provider, "RETRY_BASE_DELAY", "0.5")),
+            max_delay=float(provider_setting(provider, "RETRY_MAX_DELAY", "8")),
+            hedge_percentile=float(provider_setting(provider, "HEDGE_PERCENTILE", "0")),
+            hedge_min_samples=int(provider_setting(provider, "HEDGE_MIN_SAMPLES", "20")),
+            queue_timeout_seconds=float(provider_setting(provider, "QUEUE_TIMEOUT_SECONDS", "60")),
+        )
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter exponential backoff before the ``retry``-th retry (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (retry - 1)))
+
+
+class LatencyWindow:
+    """Latencies of the most recent successful calls."""
+    def __init__(self, size: int = 200):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> float:
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+class ResilientCaller:
+    """Runs blocking backend calls on an InferenceExecutor with timeouts,
+    jittered retries, optional hedging and a circuit breaker.
+
+    Each attempt first waits up to ``policy.queue_timeout_seconds`` for an
+    executor slot (QueueTimeoutError, never retried nor counted by the
+    breaker), then the backend call is bounded by ``policy.timeout_seconds``
+    and only its execution time feeds the hedge latencies. Failures for which
+    ``is_retryable`` is true are retried with backoff and count against the
+    circuit breaker; other errors are raised at once. When hedging is on and
+    an attempt outlives the configured latency percentile, a duplicate call
+    is started and the first success wins.
+    """
+    def __init__(
+            self,
+            executor: InferenceExecutor,
+            policy: RetryPolicy | None = None,
+            breaker: CircuitBreaker | None = None,
+            is_retryable: Callable[[BaseException], bool] = lambda exc: isinstance(exc, TimeoutError),
+    ):
+        self.executor = executor
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker(executor.name)
+        self.is_retryable = is_retryable
+        self.latencies = LatencyWindow()
+        self.retries = 0
+        self.hedges = 0
+
+    async def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        for attempt in range(1, self.policy.attempts + 1):
+            trial = self.breaker.before_call()
+            try:
+                result = await self._attempt(fn, args, kwargs)
+            except (asyncio.CancelledError, QueueTimeoutError):
+                # No outcome; a half-open circuit must let the next call probe
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            except Exception as exc:
+                if not self.is_retryable(exc):
+                    # The backend answered; the request itself is at fault
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if attempt == self.policy.attempts:
+                    raise
+                delay = self.policy.backoff(attempt)
+                logger.warning("%s call failed (%r), retry %d in %.2fs", self.executor.name, exc, attempt, delay)
+                self.retries += 1
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    def _hedge_delay(self) -> float | None:
+        if not self.policy.hedge_percentile or len(self.latencies) < self.policy.hedge_min_samples:
+            return None
+        return self.latencies.percentile(self.policy.hedge_percentile)
+
+    async def _attempt(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        primary = asyncio.ensure_future(self._timed(fn, args, kwargs))
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is None:
+            return await primary
+
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+            if not done:
+                self.hedges += 1
+                pending.add(asyncio.ensure_future(self._timed(fn, args, kwargs)))
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # The losing call's thread finishes on its own; only its task is dropped
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _timed(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        try:
+            await asyncio.wait_for(self.executor.acquire(), self.policy.queue_timeout_seconds)
+        except TimeoutError:
+            raise QueueTimeoutError(
+                f"{self.executor.name} executor is saturated", math.ceil(self.policy.queue_timeout_seconds)
+            ) from None
+        # start() submits at once, so the slot reaches the pool even if we are cancelled now
+        started = time.monotonic()
+        result = await asyncio.wait_for(self.executor.start(fn, *args, **kwargs), self.policy.timeout_seconds)
+        self.latencies.add(time.monotonic() - started)
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+        }
@@ -0,0 +1,101 @@
+"""Regenerate the extraction benchmark corpus in benchmarks/corpus/.
+
+The pages are synthetic but shaped like saved Wikipedia articles. Each one
+has a header and navigation, an infobox, paragraphs with links and
+reference markers, tables, a reference list, navboxes and a footer, so
+about half the markup is not article text. Sizes range from a stub to a
+long featured article, in English, German, Russian and Japanese. Japanese
+has no spaces and ends sentences with "。". The files are gzipped and
+checked in, so benchmark numbers stay comparable even if this script
+changes. Saved real pages (``*.html`` or ``*.html.gz``) can be dropped
+next to them.
+
+    python -m benchmarks.build_corpus
+"""
+import gzip
+import hashlib
+import random
+from pathlib import Path
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+
+VOCABULARY = {
+    "en": ("language system history city river model theory network science music design energy "
+           "government university population culture economy structure period species method data "
+           "century region process research development community program function material field").split(),
+    "de": ("Sprache System Geschichte Stadt Fluss Modell Theorie Netzwerk Wissenschaft Musik Gestaltung "
+           "Energie Regierung Universität Bevölkerung Kultur Wirtschaft Struktur Zeitraum Gattung Verfahren "
+           "Daten Jahrhundert Region Prozess Forschung Entwicklung Gemeinde Programm Größe Straße").split(),
+    "ru": ("язык система история город река модель теория сеть наука музыка дизайн энергия правительство "
+           "университет население культура экономика структура период вид метод данные век регион процесс "
+           "исследование развитие сообщество программа функция материал").split(),
+    "ja": ("言語 体系 歴史 都市 河川 模型 理論 通信網 科学 音楽 設計 エネルギー 政府 大学 人口 文化 経済 構造 "
+           "時代 種 方法 資料 世紀 地域 過程 研究 発展 共同体 計画 機能 材料 分野 は が の を に で と").split(),
+}
+
+# Paragraph counts: a stub, a typical article and a long featured article
+SIZES = {"small": 6, "medium": 60, "large": 400}
+CORPUS = [("en", size) for size in SIZES] + [(lang, "medium") for lang in ("de", "ru", "ja")]
+
+
+def _sentence(rng: random.Random, lang: str, title: str) -> str:
+    words = [rng.choice(VOCABULARY[lang]) for _ in range(rng.randint(8, 24))]
+    for index in rng.sample(range(len(words)), 2):
+        words[index] = f'<a href="/wiki/{words[index]}" title="{words[index]}">{words[index]}</a>'
+    if lang == "ja":
+        return f"{title}{''.join(words)}。"
+    reference = f'<sup class="reference"><a href="#cite_note-{rng.randint(1, 80)}">[{rng.randint(1, 80)}]</a></sup>'
+    return f"{title} {' '.join(words)}.{reference if rng.random() < 0.3 else ''}"
+
+
+def build_page(title: str, lang: str, paragraphs: int) -> bytes:
+    rng = random.Random(hashlib.sha256(f"{lang}:{title}:{paragraphs}".encode("utf-8")).digest())
+    separator = "" if lang == "ja" else " "
+    body = []
+    for index in range(paragraphs):
+        if index and index % 8 == 0:
+            body.append(f'<h2><span class="mw-headline" id="s{index}">{rng.choice(VOCABULARY[lang])}</span></h2>')
+        if index and index % 15 == 0:
+            rows = "".join(
+                f"<tr><td>{rng.choice(VOCABULARY[lang])}</td><td>{rng.randint(1, 10_000)}</td></tr>" for _ in range(10)
+            )
+            body.append(f'<table class="wikitable">{rows}</table>')
+        sentences = separator.join(_sentence(rng, lang, title) for _ in range(rng.randint(4, 9)))
+        body.append(f"<p>{sentences}</p>")
+
+    references = "".join(
+        f'<li id="cite_note-{index}"><cite>{" ".join(rng.choices(VOCABULARY[lang], k=10))}</cite></li>'
+        for index in range(1, max(paragraphs // 2, 5))
+    )
+    navbox = "".join(f'<li><a href="/wiki/{word}">{word}</a></li>' for word in VOCABULARY[lang])
+    menu = "".join(f'<li><a href="/wiki/Special:{word}">{word}</a></li>' for word in VOCABULARY[lang][:12])
+    return f"""<!DOCTYPE html>
+<html lang="{lang}"><head><meta charset="UTF-8"><title>{title} - Wikipedia</title>
+<style>.mw-body {{ margin: 0 }} .infobox {{ float: right }}</style>
+<script>var RLCONF = {{"wgPageName": "{title}", "wgNamespaceNumber": 0}};</script></head>
+<body><header class="mw-header"><nav><ul>{menu}</ul></nav>
+<form action="/w/index.php"><input name="search"></form></header>
+<div id="content" class="mw-body"><h1 id="firstHeading">{title}</h1>
+<div id="mw-content-text" class="mw-body-content"><div class="mw-parser-output">
+<table class="infobox"><tr><th colspan="2">{title}</th></tr><tr><td>{VOCABULARY[lang][0]}</td><td>1234</td></tr></table>
+{''.join(body)}
+<div class="reflist"><ol class="references">{references}</ol></div>
+<div class="navbox"><ul>{navbox}</ul></div><div class="navbox"><ul>{navbox}</ul></div>
+</div></div></div>
+<footer><ul><li>Text is available under the Creative Commons Attribution-ShareAlike License.</li></ul></footer>
+<script>(RLQ=window.RLQ||[]).push(function(){{}});</script></body></html>""".encode("utf-8")
+
+
+def main() -> None:
+    CORPUS_DIR.mkdir(exist_ok=True)
+    for lang, size in CORPUS:
+        title = {"en": "Benchmark", "de": "Messung", "ru": "Измерение", "ja": "ベンチマーク"}[lang]
+        content = build_page(title, lang, SIZES[size])
+        path = CORPUS_DIR / f"{lang}-{size}.html.gz"
+        # mtime=0 keeps the files byte-identical across regenerations
+        path.write_bytes(gzip.compress(content, mtime=0))
+        print(f"{path.name}: {len(content) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare two result files of the same benchmark (load_test or extraction).
+
+    python -m benchmarks.compare benchmarks/results/<before>.json benchmarks/results/<after>.json
+"""
+import argparse
+import json
+from pathlib import Path
+
+METRICS = (
+    ("overall", "rps"),
+    ("post", "p50"), ("post", "p95"), ("post", "p99"),
+    ("get", "p50"), ("get", "p95"), ("get", "p99"),
+    ("backends", "inference_requests_per_post"),
+)
+
+
+def metric(result: dict, section: str, name: str) -> float | None:
+    values = result.get(section, {})
+    if name in values:
+        return values[name]
+    return values.get("latency_ms", {}).get(name)
+
+
+def metrics(result: dict) -> dict[str, float | None]:
+    if result.get("kind") == "extraction":
+        values = {}
+        for row in result["results"]:
+            values[f"{row['stage']}[{row['page']}].median_ms"] = row["median_ms"]
+            values[f"{row['stage']}[{row['page']}].peak_kib"] = row["peak_kib"]
+        return values
+    return {f"{section}.{name}": metric(result, section, name) for section, name in METRICS}
+
+
+def compare(before: dict, after: dict) -> list[tuple[str, float | None, float | None, str]]:
+    if before.get("kind") != after.get("kind"):
+        raise ValueError("Cannot compare results of different benchmarks")
+    old_values, new_values = metrics(before), metrics(after)
+    rows = []
+    for name in old_values | new_values:
+        old, new = old_values.get(name), new_values.get(name)
+        change = f"{(new - old) / old * 100:+.1f}%" if old and new is not None else "n/a"
+        rows.append((name, old, new, change))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    args = parser.parse_args()
+    before, after = (json.loads(path.read_text()) for path in (args.before, args.after))
+
+    print(f"{'metric':44} {before['label']:>14} {after['label']:>14} {'change':>9}")
+    for name, old, new, change in compare(before, after):
+        print(f"{name:44} {str(old):>14} {str(new):>14} {change:>9}")
+
+
+if __name__ == "__main__":
+    main()
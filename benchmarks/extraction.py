@@ -0,0 +1,179 @@
+"""Micro-benchmark of page parsing, paragraph extraction and text splitting.
+
+Times, for every page in benchmarks/corpus/:
+
+* ``scrap_data``: ScrapService.scrap_data, the generic BeautifulSoup scrape;
+* ``extract:<name>``: the article-text extraction behind
+  SummaryService.create_summary (ScrapService -> ContentExtractor), once per
+  available extractor;
+* ``split``: the paragraph-anchored chunking of
+  LanguageModelsService.generate_summary (LanguageModelsService._split_text),
+  on the extracted text;
+* ``textrank``: the local extractive summary (TextRankSummarizer), on the
+  extracted text, when numpy is installed.
+
+Each stage reports the median and fastest of ``--repeat`` runs, throughput in
+MB of its input (the page HTML, or the extracted text for ``split`` and
+``textrank``) per second, and peak traced memory from a separate run under
+tracemalloc, so the tracing overhead does not skew the timings.
+
+    python -m benchmarks.extraction --repeat 20 --label baseline
+"""
+import argparse
+import asyncio
+import gc
+import gzip
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from app.services.scrap.extractors import EXTRACTORS, LxmlExtractor, etree, get_extractor
+from app.services.language_models.textrank import TextRankSummarizer, np
+from app.services.scrap.scrap_service import ScrapService
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+class _StaticPage:
+    """Stands in for RequestService, returning the same page for every URL."""
+    def __init__(self, html: bytes):
+        self.html = html
+
+    async def get_data(self, url: str, json_response: bool = True, params: dict | None = None):
+        return self.html
+
+
+def load_corpus(directory: Path) -> dict[str, bytes]:
+    pages = {}
+    for path in sorted(directory.iterdir()):
+        if path.name.endswith(".html.gz"):
+            pages[path.name[:-len(".html.gz")]] = gzip.decompress(path.read_bytes())
+        elif path.suffix == ".html":
+            pages[path.stem] = path.read_bytes()
+    return pages
+
+
+def stages(html: bytes, loop: asyncio.AbstractEventLoop) -> dict[str, tuple[Callable[[], object], int]]:
+    """The operations to time on one page and the bytes each one consumes, by stage name.
+
+    Coroutine stages run to completion on ``loop``.
+    """
+    # The splitter needs no inference backend; the local provider avoids building a client
+    os.environ.setdefault("LLM_PROVIDER", "local")
+    from app.services.language_models.language_models import LanguageModelsService
+
+    scrap_service = ScrapService(_StaticPage(html))
+    url = "http://en.wikipedia.org/wiki/Benchmark"
+    result = {"scrap_data": (lambda: loop.run_until_complete(scrap_service.scrap_data(url)), len(html))}
+    for name, extractor_class in EXTRACTORS.items():
+        if name == LxmlExtractor.name and etree is None:
+            continue
+        extractor = extractor_class()
+        result[f"extract:{name}"] = (lambda extractor=extractor: extractor.extract(html), len(html))
+
+    text = get_extractor().extract(html)
+    language_models = LanguageModelsService()
+    result["split"] = (lambda: language_models._split_text(text), len(text.encode("utf-8")))
+    if np is not None:
+        summarizer = TextRankSummarizer()
+        result["textrank"] = (lambda: summarizer.summarize(text, 150), len(text.encode("utf-8")))
+    return result
+
+
+def measure(fn: Callable[[], object], repeat: int) -> dict:
+    fn()  # warm-up
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"median": statistics.median(timings), "min": min(timings), "peak_bytes": peak}
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = []
+    # One loop for every page, so timings do not include loop setup
+    loop = asyncio.new_event_loop()
+    try:
+        for page, html in load_corpus(args.corpus).items():
+            if args.pages and page not in args.pages:
+                continue
+            for stage, (fn, size) in stages(html, loop).items():
+                if args.stages and stage.split(":")[0] not in args.stages:
+                    continue
+                measured = measure(fn, args.repeat)
+                results.append({
+                    "page": page,
+                    "input_bytes": size,
+                    "stage": stage,
+                    "median_ms": round(measured["median"] * 1000, 3),
+                    "min_ms": round(measured["min"] * 1000, 3),
+                    "mb_per_s": round(size / measured["median"] / 1_000_000, 2),
+                    "peak_kib": round(measured["peak_bytes"] / 1024, 1),
+                })
+    finally:
+        loop.close()
+    return {
+        "kind": "extraction",
+        "label": args.label,
+        "created_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "config": {"repeat": args.repeat, "corpus": str(args.corpus)},
+        "results": results,
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per stage and page")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--page", dest="pages", action="append", help="only this page (repeatable)")
+    parser.add_argument("--stage", dest="stages", action="append",
+                        choices=("scrap_data", "extract", "split", "textrank"), help="only this stage (repeatable)")
+    parser.add_argument("--label", default="run", help="name of the result file")
+    parser.add_argument("--output", type=Path, help="result file; default benchmarks/results/<time>-<label>.json")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    result = run(args)
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%dT%H%M%S}-extraction-{args.label}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2) + "\n")
+
+    print(f"{'page':12} {'input KiB':>9} {'stage':14} {'median ms':>10} {'MB/s':>8} {'peak KiB':>9}")
+    for row in result["results"]:
+        print(f"{row['page']:12} {row['input_bytes'] / 1024:9.0f} {row['stage']:14} {row['median_ms']:10.2f} "
+              f"{row['mb_per_s']:8.2f} {row['peak_kib']:9.0f}")
+    print(f"Saved {output}")
+
+
+if __name__ == "__main__":
+    main()
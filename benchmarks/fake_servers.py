@@ -0,0 +1,156 @@
+"""Local stand-ins for Wikipedia and the inference backend used by the benchmarks.
+
+FakeWikipediaServer answers as an HTTP proxy would, so the API can keep
+fetching ``http://en.wikipedia.org/wiki/<title>`` URLs unchanged while
+HTTP_PROXY points at it. FakeInferenceServer speaks the Hugging Face
+summarization protocol (``{"inputs": ...}`` -> ``[{"summary_text": ...}]``),
+including batched inputs. Both add a configurable latency and count requests.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+WORDS = (
+    "language system history city river model theory network science music design energy "
+    "government university population culture economy structure period species method data "
+    "century region process research development community program function material field"
+).split()
+
+
+def article_paragraphs(title: str, paragraphs: int = 12, sentences: int = 8) -> list[str]:
+    """Deterministic pseudo-article text for a title."""
+    rng = random.Random(hashlib.sha256(title.encode("utf-8")).digest())
+    result = []
+    for _ in range(paragraphs):
+        text = []
+        for _ in range(sentences):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(8, 20))]
+            text.append(f"{title} {' '.join(words)}.")
+        result.append(" ".join(text))
+    return result
+
+
+def article_html(title: str, paragraphs: int = 12) -> bytes:
+    """A page shaped like Wikipedia's: navigation, infobox, #mw-content-text paragraphs, footer."""
+    body = "".join(f"<p>{paragraph}</p>" for paragraph in article_paragraphs(title, paragraphs))
+    return f"""<!DOCTYPE html>
+<html><head><title>{title} - Wikipedia</title><style>.x{{}}</style><script>var a = 1;</script></head>
+<body><header><nav><a href="/">Main page</a><a href="/random">Random</a></nav></header>
+<div id="content"><h1>{title}</h1>
+<div id="mw-content-text"><div class="mw-parser-output">
+<table class="infobox"><tr><th>{title}</th></tr><tr><td>Infobox data</td></tr></table>
+{body}
+<div class="navbox"><ul><li>Related</li><li>Links</li></ul></div>
+</div></div></div>
+<footer>Text is available under the Creative Commons license.</footer></body></html>""".encode("utf-8")
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, handler, latency: float):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.latency = latency
+        self.requests = 0
+        self.inputs = 0
+        self._lock = threading.Lock()
+
+    def count(self, inputs: int = 1) -> None:
+        with self._lock:
+            self.requests += 1
+            self.inputs += inputs
+
+
+class _BaseHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def reply(self, status: int, content: bytes, content_type: str, headers: dict | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class _WikipediaHandler(_BaseHandler):
+    def do_GET(self):
+        self.server.count()
+        time.sleep(self.server.latency)
+        # Proxied requests carry the absolute URL; direct ones only the path
+        parsed = urlparse(self.path)
+        if parsed.path == "/w/api.php":
+            title = parse_qs(parsed.query).get("titles", ["Unknown"])[0]
+            page = {"title": title, "extract": "\n".join(article_paragraphs(title)), "revisions": [{"revid": 1}]}
+            content = json.dumps({"query": {"pages": [page]}}).encode("utf-8")
+            self.reply(200, content, "application/json")
+            return
+        if not parsed.path.startswith("/wiki/"):
+            self.reply(404, b"Not found", "text/plain")
+            return
+
+        title = unquote(parsed.path[len("/wiki/"):]).replace("_", " ")
+        content = article_html(title)
+        etag = '"%s"' % hashlib.sha256(content).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self.reply(304, b"", "text/html", {"ETag": etag})
+            return
+        self.reply(200, content, "text/html; charset=utf-8", {"ETag": etag})
+
+
+class _InferenceHandler(_BaseHandler):
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        inputs = payload["inputs"]
+        batched = isinstance(inputs, list)
+        texts = inputs if batched else [inputs]
+        self.server.count(len(texts))
+        time.sleep(self.server.latency)
+        # A "summary" of the first sentence or so keeps output sizes realistic
+        outputs = [{"summary_text": " ".join(text.split()[:40])} for text in texts]
+        self.reply(200, json.dumps(outputs).encode("utf-8"), "application/json")
+
+
+class FakeServer:
+    """Run one of the fake servers on a free port in a background thread."""
+    def __init__(self, handler, latency: float = 0.0):
+        self.httpd = _CountingServer(handler, latency)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    @property
+    def requests(self) -> int:
+        return self.httpd.requests
+
+    @property
+    def inputs(self) -> int:
+        return self.httpd.inputs
+
+    def __enter__(self) -> "FakeServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeWikipediaServer(FakeServer):
+    def __init__(self, latency: float = 0.0):
+        super().__init__(_WikipediaHandler, latency)
+
+
+class FakeInferenceServer(FakeServer):
+    def __init__(self, latency: float = 0.0):
+        super().__init__(_InferenceHandler, latency)
@@ -0,0 +1,260 @@
+"""End-to-end load test of the API against local fake Wikipedia and inference servers.
+
+Starts ``app.main:app`` under uvicorn in a subprocess, pointed at:
+
+* a fake Wikipedia reached through HTTP_PROXY (article URLs stay
+  ``http://en.wikipedia.org/wiki/...``),
+* a fake inference server through HF_INFERENCE_BASE_URL,
+* a fresh SQLite database (or ``--database-url``, e.g. a local Postgres),
+
+then drives a concurrent mix of POST /summary/ and GET /summary/ requests and
+reports throughput, latency percentiles and inference calls per request. The
+result is written to ``benchmarks/results/<timestamp>-<label>.json``; compare
+runs with ``python -m benchmarks.compare``.
+
+    python -m benchmarks.load_test --concurrency 32 --requests 1000 --post-ratio 0.3 \\
+        --inference-latency 0.2 --label baseline
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine
+
+from benchmarks.fake_servers import FakeInferenceServer, FakeWikipediaServer
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of ``samples``."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(latencies: list[float], statuses: list[int | str], duration: float) -> dict:
+    counts: dict[str, int] = {}
+    for status in statuses:
+        counts[str(status)] = counts.get(str(status), 0) + 1
+    errors = sum(1 for status in statuses if not isinstance(status, int) or status >= 500)
+    return {
+        "requests": len(statuses),
+        "errors": errors,
+        "statuses": counts,
+        "rps": round(len(statuses) / duration, 2) if duration else 0.0,
+        "latency_ms": {
+            name: round(value * 1000, 2) if value is not None else None
+            for name, value in (
+                ("p50", percentile(latencies, 50)),
+                ("p95", percentile(latencies, 95)),
+                ("p99", percentile(latencies, 99)),
+                ("max", max(latencies) if latencies else None),
+            )
+        },
+    }
+
+
+def create_schema(database_url: str) -> None:
+    """Create every table on a sync connection (the API itself never creates them)."""
+    from app.db import Base
+    import app.models.chunk_summary  # noqa: F401
+    import app.models.summary  # noqa: F401
+    import app.models.summary_job  # noqa: F401
+    import app.models.summary_lease  # noqa: F401
+
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_api(port: int, workers: int, env: dict[str, str]) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers),
+        "--log-level", "warning", "--no-access-log",
+    ]
+    return subprocess.Popen(command, cwd=ROOT, env={**os.environ, **env})
+
+
+async def wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"API exited with status {process.returncode}")
+            try:
+                if (await client.get(f"{base_url}/healthcheck")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("API did not become ready")
+
+
+def build_plan(args: argparse.Namespace) -> list[tuple[str, str]]:
+    """The (operation, article URL) sequence every run with the same seed replays."""
+    rng = random.Random(args.seed)
+    urls = [f"http://en.wikipedia.org/wiki/Benchmark_article_{index}" for index in range(args.articles)]
+    return [
+        ("post" if rng.random() < args.post_ratio else "get", rng.choice(urls))
+        for _ in range(args.requests)
+    ]
+
+
+async def drive(base_url: str, plan: list[tuple[str, str]], concurrency: int, words_limit: int) -> dict:
+    results: dict[str, tuple[list[float], list[int | str]]] = {"post": ([], []), "get": ([], [])}
+    queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+    for item in plan:
+        queue.put_nowait(item)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=300) as client:
+        async def worker():
+            while not queue.empty():
+                operation, url = queue.get_nowait()
+                started = time.perf_counter()
+                try:
+                    if operation == "post":
+                        response = await client.post("/summary/", json={"url": url, "words_limit": words_limit})
+                    else:
+                        response = await client.get("/summary/", params={"url2search": url})
+                    status = response.status_code
+                except httpx.HTTPError as exc:
+                    status = type(exc).__name__
+                latencies, statuses = results[operation]
+                latencies.append(time.perf_counter() - started)
+                statuses.append(status)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        duration = time.perf_counter() - started
+
+    all_latencies = results["post"][0] + results["get"][0]
+    all_statuses = results["post"][1] + results["get"][1]
+    return {
+        "duration_seconds": round(duration, 3),
+        "overall": summarize(all_latencies, all_statuses, duration),
+        "post": summarize(*results["post"], duration),
+        "get": summarize(*results["get"], duration),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent client connections")
+    parser.add_argument("--requests", type=int, default=500, help="total requests to send")
+    parser.add_argument("--post-ratio", type=float, default=0.3, help="share of POST /summary/ requests")
+    parser.add_argument("--articles", type=int, default=50, help="distinct article URLs in the mix")
+    parser.add_argument("--words-limit", type=int, default=100)
+    parser.add_argument("--wiki-latency", type=float, default=0.02, help="fake Wikipedia latency (s)")
+    parser.add_argument("--inference-latency", type=float, default=0.2, help="fake inference latency (s)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--database-url", help="sync SQLAlchemy URL; default: a fresh SQLite file")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="extra environment for the API, e.g. --env INFERENCE_MAX_WORKERS=16")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--label", default="run", help="name of the result file")
+    parser.add_argument("--output", type=Path, help="result file; default benchmarks/results/<time>-<label>.json")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(prefix="api-summarization-bench-") as workdir, \
+            FakeWikipediaServer(args.wiki_latency) as wikipedia, \
+            FakeInferenceServer(args.inference_latency) as inference:
+        database_url = args.database_url or f"sqlite:///{Path(workdir) / 'bench.db'}"
+        create_schema(database_url)
+
+        port = free_port()
+        env = {
+            "DATABASE_URL": database_url,
+            "LLM_PROVIDER": "huggingface",
+            "HF_TOKEN": "benchmark",
+            "HF_INFERENCE_BASE_URL": inference.url,
+            "HTTP_PROXY": wikipedia.url,
+            "http_proxy": wikipedia.url,
+            "NO_PROXY": "127.0.0.1,localhost",
+            "no_proxy": "127.0.0.1,localhost",
+            **dict(item.split("=", 1) for item in args.env),
+        }
+        process = start_api(port, args.workers, env)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            await wait_until_ready(base_url, process)
+            report = await drive(base_url, build_plan(args), args.concurrency, args.words_limit)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+        posts = report["post"]["requests"]
+        report["backends"] = {
+            "wikipedia_requests": wikipedia.requests,
+            "inference_requests": inference.requests,
+            "inference_inputs": inference.inputs,
+            "inference_requests_per_post": round(inference.requests / posts, 3) if posts else None,
+            "inference_inputs_per_post": round(inference.inputs / posts, 3) if posts else None,
+        }
+
+    config = {key: value for key, value in vars(args).items() if key not in ("output",)}
+    config["database"] = "custom" if args.database_url else "sqlite"
+    config.pop("database_url", None)
+    return {
+        "label": args.label,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "config": config,
+        **report,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    result = asyncio.run(run(args))
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%dT%H%M%S}-{args.label}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2) + "\n")
+
+    overall = result["overall"]
+    print(f"{overall['requests']} requests in {result['duration_seconds']}s: "
+          f"{overall['rps']:.1f} req/s, {overall['errors']} errors")
+    for operation in ("post", "get"):
+        latency = result[operation]["latency_ms"]
+        print(f"  {operation:4} p50={latency['p50']}ms p95={latency['p95']}ms p99={latency['p99']}ms "
+              f"statuses={result[operation]['statuses']}")
+    print(f"  inference requests per POST: {result['backends']['inference_requests_per_post']}")
+    print(f"Saved {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
 """
 Test configuration and fixtures
 """
+import os
+
+# Use an in-memory aiosqlite database unless the environment provides one
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, AsyncMock
 from app.main import app
-from app.services.container import get_summary_service
+from app.services.container import get_summary_job_service, get_summary_service
+from app.services.jobs.summary_jobs import SummaryJobService
 from app.services.summary.summary import SummaryService
 
 
@@ -15,17 +21,32 @@ def mock_summary_service():
     service = Mock(spec=SummaryService)
     service.get_summary_by_url = AsyncMock()
     service.create_summary = AsyncMock()
+    service.create_summaries = AsyncMock()
+    service.get_summaries_by_urls = AsyncMock()
     return service
 
 
 @pytest.fixture
-def client(mock_summary_service):
+def mock_summary_job_service():
+    """Create a mock summary job service for testing"""
+    service = Mock(spec=SummaryJobService)
+    service.submit = AsyncMock()
+    service.get_job = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def client(mock_summary_service, mock_summary_job_service):
     """Create a test client with mocked dependencies"""
 
     def override_get_summary_service():
         return mock_summary_service
 
+    def override_get_summary_job_service():
+        return mock_summary_job_service
+
     app.dependency_overrides[get_summary_service] = override_get_summary_service
+    app.dependency_overrides[get_summary_job_service] = override_get_summary_job_service
 
     with TestClient(app) as test_client:
         yield test_client
@@ -4,6 +4,9 @@ Tests for POST /summary endpoint
 from fastapi import status
 from unittest.mock import MagicMock
 
+from app.services.summary.summary import DegradedSummary, NoArticleTextError
+from app.shared.concurrency.admission import OverloadedError
+
 
 class TestCreateSummaryRouter:
     """Test the POST /summary endpoint"""
@@ -153,3 +156,45 @@ class TestCreateSummaryRouter:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         mock_summary_service.create_summary.assert_not_called()
 
+
+    def test_create_summary_overloaded(self, client, mock_summary_service):
+        """Test an overloaded backend answers 503 with Retry-After - FAIL case"""
+        # Arrange
+        mock_summary_service.create_summary.side_effect = OverloadedError("Backend overloaded", retry_after=5)
+        request_payload = {"url": "https://en.wikipedia.org/wiki/Python", "words_limit": 100}
+
+        # Act
+        response = client.post("/summary/", json=request_payload)
+
+        # Assert
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "5"
+        assert response.json()["detail"] == "Backend overloaded"
+
+    def test_create_summary_without_article_text(self, client, mock_summary_service):
+        """Test a page with nothing to summarize answers 422 - FAIL case"""
+        # Arrange
+        mock_summary_service.create_summary.side_effect = NoArticleTextError("No article text")
+        request_payload = {"url": "https://en.wikipedia.org/wiki/Empty", "words_limit": 100}
+
+        # Act
+        response = client.post("/summary/", json=request_payload)
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == "The page has no article text to summarize."
+
+    def test_create_summary_degraded(self, client, mock_summary_service):
+        """Test a degraded summary is marked in the response"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Python"
+        mock_summary_service.create_summary.return_value = DegradedSummary(
+            id="abc", url=test_url, summary="Python is a programming language."
+        )
+
+        # Act
+        response = client.post("/summary/", json={"url": test_url, "words_limit": 100})
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json() == {"summary": "Python is a programming language.", "url": test_url, "degraded": True}
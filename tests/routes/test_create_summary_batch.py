@@ -0,0 +1,60 @@
+"""
+Tests for POST /summary/batch endpoint
+"""
+from fastapi import status
+
+from app.services.summary.summary import SummaryBatchResult
+
+
+class TestCreateSummaryBatchRouter:
+    """Test the POST /summary/batch endpoint"""
+
+    def test_create_summaries_success(self, client, mock_summary_service):
+        """Test batch creation returns one result per item - SUCCESS case"""
+        # Arrange
+        first_url = "https://en.wikipedia.org/wiki/Python"
+        second_url = "https://en.wikipedia.org/wiki/Rust"
+        mock_summary_service.create_summaries.return_value = [
+            SummaryBatchResult(url=first_url, summary="Python summary."),
+            SummaryBatchResult(url=second_url, error="Inference backend unavailable"),
+        ]
+        request_payload = {
+            "items": [
+                {"url": first_url, "words_limit": 50},
+                {"url": second_url},
+            ]
+        }
+
+        # Act
+        response = client.post("/summary/batch", json=request_payload)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        items = response.json()["items"]
+        assert items[0] == {
+            "url": first_url, "summary": "Python summary.", "created": False, "error": None, "degraded": False,
+        }
+        assert items[1]["summary"] is None
+        assert items[1]["error"] == "Inference backend unavailable"
+        mock_summary_service.create_summaries.assert_called_once_with([(first_url, 50), (second_url, 100)])
+
+    def test_create_summaries_invalid_url_domain(self, client, mock_summary_service):
+        """Test batch with a non-Wikipedia URL - FAIL case"""
+        # Arrange
+        request_payload = {"items": [{"url": "https://github.com/some/repo"}]}
+
+        # Act
+        response = client.post("/summary/batch", json=request_payload)
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        mock_summary_service.create_summaries.assert_not_called()
+
+    def test_create_summaries_empty_items(self, client, mock_summary_service):
+        """Test batch without items - FAIL case"""
+        # Act
+        response = client.post("/summary/batch", json={"items": []})
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        mock_summary_service.create_summaries.assert_not_called()
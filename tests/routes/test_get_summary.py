@@ -1,10 +1,14 @@
 """
 Tests for GET /summary endpoint
 """
+from datetime import datetime, timezone
+
 from fastapi import status
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from urllib.parse import quote
 
+from app.services.summary.summary_cache import CachedSummary
+
 
 class TestGetSummaryRouter:
     """Test the GET /summary endpoint"""
@@ -108,3 +112,61 @@ class TestGetSummaryRouter:
         response_data = response.json()
         assert response_data["url"] == test_url
 
+    def test_get_summary_sets_etag_and_cache_control(self, client, mock_summary_service):
+        """Test a found summary carries a strong ETag and Cache-Control - SUCCESS case"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Caching"
+        mock_summary_service.get_summary_by_url.return_value = CachedSummary(
+            id="abc", url=test_url, summary="Caching stores data.",
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+        # Act
+        with patch.dict('os.environ', {'SUMMARY_CACHE_MAX_AGE_SECONDS': '120'}):
+            response = client.get(f"/summary/?url2search={quote(test_url)}")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"].startswith('"') and not response.headers["etag"].startswith('W/')
+        assert response.headers["cache-control"] == "public, max-age=120"
+
+    def test_get_summary_not_modified(self, client, mock_summary_service):
+        """Test a matching If-None-Match returns 304 without a body - SUCCESS case"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Caching"
+        mock_summary_service.get_summary_by_url.return_value = CachedSummary(
+            id="abc", url=test_url, summary="Caching stores data.",
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        etag = client.get(f"/summary/?url2search={quote(test_url)}").headers["etag"]
+
+        # Act
+        response = client.get(f"/summary/?url2search={quote(test_url)}", headers={"If-None-Match": f'"other", W/{etag}'})
+
+        # Assert
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert "cache-control" in response.headers
+
+    def test_get_summary_etag_changes_with_stored_row(self, client, mock_summary_service):
+        """Test a re-created summary no longer matches the old ETag - SUCCESS case"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Caching"
+        mock_summary_service.get_summary_by_url.return_value = CachedSummary(
+            id="abc", url=test_url, summary="Caching stores data.",
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        etag = client.get(f"/summary/?url2search={quote(test_url)}").headers["etag"]
+        mock_summary_service.get_summary_by_url.return_value = CachedSummary(
+            id="abc", url=test_url, summary="Caching stores data.",
+            created_at=datetime(2024, 2, 1, tzinfo=timezone.utc),
+        )
+
+        # Act
+        response = client.get(f"/summary/?url2search={quote(test_url)}", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+        assert response.json()["summary"] == "Caching stores data."
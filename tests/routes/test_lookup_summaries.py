@@ -0,0 +1,66 @@
+"""
+Tests for POST /summary/lookup endpoint
+"""
+from fastapi import status
+from unittest.mock import MagicMock
+
+
+class TestLookupSummariesRouter:
+    """Test the POST /summary/lookup endpoint"""
+
+    def test_lookup_summaries_found_and_missing(self, client, mock_summary_service):
+        """Test the lookup returns found summaries and missing URLs - SUCCESS case"""
+        # Arrange
+        found_url = "https://en.wikipedia.org/wiki/Python"
+        missing_url = "https://en.wikipedia.org/wiki/Rust"
+        mock_summary_service.get_summaries_by_urls.return_value = {
+            found_url: MagicMock(summary="Python summary."),
+            missing_url: None,
+        }
+
+        # Act
+        response = client.post("/summary/lookup", json={"urls": [found_url, missing_url]})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "summaries": [{"summary": "Python summary.", "url": found_url}],
+            "missing": [missing_url],
+        }
+        mock_summary_service.get_summaries_by_urls.assert_called_once_with([found_url, missing_url])
+
+    def test_lookup_summaries_normalizes_urls(self, client, mock_summary_service):
+        """Test URLs are decoded like the single-URL endpoints before lookup - SUCCESS case"""
+        # Arrange
+        mock_summary_service.get_summaries_by_urls.return_value = {}
+
+        # Act
+        response = client.post(
+            "/summary/lookup", json={"urls": ["https://pt.wikipedia.org/wiki/Intelig%C3%AAncia_artificial"]}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        mock_summary_service.get_summaries_by_urls.assert_called_once_with(
+            ["https://pt.wikipedia.org/wiki/Inteligência_artificial"]
+        )
+
+    def test_lookup_summaries_invalid_url_domain(self, client, mock_summary_service):
+        """Test lookup with a non-Wikipedia URL - FAIL case"""
+        # Act
+        response = client.post(
+            "/summary/lookup", json={"urls": ["https://en.wikipedia.org/wiki/Python", "https://github.com/some/repo"]}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        mock_summary_service.get_summaries_by_urls.assert_not_called()
+
+    def test_lookup_summaries_empty_urls(self, client, mock_summary_service):
+        """Test lookup without URLs - FAIL case"""
+        # Act
+        response = client.post("/summary/lookup", json={"urls": []})
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        mock_summary_service.get_summaries_by_urls.assert_not_called()
@@ -0,0 +1,40 @@
+"""
+Tests for GET /metrics endpoint
+"""
+from fastapi import status
+
+from app.shared.metrics.metrics import observe_stage
+
+
+class TestMetricsRouter:
+    """Test the GET /metrics endpoint"""
+
+    def test_metrics_exposes_stage_histograms(self, client):
+        """Test the Prometheus exposition includes the pipeline metrics - SUCCESS case"""
+        # Arrange
+        with observe_stage("fetch"):
+            pass
+
+        # Act
+        response = client.get("/metrics")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'summary_stage_seconds_bucket{le="0.001",stage="fetch"}' in response.text
+        assert "summary_cache_lookups_total" in response.text
+        assert "db_pool_checkout_wait_seconds" in response.text
+
+    def test_metrics_exposes_service_stats(self, client):
+        """Test the executor, circuit, cache and admission stats are exported - SUCCESS case"""
+        # Act
+        response = client.get("/metrics")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert "inference_executor_queue_depth{" in response.text
+        assert "inference_executor_oldest_wait_seconds{" in response.text
+        assert "inference_circuit_state{" in response.text
+        assert 'summary_cache_hit_ratio{cache="summary"}' in response.text
+        assert 'summary_cache_entries{cache="summary"}' in response.text
+        assert 'admission_in_flight{controller="summary"}' in response.text
@@ -0,0 +1,91 @@
+"""
+Tests for the Server-Timing header and the profiling middleware
+"""
+import asyncio
+
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from unittest.mock import MagicMock
+
+from app.shared.metrics.metrics import observe_stage
+from app.shared.metrics.profiling import ProfilingMiddleware
+
+
+class TestServerTiming:
+    """Test the Server-Timing header of the summary routes"""
+
+    def test_summary_response_carries_stage_timings(self, client, mock_summary_service):
+        """Test stages recorded while handling a request are reported - SUCCESS case"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Python"
+
+        async def create_summary(url, words_limit):
+            with observe_stage("fetch"):
+                await asyncio.sleep(0.01)
+            for _ in range(3):
+                with observe_stage("chunk_inference"):
+                    pass
+            return MagicMock(summary="Python summary.", url=test_url)
+
+        mock_summary_service.create_summary.side_effect = create_summary
+
+        # Act
+        response = client.post("/summary/", json={"url": test_url, "words_limit": 50})
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        metrics = dict(
+            (metric.split(";")[0], metric) for metric in response.headers["Server-Timing"].split(", ")
+        )
+        assert set(metrics) == {"fetch", "chunk_inference", "total"}
+        assert float(metrics["fetch"].split("dur=")[1]) >= 10
+        assert 'desc="3 calls"' in metrics["chunk_inference"]
+
+    def test_other_routes_are_not_timed(self, client):
+        """Test routes outside /summary do not get the header"""
+        # Act
+        response = client.get("/healthcheck")
+
+        # Assert
+        assert "Server-Timing" not in response.headers
+
+
+class TestProfilingMiddleware:
+    """Test on-demand request profiling"""
+
+    def build_client(self, tmp_path):
+        app = FastAPI()
+
+        @app.get("/work")
+        async def work():
+            await asyncio.sleep(0.01)
+            return {"ok": True}
+
+        app.add_middleware(ProfilingMiddleware, token="secret", directory=tmp_path)
+        return TestClient(app)
+
+    def test_profiles_request_with_token(self, tmp_path):
+        """Test a request with the operator token is profiled and its report stored"""
+        # Arrange
+        client = self.build_client(tmp_path)
+
+        # Act
+        response = client.get("/work", headers={"X-Profile-Token": "secret"})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        profile_id = response.headers["X-Profile"]
+        assert (tmp_path / f"{profile_id}.html").exists()
+        assert (tmp_path / f"{profile_id}.speedscope.json").exists()
+
+    def test_ignores_wrong_or_missing_token(self, tmp_path):
+        """Test requests without the right token are not profiled - FAIL case"""
+        # Arrange
+        client = self.build_client(tmp_path)
+
+        # Act
+        responses = [client.get("/work"), client.get("/work", headers={"X-Profile-Token": "guess"})]
+
+        # Assert
+        assert all("X-Profile" not in response.headers for response in responses)
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,89 @@
+"""
+Startup-time budget of the API process
+
+Each test starts a fresh interpreter, since the modules imported by the rest of
+the suite would hide what importing the app costs.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+
+IMPORT_BUDGET_SECONDS = float(os.getenv("STARTUP_IMPORT_BUDGET_SECONDS", "3"))
+READY_BUDGET_SECONDS = float(os.getenv("STARTUP_READY_BUDGET_SECONDS", "5"))
+# Loaded on first use, or only for the provider/extractor that is configured
+LAZY_MODULES = ("langchain_text_splitters", "langchain_core", "huggingface_hub", "bs4", "numpy", "uvicorn")
+
+MEASURE_STARTUP = f"""
+import json, sys, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+loaded_at_import = [name for name in {LAZY_MODULES!r} if name in sys.modules]
+from fastapi.testclient import TestClient
+with TestClient(app.main.app) as client:
+    status = client.get("/healthcheck").status_code
+    ready = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": imported - started,
+    "ready_seconds": ready - started,
+    "status": status,
+    "loaded_at_import": loaded_at_import,
+    "loaded_when_ready": [name for name in {LAZY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure_startup(**env) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_STARTUP],
+        cwd=ROOT,
+        env={**os.environ, "DATABASE_URL": "sqlite+aiosqlite:///:memory:", "HF_TOKEN": "test_token", **env},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestStartup:
+    """Test how long the API process takes to import and become healthy"""
+
+    @pytest.fixture(scope="class")
+    def huggingface_startup(self):
+        return measure_startup(LLM_PROVIDER="huggingface", CONTENT_EXTRACTOR="lxml")
+
+    def test_import_within_budget(self, huggingface_startup):
+        """Test importing app.main stays within STARTUP_IMPORT_BUDGET_SECONDS - SUCCESS case"""
+        # Assert
+        assert huggingface_startup["import_seconds"] <= IMPORT_BUDGET_SECONDS
+
+    def test_first_healthy_response_within_budget(self, huggingface_startup):
+        """Test the first /healthcheck answers within STARTUP_READY_BUDGET_SECONDS - SUCCESS case"""
+        # Assert
+        assert huggingface_startup["status"] == 200
+        assert huggingface_startup["ready_seconds"] <= READY_BUDGET_SECONDS
+
+    def test_import_skips_heavy_dependencies(self, huggingface_startup):
+        """Test importing app.main loads none of the lazily imported dependencies - SUCCESS case"""
+        # Assert
+        assert huggingface_startup["loaded_at_import"] == []
+        # The configured provider's client is built on startup; text splitting waits for a summary
+        assert "huggingface_hub" in huggingface_startup["loaded_when_ready"]
+        assert "langchain_text_splitters" not in huggingface_startup["loaded_when_ready"]
+
+    def test_local_provider_skips_huggingface(self):
+        """Test the local provider starts without importing huggingface_hub - SUCCESS case"""
+        # Act
+        startup = measure_startup(LLM_PROVIDER="local", CONTENT_EXTRACTOR="lxml")
+
+        # Assert
+        assert startup["status"] == 200
+        assert "huggingface_hub" not in startup["loaded_when_ready"]
+        assert "numpy" in startup["loaded_when_ready"]
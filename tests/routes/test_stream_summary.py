@@ -0,0 +1,90 @@
+"""
+Tests for GET /summary/stream endpoint
+"""
+from contextlib import asynccontextmanager
+from urllib.parse import quote
+
+import pytest
+from fastapi import status
+
+from app.main import app
+from app.services.container import get_summary_service_session
+from app.shared.concurrency.admission import OverloadedError
+
+
+class TestStreamSummaryRouter:
+    """Test the GET /summary/stream endpoint"""
+
+    @pytest.fixture
+    def stream_events(self, client, mock_summary_service):
+        """Route the stream through the mocked summary service"""
+        @asynccontextmanager
+        async def service_session():
+            yield mock_summary_service
+
+        app.dependency_overrides[get_summary_service_session] = lambda: service_session
+        return mock_summary_service
+
+    def test_stream_summary_success(self, client, stream_events):
+        """Test chunk events are streamed before the final summary - SUCCESS case"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Python_(programming_language)"
+
+        async def stream(url, words_limit):
+            yield {"event": "chunk", "index": 0, "summary": "Part one."}
+            yield {"event": "summary", "summary": "Python is a language."}
+
+        stream_events.stream_summary = stream
+
+        # Act
+        response = client.get(f"/summary/stream?url2search={quote(test_url)}&words_limit=50")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            'event: chunk\ndata: {"index": 0, "summary": "Part one."}\n\n'
+            f'event: summary\ndata: {{"summary": "Python is a language.", "url": "{test_url}"}}\n\n'
+        )
+
+    def test_stream_summary_reports_errors_as_events(self, client, stream_events):
+        """Test a pipeline failure is sent as an error event - FAIL case"""
+        # Arrange
+        async def stream(url, words_limit):
+            yield {"event": "chunk", "index": 0, "summary": "Part one."}
+            raise RuntimeError("Inference backend unavailable")
+
+        stream_events.stream_summary = stream
+
+        # Act
+        response = client.get(f"/summary/stream?url2search={quote('https://en.wikipedia.org/wiki/X')}")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text.endswith('event: error\ndata: {"detail": "Summary could not be created."}\n\n')
+        assert "Inference backend unavailable" not in response.text
+
+    def test_stream_summary_reports_overload_with_retry_after(self, client, stream_events):
+        """Test an overloaded backend is reported with its retry delay - FAIL case"""
+        # Arrange
+        async def stream(url, words_limit):
+            raise OverloadedError("Summarization backend is overloaded", 7)
+            yield
+
+        stream_events.stream_summary = stream
+
+        # Act
+        response = client.get(f"/summary/stream?url2search={quote('https://en.wikipedia.org/wiki/X')}")
+
+        # Assert
+        assert response.text == (
+            'event: error\ndata: {"detail": "Summarization backend is overloaded", "retry_after": 7}\n\n'
+        )
+
+    def test_stream_summary_invalid_domain(self, client, stream_events):
+        """Test streaming a non-Wikipedia URL - FAIL case"""
+        # Act
+        response = client.get(f"/summary/stream?url2search={quote('https://google.com/search')}")
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
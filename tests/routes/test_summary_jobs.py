@@ -0,0 +1,83 @@
+"""
+Tests for the asynchronous summary job endpoints
+"""
+from fastapi import status
+from unittest.mock import MagicMock
+
+from app.models.summary_job import JobStatus
+
+
+def make_job(status_value: str, error: str | None = None) -> MagicMock:
+    job = MagicMock()
+    job.id = "0f8c3a9be2d44f1c9d6a7b5e4c3b2a10"
+    job.url = "https://en.wikipedia.org/wiki/Artificial_intelligence"
+    job.status = status_value
+    job.error = error
+    return job
+
+
+class TestSummaryJobsRouter:
+    """Test POST /summary?async_job=true and GET /summary/jobs/{id}"""
+
+    def test_create_summary_async_returns_accepted(self, client, mock_summary_service, mock_summary_job_service):
+        """Test async mode returns 202 with a job id - SUCCESS case"""
+        # Arrange
+        job = make_job(JobStatus.PENDING.value)
+        mock_summary_job_service.submit.return_value = job
+        request_payload = {"url": job.url, "words_limit": 150}
+
+        # Act
+        response = client.post("/summary/?async_job=true", json=request_payload)
+
+        # Assert
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        response_data = response.json()
+        assert response_data["job_id"] == job.id
+        assert response_data["status"] == "pending"
+        assert response.headers["Location"].endswith(f"/summary/jobs/{job.id}")
+        mock_summary_job_service.submit.assert_called_once_with(job.url, 150)
+        mock_summary_service.create_summary.assert_not_called()
+
+    def test_get_job_succeeded_includes_summary(self, client, mock_summary_service, mock_summary_job_service):
+        """Test a finished job reports its summary - SUCCESS case"""
+        # Arrange
+        job = make_job(JobStatus.SUCCEEDED.value)
+        mock_summary_job_service.get_job.return_value = job
+        mock_summary_data = MagicMock()
+        mock_summary_data.summary = "AI summary."
+        mock_summary_service.get_summary_by_url.return_value = mock_summary_data
+
+        # Act
+        response = client.get(f"/summary/jobs/{job.id}")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        assert response_data["status"] == "succeeded"
+        assert response_data["summary"] == "AI summary."
+        mock_summary_service.get_summary_by_url.assert_called_once_with(job.url)
+
+    def test_get_job_failed_includes_error(self, client, mock_summary_service, mock_summary_job_service):
+        """Test a failed job reports its error"""
+        # Arrange
+        job = make_job(JobStatus.FAILED.value, error="Summary could not be created.")
+        mock_summary_job_service.get_job.return_value = job
+
+        # Act
+        response = client.get(f"/summary/jobs/{job.id}")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["error"] == "Summary could not be created."
+        mock_summary_service.get_summary_by_url.assert_not_called()
+
+    def test_get_job_not_found(self, client, mock_summary_job_service):
+        """Test getting an unknown job - FAIL case"""
+        # Arrange
+        mock_summary_job_service.get_job.return_value = None
+
+        # Act
+        response = client.get("/summary/jobs/unknown")
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,79 @@
+"""
+Tests for ChunkSummaryCache
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db import Base
+from app.services.language_models.chunk_summary_cache import ChunkSummaryCache
+
+
+class TestChunkSummaryCache:
+    """Test the persistent chunk summary memo"""
+
+    @pytest_asyncio.fixture
+    async def session_factory(self, tmp_path):
+        """Create a session factory on a temporary SQLite database"""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'chunks.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_get_many_returns_stored_chunks(self, session_factory):
+        """Test stored chunks are found and unknown ones are misses - SUCCESS case"""
+        # Arrange
+        cache = ChunkSummaryCache(session_factory)
+        await cache.put_many("model-a", {"first chunk": "first summary"})
+
+        # Act
+        found = await cache.get_many("model-a", ["first chunk", "second chunk"])
+
+        # Assert
+        assert found == {"first chunk": "first summary"}
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_summaries_are_scoped_by_model(self, session_factory):
+        """Test a chunk summarized by another model is a miss"""
+        # Arrange
+        cache = ChunkSummaryCache(session_factory)
+        await cache.put_many("model-a", {"chunk": "summary"})
+
+        # Act
+        found = await cache.get_many("model-b", ["chunk"])
+
+        # Assert
+        assert found == {}
+
+    @pytest.mark.asyncio
+    async def test_put_many_skips_existing_keys(self, session_factory):
+        """Test storing a chunk twice keeps the first row and stores the rest"""
+        # Arrange
+        cache = ChunkSummaryCache(session_factory)
+        await cache.put_many("model-a", {"chunk": "summary"})
+
+        # Act
+        await cache.put_many("model-a", {"chunk": "other summary", "new chunk": "new summary"})
+        found = await cache.get_many("model-a", ["chunk", "new chunk"])
+
+        # Assert
+        assert found == {"chunk": "summary", "new chunk": "new summary"}
+
+    @pytest.mark.asyncio
+    async def test_database_errors_are_misses(self):
+        """Test a failing database never fails the lookup - ERROR case"""
+        # Arrange
+        def broken_factory():
+            raise RuntimeError("database is down")
+        cache = ChunkSummaryCache(broken_factory)
+
+        # Act
+        found = await cache.get_many("model-a", ["chunk"])
+        await cache.put_many("model-a", {"chunk": "summary"})
+
+        # Assert
+        assert found == {}
+        assert cache.misses == 1
@@ -0,0 +1,66 @@
+"""
+Tests for the service container
+"""
+import pytest
+from fastapi import FastAPI
+from unittest.mock import Mock
+
+from app.services.container import (
+    ServiceContainer,
+    get_container,
+    get_language_models_service,
+    get_scrap_service,
+    lifespan,
+)
+
+
+class TestServiceContainer:
+    """Test the lifespan-managed ServiceContainer"""
+
+    @pytest.mark.asyncio
+    async def test_lifespan_creates_and_closes_container(self):
+        """Test the container is built on startup and closed on shutdown"""
+        # Arrange
+        app = FastAPI()
+
+        # Act
+        async with lifespan(app):
+            container = app.state.container
+            assert isinstance(container, ServiceContainer)
+            assert container.scrap_service.request_service is container.request_service
+
+        # Assert
+        assert container.request_service.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_dependencies_share_container_services(self):
+        """Test every request resolves the same service instances"""
+        # Arrange
+        app = FastAPI()
+        async with lifespan(app):
+            request = Mock()
+            request.app = app
+
+            # Act
+            first = get_container(request)
+            second = get_container(request)
+
+            # Assert
+            assert first is second
+            assert get_scrap_service(first) is get_scrap_service(second)
+            assert get_language_models_service(first) is get_language_models_service(second)
+
+    @pytest.mark.asyncio
+    async def test_summary_services_share_work_on_their_own_sessions(self):
+        """Test coalesced summaries open a repository session instead of reusing the request's"""
+        # Arrange
+        app = FastAPI()
+        async with lifespan(app):
+            container = app.state.container
+
+            # Act
+            service = container.build_summary_service(Mock())
+
+            # Assert
+            assert service.repository_scope == container.summary_repository_session
+            assert service.single_flight is container.single_flight
@@ -0,0 +1,62 @@
+"""
+Tests for the content extractors
+"""
+import pytest
+
+from app.services.scrap.extractors import BeautifulSoupExtractor, LxmlExtractor, get_extractor
+
+WIKIPEDIA_PAGE = """
+<!DOCTYPE html>
+<html>
+    <head><meta charset="UTF-8"><script>var x = "<p>not content</p>";</script></head>
+    <body>
+        <header><p>Header</p></header>
+        <div id="mw-content-text">
+            <div class="mw-parser-output">
+                <p>Python<sup><a href="#cite">[1]</a></sup> is a <b>programming</b> language.<style>.x{}</style></p>
+                <p>   </p>
+                <table><tr><td><p>Café in a table – 日本語</p></td></tr></table>
+                <div><p>Line one<br>line two</p></div>
+            </div>
+        </div>
+        <footer><p>Footer</p></footer>
+        <p>Outside content</p>
+    </body>
+</html>
+""".encode("utf-8")
+
+EXPECTED_TEXT = "Python[1] is a programming language.\nCafé in a table – 日本語\nLine oneline two"
+
+
+class TestContentExtractors:
+    """Test the lxml and BeautifulSoup extractors agree"""
+
+    @pytest.mark.parametrize("extractor", [LxmlExtractor(), BeautifulSoupExtractor()], ids=["lxml", "bs4"])
+    def test_extract_paragraphs_from_content(self, extractor):
+        """Test only non-empty paragraphs of #mw-content-text are kept"""
+        # Act
+        result = extractor.extract(WIKIPEDIA_PAGE)
+
+        # Assert
+        assert result == EXPECTED_TEXT
+
+    def test_lxml_falls_back_without_content_div(self):
+        """Test pages without #mw-content-text use the BeautifulSoup path"""
+        # Arrange
+        html = b"<html><body><nav>Menu</nav><p>Plain page.</p><script>x()</script></body></html>"
+
+        # Act
+        result = LxmlExtractor().extract(html)
+
+        # Assert
+        assert result == BeautifulSoupExtractor().extract(html)
+        assert "Plain page." in result
+        assert "Menu" not in result
+
+    def test_get_extractor_by_name(self):
+        """Test extractors are selected by name"""
+        # Assert
+        assert isinstance(get_extractor("bs4"), BeautifulSoupExtractor)
+        assert isinstance(get_extractor("lxml"), LxmlExtractor)
+        with pytest.raises(ValueError):
+            get_extractor("regex")
@@ -0,0 +1,156 @@
+"""
+Tests for LanguageModelsService against a local fake inference server
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from unittest.mock import patch
+
+from app.services.language_models.language_models import LanguageModelsService
+from app.shared.resilience.circuit_breaker import CircuitOpenError, CircuitState
+
+
+class FakeInferenceHandler(BaseHTTPRequestHandler):
+    """Answers summarization requests from a script of status codes"""
+    statuses: list[int] = []
+    requests: list[dict] = []
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(payload)
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status == 200 and isinstance(payload["inputs"], list):
+            body = [{"summary_text": f"Batched {index}."} for index, _ in enumerate(payload["inputs"])]
+        elif status == 200:
+            body = [{"summary_text": f"Summary {len(self.requests)}."}]
+        else:
+            body = {"error": "Model facebook/bart-large-cnn is currently loading", "estimated_time": 20.0}
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLanguageModelsFakeServer:
+    """Test retries and the circuit breaker over real HTTP"""
+
+    @pytest.fixture
+    def fake_server(self):
+        """Start the fake inference server on a free port"""
+        FakeInferenceHandler.statuses = []
+        FakeInferenceHandler.requests = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FakeInferenceHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+
+    @pytest.fixture
+    def language_models_service(self, fake_server):
+        """Create LanguageModelsService pointed at the fake server"""
+        env = {
+            "LLM_PROVIDER": "huggingface",
+            "HF_TOKEN": "test_token",
+            "HF_INFERENCE_BASE_URL": f"http://127.0.0.1:{fake_server.server_port}",
+            "INFERENCE_RETRY_BASE_DELAY": "0.001",
+            "INFERENCE_RETRY_MAX_DELAY": "0.002",
+            "INFERENCE_CIRCUIT_FAILURE_THRESHOLD": "3",
+        }
+        with patch.dict("os.environ", env):
+            service = LanguageModelsService()
+        yield service
+        service.executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_model_loading_503_is_retried(self, language_models_service):
+        """Test a 503 "model loading" answer is retried - SUCCESS case"""
+        # Arrange
+        FakeInferenceHandler.statuses = [503, 503]
+
+        # Act
+        result = await language_models_service.generate_summary("Python is a programming language.", 50)
+
+        # Assert
+        assert result == "Summary 3."
+        assert len(FakeInferenceHandler.requests) == 3
+        assert language_models_service.caller.stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_does_not_fail_the_article(self, language_models_service):
+        """Test a chunk failing every retry is left out of the summary"""
+        # Arrange
+        text = "".join(f"Sentence number {i} is about Python. " for i in range(60))
+        language_models_service.caller.policy.attempts = 1
+        language_models_service.caller.breaker.failure_threshold = 100
+        FakeInferenceHandler.statuses = [500]
+
+        # Act
+        result = await language_models_service.generate_summary(text, 50)
+
+        # Assert
+        assert result.startswith("Summary")
+        assert language_models_service.failed_chunks == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_while_backend_is_down(self, language_models_service):
+        """Test a backend that keeps failing trips the breaker - ERROR case"""
+        # Arrange
+        FakeInferenceHandler.statuses = [503] * 10
+
+        # Act
+        with pytest.raises(Exception):
+            await language_models_service.generate_summary("Python is a programming language.", 50)
+        with pytest.raises(CircuitOpenError):
+            await language_models_service.generate_summary("Python is a programming language.", 50)
+
+        # Assert
+        assert language_models_service.caller.breaker.state == CircuitState.OPEN
+        assert len(FakeInferenceHandler.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_bad_request_is_not_retried(self, language_models_service):
+        """Test a 400 answer fails at once without tripping the breaker"""
+        # Arrange
+        FakeInferenceHandler.statuses = [400]
+
+        # Act & Assert
+        with pytest.raises(Exception):
+            await language_models_service.generate_summary("Python is a programming language.", 50)
+        assert len(FakeInferenceHandler.requests) == 1
+        assert language_models_service.caller.breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_concurrent_chunks_share_batched_requests(self, fake_server):
+        """Test chunks of concurrent articles are sent in one batched request"""
+        # Arrange
+        base_url = f"http://127.0.0.1:{fake_server.server_port}"
+        env = {
+            "LLM_PROVIDER": "huggingface",
+            "HF_TOKEN": "test_token",
+            "HF_INFERENCE_BASE_URL": base_url,
+            "HF_INFERENCE_BATCH_URL": f"{base_url}/batch",
+            "INFERENCE_BATCH_WAIT_MS": "50",
+        }
+        with patch.dict("os.environ", env):
+            service = LanguageModelsService()
+        articles = ["".join(f"Sentence {i} of article {n} is about Python. " for i in range(60)) for n in range(2)]
+        chunks = sum(len(service._split_text(article)) for article in articles)
+
+        # Act
+        results = await asyncio.gather(*[service.generate_summary(article, 50) for article in articles])
+        service.close()
+
+        # Assert
+        batched = [request for request in FakeInferenceHandler.requests if isinstance(request["inputs"], list)]
+        assert len(batched) == 1
+        assert len(batched[0]["inputs"]) == chunks
+        assert all(result.startswith("Summary") for result in results)
+        assert service.chunk_batcher.stats()["avg_batch_size"] == chunks
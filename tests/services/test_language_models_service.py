@@ -2,10 +2,11 @@
 Tests for LanguageModelsService
 """
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from langchain_core.documents import Document
 
-from app.services.language_models.language_models import LanguageModelsService, LLMProvider
+from app.services.language_models.chunk_summary_cache import ChunkSummaryCache
+from app.services.language_models.language_models import MIN_CHUNK_SIZE, LanguageModelsService, LLMProvider
 
 
 class TestLanguageModelsService:
@@ -24,7 +25,7 @@ class TestLanguageModelsService:
     def language_models_service(self, mock_hf_client):
         """Create LanguageModelsService with mocked HF client"""
         with patch.dict('os.environ', {'LLM_PROVIDER': 'huggingface', 'HF_TOKEN': 'test_token'}):
-            with patch('app.services.language_models.language_models.InferenceClient', return_value=mock_hf_client):
+            with patch('huggingface_hub.InferenceClient', return_value=mock_hf_client):
                 service = LanguageModelsService()
                 return service
 
@@ -48,3 +49,195 @@ class TestLanguageModelsService:
         assert result == "Python is a versatile programming language used for various applications."
         language_models_service.client.summarization.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stream_summary_emits_chunks_then_summary(self, language_models_service):
+        """Test streaming yields every chunk summary before the final one"""
+        # Arrange
+        test_text = "Python is a high-level programming language. " * 60
+        words_limit = 50
+
+        # Act
+        events = [event async for event in language_models_service.stream_summary(test_text, words_limit)]
+
+        # Assert
+        chunk_events = [event for event in events if event["event"] == "chunk"]
+        assert len(chunk_events) > 1
+        assert sorted(event["index"] for event in chunk_events) == list(range(len(chunk_events)))
+        assert events[-1] == {"event": "summary", "summary": "This is a summary."}
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_reuses_cached_chunks(self, language_models_service, mock_hf_client):
+        """Test memoized chunks are not sent to the backend again"""
+        # Arrange
+        test_text = "Python is a high-level programming language. " * 60
+        chunk_texts = [doc.page_content for doc in language_models_service._split_text(test_text)[:10]]
+        unique_texts = list(dict.fromkeys(chunk_texts))
+        chunk_cache = Mock(spec=ChunkSummaryCache)
+        chunk_cache.get_many = AsyncMock(return_value={text: "Cached." for text in unique_texts[1:]})
+        chunk_cache.put_many = AsyncMock()
+        language_models_service.chunk_cache = chunk_cache
+
+        # Act
+        result = await language_models_service.generate_summary(test_text, 50)
+
+        # Assert
+        assert result == "This is a summary."
+        # One call for the only uncached chunk, one to combine the chunk summaries
+        assert mock_hf_client.summarization.call_count == 2
+        chunk_cache.put_many.assert_awaited_once_with(
+            language_models_service.model_name, {unique_texts[0]: "This is a summary."}
+        )
+
+    def test_split_text_keeps_chunks_of_unedited_paragraphs(self, language_models_service):
+        """Test editing one paragraph changes only the chunks around it"""
+        # Arrange
+        paragraphs = [f"Paragraph {i} describes topic {i} of the article in plain sentences. " * 4 for i in range(30)]
+        edited = list(paragraphs)
+        edited[10] += "An editor added this sentence."
+
+        # Act
+        before = [doc.page_content for doc in language_models_service._split_text("\n".join(paragraphs))]
+        after = [doc.page_content for doc in language_models_service._split_text("\n".join(edited))]
+
+        # Assert
+        assert len(before) > 10
+        assert all(len(chunk) <= 1000 for chunk in before + after)
+        assert len(set(after) - set(before)) <= 2
+        assert "\n".join(after).split("\n") == [paragraph.strip() for paragraph in edited]
+
+    def test_split_text_packs_short_paragraphs(self, language_models_service):
+        """Test a run of short paragraphs is not cut into tiny chunks at every anchor"""
+        # Arrange
+        test_text = "\n".join(f"Short paragraph number {i} about Python." for i in range(200))
+
+        # Act
+        chunks = [doc.page_content for doc in language_models_service._split_text(test_text)]
+
+        # Assert
+        assert len(chunks) <= 25
+        assert all(len(chunk) >= MIN_CHUNK_SIZE for chunk in chunks[:-1])
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_after_an_edit_reuses_other_chunks(self, language_models_service, mock_hf_client):
+        """Test re-summarizing an edited article only sends the edited chunks to the backend"""
+        # Arrange
+        paragraphs = [f"Paragraph {i} describes topic {i} of the article in plain sentences. " * 4 for i in range(30)]
+        edited = list(paragraphs)
+        edited[20] = "This paragraph was rewritten entirely by an editor."
+        memo = {}
+        chunk_cache = Mock(spec=ChunkSummaryCache)
+        chunk_cache.get_many = AsyncMock(side_effect=lambda model, texts: {t: memo[t] for t in texts if t in memo})
+        chunk_cache.put_many = AsyncMock(side_effect=lambda model, computed: memo.update(computed))
+        language_models_service.chunk_cache = chunk_cache
+        language_models_service.reduce_fan_in = 64
+        await language_models_service.generate_summary("\n".join(paragraphs), 50)
+        mock_hf_client.summarization.reset_mock()
+
+        # Act
+        await language_models_service.generate_summary("\n".join(edited), 50)
+
+        # Assert
+        chunk_calls = mock_hf_client.summarization.call_count - 1  # the last call combines the summaries
+        assert 1 <= chunk_calls <= 2
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_covers_every_chunk_within_budget(self, language_models_service, mock_hf_client):
+        """Test long articles are map-reduced without dropping chunks"""
+        # Arrange
+        test_text = "".join(f"Sentence number {i} is about Python. " for i in range(400))
+        chunks = len(language_models_service._split_text(test_text))
+        language_models_service.reduce_fan_in = 4
+
+        # Act
+        result = await language_models_service.generate_summary(test_text, 50)
+
+        # Assert
+        assert chunks > 10
+        assert result == "This is a summary."
+        assert language_models_service.dropped_chunks == 0
+        assert mock_hf_client.summarization.call_count == LanguageModelsService.call_budget(chunks, 4)
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_counts_chunks_over_the_cap(self, language_models_service, mock_hf_client):
+        """Test chunks beyond SUMMARY_MAX_CHUNKS are skipped evenly, keeping the article's tail"""
+        # Arrange
+        test_text = "".join(f"Sentence number {i} is about Python. " for i in range(400))
+        docs = language_models_service._split_text(test_text)
+        language_models_service.max_chunks = 5
+
+        # Act
+        await language_models_service.generate_summary(test_text, 50)
+
+        # Assert
+        assert language_models_service.dropped_chunks == len(docs) - 5
+        assert mock_hf_client.summarization.call_count == LanguageModelsService.call_budget(5, 4)
+        mapped = [call.args[0] for call in mock_hf_client.summarization.call_args_list[:5]]
+        assert docs[0].page_content in mapped
+        assert docs[-1].page_content in mapped
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_respects_words_limit(self, language_models_service, mock_hf_client):
+        """Test an over-long final summary is cut once instead of re-summarized"""
+        # Arrange
+        test_text = "Python is a high-level programming language. " * 60
+        mock_hf_client.summarization.return_value.summary_text = "One two three. Four five six seven eight."
+
+        # Act
+        result = await language_models_service.generate_summary(test_text, 5)
+
+        # Assert
+        assert result == "One two three."
+        final_call = mock_hf_client.summarization.call_args_list[-1]
+        assert final_call.kwargs["generate_parameters"] == {"max_length": 7}
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_empty_text(self, language_models_service, mock_hf_client):
+        """Test an empty article summarizes to "" without calling the backend - EDGE case"""
+        # Act
+        result = await language_models_service.generate_summary("   ", 50)
+        events = [event async for event in language_models_service.stream_summary("", 50)]
+
+        # Assert
+        assert result == ""
+        assert events == [{"event": "summary", "summary": ""}]
+        mock_hf_client.summarization.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_all_chunk_summaries_empty(self, language_models_service, mock_hf_client):
+        """Test empty chunk summaries combine to "" instead of failing - EDGE case"""
+        # Arrange
+        test_text = "Python is a high-level programming language. " * 60
+        mock_hf_client.summarization.return_value.summary_text = ""
+
+        # Act
+        result = await language_models_service.generate_summary(test_text, 50)
+
+        # Assert
+        assert result == ""
+
+    def test_call_budget(self):
+        """Test the call budget of the reduce tree"""
+        # Act & Assert
+        assert LanguageModelsService.call_budget(1, 4) == 1
+        assert LanguageModelsService.call_budget(4, 4) == 5
+        assert LanguageModelsService.call_budget(9, 4) == 12
+
+    @pytest.mark.asyncio
+    async def test_local_provider_summarizes_without_client(self):
+        """Test the local provider uses TextRank and builds no inference client"""
+        # Arrange
+        test_text = "Python is a programming language. Python is popular. Rain fell in Amsterdam."
+        with patch.dict('os.environ', {'LLM_PROVIDER': 'local'}):
+            with patch('huggingface_hub.InferenceClient') as client_class:
+                service = LanguageModelsService()
+
+        # Act
+        result = await service.generate_summary(test_text, 10)
+        events = [event async for event in service.stream_summary(test_text, 10)]
+
+        # Assert
+        client_class.assert_not_called()
+        assert service.provider == LLMProvider.LOCAL
+        assert 0 < len(result.split()) <= 10
+        assert events == [{"event": "summary", "summary": result}]
+        service.executor.shutdown()
@@ -0,0 +1,92 @@
+"""
+Tests for RequestService
+"""
+import json
+
+import httpx
+import pytest
+
+from app.shared.requests.page_cache import PageCache
+from app.shared.requests.requests import RequestService
+
+
+class TestRequestService:
+    """Test the RequestService"""
+
+    @pytest.fixture
+    def captured_requests(self):
+        """Collect the requests seen by the mock transport"""
+        return []
+
+    @pytest.fixture
+    def request_service(self, captured_requests):
+        """Create RequestService backed by an in-memory transport"""
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured_requests.append(request)
+            if request.method == "POST":
+                return httpx.Response(200, json={"echo": json.loads(request.content)})
+            return httpx.Response(200, content=b"<html>ok</html>")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return RequestService(client=client)
+
+    @pytest.mark.asyncio
+    async def test_get_data_returns_raw_content(self, request_service, captured_requests):
+        """Test fetching raw content - SUCCESS case"""
+        # Act
+        result = await request_service.get_data("https://en.wikipedia.org/wiki/Python", json_response=False)
+
+        # Assert
+        assert result == b"<html>ok</html>"
+        assert captured_requests[0].headers["User-Agent"] == "api_summarization_test"
+
+    @pytest.mark.asyncio
+    async def test_post_data_returns_json(self, request_service, captured_requests):
+        """Test posting JSON data - SUCCESS case"""
+        # Act
+        result = await request_service.post_data("https://example.org/api", {"a": 1}, headers={"X-Test": "1"})
+
+        # Assert
+        assert result == {"echo": {"a": 1}}
+        assert captured_requests[0].headers["X-Test"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_across_calls(self, request_service):
+        """Test the same pooled client serves every call"""
+        # Arrange
+        client = request_service.client
+
+        # Act
+        await request_service.get_data("https://en.wikipedia.org/wiki/A", json_response=False)
+        await request_service.get_data("https://en.wikipedia.org/wiki/B", json_response=False)
+
+        # Assert
+        assert request_service.client is client
+        await request_service.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_get_data_revalidates_cached_page(self, tmp_path):
+        """Test a 304 response reuses the cached body"""
+        # Arrange
+        seen_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers)
+            if request.headers.get("If-None-Match") == '"rev-1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"<html>article</html>", headers={"ETag": '"rev-1"'})
+
+        page_cache = PageCache(tmp_path, max_bytes=1024 * 1024)
+        service = RequestService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), page_cache=page_cache)
+        url = "https://en.wikipedia.org/wiki/Python"
+
+        # Act
+        first = await service.get_data(url, json_response=False)
+        second = await service.get_data(url, json_response=False)
+        await service.aclose()
+
+        # Assert
+        assert first == second == b"<html>article</html>"
+        assert "If-None-Match" not in seen_headers[0]
+        assert seen_headers[1]["If-None-Match"] == '"rev-1"'
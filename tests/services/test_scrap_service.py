@@ -1,11 +1,18 @@
 """
 Tests for ScrapService
 """
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
 import pytest
+import pytest_asyncio
 from unittest.mock import Mock, AsyncMock
 from bs4 import BeautifulSoup
 
-from app.services.scrap.scrap_service import ScrapService
+from app.services.scrap.scrap_service import ScrapMode, ScrapService
+from app.shared.requests.page_cache import PageCache
 from app.shared.requests.requests import RequestService
 
 
@@ -59,3 +66,163 @@ class TestScrapService:
         text = result.get_text()
         assert "Python is a programming language" in text
         mock_request_service.get_data.assert_called_once_with(test_url, json_response=False)
+
+    @pytest.mark.asyncio
+    async def test_extract_text_success(self, scrap_service, mock_request_service):
+        """Test extracting article paragraphs from URL - SUCCESS case"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Python"
+        mock_request_service.get_data.return_value = b"""
+        <html><body>
+            <div id="mw-content-text">
+                <p>Python is a programming language.</p>
+                <p>It was created by Guido van Rossum.</p>
+            </div>
+            <footer><p>Footer content</p></footer>
+        </body></html>
+        """
+
+        # Act
+        result = await scrap_service.extract_text(test_url)
+
+        # Assert
+        assert result == "Python is a programming language.\nIt was created by Guido van Rossum."
+        mock_request_service.get_data.assert_called_once_with(test_url, json_response=False)
+
+
+    @pytest.mark.asyncio
+    async def test_extract_text_reuses_cached_extraction(self, mock_request_service, tmp_path):
+        """Test an unchanged page body is not parsed again"""
+        # Arrange
+        html = b'<html><div id="mw-content-text"><p>Cached paragraph.</p></div></html>'
+        page_cache = PageCache(tmp_path, max_bytes=1024 * 1024)
+        page_cache.store("https://en.wikipedia.org/wiki/Python", html, '"v1"', None)
+        extractor = Mock()
+        extractor.name = "lxml"
+        extractor.extract.return_value = "Cached paragraph."
+        scrap_service = ScrapService(mock_request_service, extractor=extractor, page_cache=page_cache)
+        mock_request_service.get_data.return_value = html
+
+        # Act
+        first = await scrap_service.extract_text("https://en.wikipedia.org/wiki/Python")
+        second = await scrap_service.extract_text("https://en.wikipedia.org/wiki/Python")
+
+        # Assert
+        assert first == second == "Cached paragraph."
+        extractor.extract.assert_called_once_with(html)
+        page_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_extract_text_parses_off_the_event_loop(self, mock_request_service):
+        """Test article extraction runs in a worker thread, not on the event loop"""
+        # Arrange
+        parsed_on = []
+        extractor = Mock()
+        extractor.extract.side_effect = lambda html: parsed_on.append(threading.current_thread()) or "Text."
+        scrap_service = ScrapService(mock_request_service, extractor=extractor)
+        mock_request_service.get_data.return_value = b"<html></html>"
+
+        # Act
+        text = await scrap_service.extract_text("https://en.wikipedia.org/wiki/Python")
+
+        # Assert
+        assert text == "Text."
+        assert parsed_on and parsed_on[0] is not threading.main_thread()
+
+
+class StubWikipediaHandler(BaseHTTPRequestHandler):
+    """Serves MediaWiki API extracts and rendered pages for a few titles"""
+    redirects = {"Python language": "Python (programming language)"}
+    extracts = {"Python (programming language)": (1234567, "Python is a programming language.\nIt is popular.")}
+    # Titles the API answers with an empty page list
+    unanswered = {"Unanswered page"}
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == "/w/api.php":
+            title = parse_qs(parsed.query)["titles"][0]
+            target = self.redirects.get(title, title)
+            if target in self.extracts:
+                revid, extract = self.extracts[target]
+                page = {"pageid": 1, "title": target, "extract": extract, "revisions": [{"revid": revid}]}
+            else:
+                page = {"title": target, "missing": True}
+            query = {"pages": [] if title in self.unanswered else [page]}
+            if target != title:
+                query["redirects"] = [{"from": title, "to": target}]
+            self._send(200, "application/json", json.dumps({"batchcomplete": True, "query": query}).encode())
+        else:
+            html = b'<html><body><div id="mw-content-text"><p>Scraped from HTML.</p></div></body></html>'
+            self._send(200, "text/html; charset=utf-8", html)
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestScrapServiceApiMode:
+    """Test ScrapService against a local stub MediaWiki server"""
+
+    @pytest.fixture
+    def stub_server(self):
+        """Run the stub Wikipedia server on a free local port"""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubWikipediaHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}"
+        server.shutdown()
+        server.server_close()
+
+    @pytest_asyncio.fixture
+    async def scrap_service(self):
+        """Create ScrapService in API mode with a real RequestService"""
+        request_service = RequestService()
+        yield ScrapService(request_service, mode=ScrapMode.API)
+        await request_service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_article_follows_redirect(self, scrap_service, stub_server):
+        """Test API mode returns the plain extract and revision id - SUCCESS case"""
+        # Act
+        article = await scrap_service.fetch_article(f"{stub_server}/wiki/Python_language")
+
+        # Assert
+        assert article.source == ScrapMode.API
+        assert article.title == "Python (programming language)"
+        assert article.revision_id == 1234567
+        assert article.text == "Python is a programming language.\nIt is popular."
+
+    @pytest.mark.asyncio
+    async def test_fetch_article_falls_back_to_html(self, scrap_service, stub_server):
+        """Test a missing extract falls back to HTML scraping"""
+        # Act
+        article = await scrap_service.fetch_article(f"{stub_server}/wiki/Unknown_page")
+
+        # Assert
+        assert article.source == ScrapMode.HTML
+        assert article.revision_id is None
+        assert article.text == "Scraped from HTML."
+
+    @pytest.mark.asyncio
+    async def test_fetch_article_without_pages_falls_back_to_html(self, scrap_service, stub_server):
+        """Test an API answer with an empty page list falls back to HTML scraping"""
+        # Act
+        article = await scrap_service.fetch_article(f"{stub_server}/wiki/Unanswered_page")
+
+        # Assert
+        assert article.source == ScrapMode.HTML
+        assert article.text == "Scraped from HTML."
+
+    def test_title_from_url(self):
+        """Test titles are read from both URL styles"""
+        # Assert
+        assert ScrapService._title_from_url("https://en.wikipedia.org/wiki/Caf%C3%A9_society") == "Café society"
+        assert ScrapService._title_from_url("https://en.wikipedia.org/w/index.php?title=Python_(x)") == "Python (x)"
+        with pytest.raises(ValueError):
+            ScrapService._title_from_url("https://en.wikipedia.org/")
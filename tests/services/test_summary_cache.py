@@ -0,0 +1,136 @@
+"""
+Tests for SummaryCache and CachedSummaryRepository
+"""
+import pytest
+from unittest.mock import Mock
+
+from app.models.summary import Summary
+from app.services.summary.summary_cache import CachedSummary, CachedSummaryRepository, SummaryCache
+from app.services.summary.summary_repository import SummaryRepositoryInterface
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_entry(summary_id: str) -> CachedSummary:
+    return CachedSummary(id=summary_id, url=f"https://en.wikipedia.org/wiki/{summary_id}", summary="text")
+
+
+class TestSummaryCache:
+    """Test the LRU/TTL SummaryCache"""
+
+    def test_get_counts_hits_and_misses(self):
+        """Test hit and miss counters"""
+        # Arrange
+        cache = SummaryCache(max_entries=10, ttl_seconds=60)
+        cache.put("a", make_entry("a"))
+
+        # Act
+        hit = cache.get("a")
+        miss = cache.get("b")
+
+        # Assert
+        assert hit.id == "a"
+        assert miss is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test size-based eviction drops the LRU entry"""
+        # Arrange
+        cache = SummaryCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", make_entry("a"))
+        cache.put("b", make_entry("b"))
+        cache.get("a")
+
+        # Act
+        cache.put("c", make_entry("c"))
+
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.evictions == 1
+
+    def test_expired_entry_is_evicted(self):
+        """Test TTL-based eviction"""
+        # Arrange
+        clock = FakeClock()
+        cache = SummaryCache(max_entries=10, ttl_seconds=30, clock=clock)
+        cache.put("a", make_entry("a"))
+
+        # Act
+        clock.now = 31
+
+        # Assert
+        assert cache.get("a") is None
+        assert cache.evictions == 1
+        assert len(cache) == 0
+
+
+class TestCachedSummaryRepository:
+    """Test the read-through CachedSummaryRepository"""
+
+    @pytest.fixture
+    def mock_repository(self):
+        """Create mock backing repository"""
+        return Mock(spec=SummaryRepositoryInterface)
+
+    @pytest.fixture
+    def cached_repository(self, mock_repository):
+        """Create CachedSummaryRepository with an empty cache"""
+        return CachedSummaryRepository(mock_repository, SummaryCache(max_entries=10, ttl_seconds=60))
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_from_cache(self, cached_repository, mock_repository):
+        """Test only the first read reaches the database"""
+        # Arrange
+        mock_repository.get_summary_by_id.return_value = Summary(
+            id="abc", url="https://en.wikipedia.org/wiki/Python", summary="Python summary."
+        )
+
+        # Act
+        first = await cached_repository.get_summary_by_id("abc")
+        second = await cached_repository.get_summary_by_id("abc")
+
+        # Assert
+        assert first == second
+        assert second.summary == "Python summary."
+        mock_repository.get_summary_by_id.assert_called_once_with("abc")
+
+    @pytest.mark.asyncio
+    async def test_missing_summary_is_not_cached(self, cached_repository, mock_repository):
+        """Test a miss in the database is looked up again next time"""
+        # Arrange
+        mock_repository.get_summary_by_id.return_value = None
+
+        # Act
+        await cached_repository.get_summary_by_id("abc")
+        result = await cached_repository.get_summary_by_id("abc")
+
+        # Assert
+        assert result is None
+        assert mock_repository.get_summary_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_summary_replaces_cached_entry(self, cached_repository, mock_repository):
+        """Test create_summary invalidates and repopulates the cache"""
+        # Arrange
+        cached_repository.cache.put("abc", make_entry("abc"))
+        mock_repository.create_summary.return_value = Summary(
+            id="abc", url="https://en.wikipedia.org/wiki/Python", summary="Fresh summary."
+        )
+
+        # Act
+        await cached_repository.create_summary("abc", "https://en.wikipedia.org/wiki/Python", "Fresh summary.")
+        result = await cached_repository.get_summary_by_id("abc")
+
+        # Assert
+        assert result.summary == "Fresh summary."
+        mock_repository.get_summary_by_id.assert_not_called()
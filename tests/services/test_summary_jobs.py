@@ -0,0 +1,136 @@
+"""
+Tests for SummaryJobService
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, Mock
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db import Base
+from app.models.summary_job import JobStatus
+from app.services.jobs.summary_job_repository import SummaryJobRepository
+from app.services.jobs.summary_jobs import SummaryJobService
+from app.services.summary.summary import DegradedSummary, NoArticleTextError, SummaryService
+from app.shared.concurrency.admission import OverloadedError
+
+
+class TestSummaryJobService:
+    """Test the in-process SummaryJobService worker pool"""
+
+    @pytest_asyncio.fixture
+    async def session_factory(self, tmp_path):
+        """Create a session factory on a temporary SQLite database"""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    @pytest.fixture
+    def mock_summary_service(self):
+        """Create mock summary service"""
+        service = Mock(spec=SummaryService)
+        service.create_summary = AsyncMock()
+        return service
+
+    @pytest.fixture
+    def job_service(self, session_factory, mock_summary_service):
+        """Create SummaryJobService with one worker"""
+        return SummaryJobService(session_factory, lambda db: mock_summary_service, workers=1)
+
+    async def wait_for_status(self, job_service, job_id, status):
+        for _ in range(100):
+            job = await job_service.get_job(job_id)
+            if job.status == status.value:
+                return job
+            await asyncio.sleep(0.01)
+        raise AssertionError(f"job {job_id} never reached {status.value}")
+
+    @pytest.mark.asyncio
+    async def test_submitted_job_succeeds(self, job_service, mock_summary_service):
+        """Test a submitted job is run and marked succeeded - SUCCESS case"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Python"
+        await job_service.start()
+
+        # Act
+        job = await job_service.submit(test_url, 80)
+        finished = await self.wait_for_status(job_service, job.id, JobStatus.SUCCEEDED)
+        await job_service.stop()
+
+        # Assert
+        assert finished.error is None
+        mock_summary_service.create_summary.assert_called_once_with(url=test_url, words_limit=80, degrade=False)
+
+    @pytest.mark.asyncio
+    async def test_failed_job_records_error(self, job_service, mock_summary_service):
+        """Test a failing pipeline marks the job failed - FAIL case"""
+        # Arrange
+        mock_summary_service.create_summary.side_effect = RuntimeError("Inference backend unavailable")
+        await job_service.start()
+
+        # Act
+        job = await job_service.submit("https://en.wikipedia.org/wiki/Python", 80)
+        finished = await self.wait_for_status(job_service, job.id, JobStatus.FAILED)
+        await job_service.stop()
+
+        # Assert
+        assert finished.error == "Summary could not be created."
+        assert "Inference backend unavailable" not in finished.error
+
+    @pytest.mark.asyncio
+    async def test_job_without_article_text_records_reason(self, job_service, mock_summary_service):
+        """Test a page without article text fails the job with a client-facing reason - FAIL case"""
+        # Arrange
+        mock_summary_service.create_summary.side_effect = NoArticleTextError("No article text found at https://x")
+        await job_service.start()
+
+        # Act
+        job = await job_service.submit("https://en.wikipedia.org/wiki/Python", 80)
+        finished = await self.wait_for_status(job_service, job.id, JobStatus.FAILED)
+        await job_service.stop()
+
+        # Assert
+        assert finished.error == "The page has no article text to summarize."
+
+    @pytest.mark.asyncio
+    async def test_overloaded_job_is_retried_until_stored(self, job_service, mock_summary_service):
+        """Test an overloaded backend or a degraded result re-queues the job instead of finishing it"""
+        # Arrange
+        job_service.retry_seconds = 0.01
+        mock_summary_service.create_summary.side_effect = [
+            OverloadedError("Summarization backend is overloaded", 0),
+            DegradedSummary(id="abc", url="https://en.wikipedia.org/wiki/Python", summary="Lead."),
+            Mock(summary="Stored summary."),
+        ]
+        await job_service.start()
+
+        # Act
+        job = await job_service.submit("https://en.wikipedia.org/wiki/Python", 80)
+        finished = await self.wait_for_status(job_service, job.id, JobStatus.SUCCEEDED)
+        await job_service.stop()
+
+        # Assert
+        assert finished.error is None
+        assert mock_summary_service.create_summary.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_unfinished_jobs_are_recovered_on_start(self, job_service, session_factory, mock_summary_service):
+        """Test jobs left pending or running by a previous process are run again"""
+        # Arrange
+        async with session_factory() as db:
+            jobs = SummaryJobRepository(db)
+            pending = await jobs.create_job("https://en.wikipedia.org/wiki/Pending", 100)
+            running = await jobs.create_job("https://en.wikipedia.org/wiki/Running", 100)
+            await jobs.update_status(running.id, JobStatus.RUNNING)
+
+        # Act
+        await job_service.start()
+        await self.wait_for_status(job_service, pending.id, JobStatus.SUCCEEDED)
+        await self.wait_for_status(job_service, running.id, JobStatus.SUCCEEDED)
+        await job_service.stop()
+
+        # Assert
+        assert mock_summary_service.create_summary.call_count == 2
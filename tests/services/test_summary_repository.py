@@ -2,91 +2,216 @@
 Tests for SummaryRepository
 """
 import pytest
-from unittest.mock import Mock
-from sqlalchemy.orm import Session
+import pytest_asyncio
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from app.db import Base
 from app.services.summary.summary_repository import SummaryRepository
 from app.models.summary import Summary
+from app.models.summary_lease import SummaryLease
 
 
 class TestSummaryRepository:
     """Test the SummaryRepository"""
 
-    @pytest.fixture
-    def mock_db_session(self):
-        """Create mock database session"""
-        session = Mock(spec=Session)
-        return session
+    @pytest_asyncio.fixture
+    async def db_session(self):
+        """Create an async session on a fresh in-memory SQLite database"""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            yield session
+
+        await engine.dispose()
 
     @pytest.fixture
-    def summary_repository(self, mock_db_session):
-        """Create SummaryRepository with mocked database session"""
-        return SummaryRepository(db=mock_db_session)
+    def summary_repository(self, db_session):
+        """Create SummaryRepository on the test database session"""
+        return SummaryRepository(db=db_session)
 
-    def test_get_summary_by_id_success(self, summary_repository, mock_db_session):
+    @pytest.mark.asyncio
+    async def test_get_summary_by_id_success(self, summary_repository, db_session):
         """Test getting existing summary by ID - SUCCESS case"""
         # Arrange
         test_id = "abc123def456"
-        mock_summary = Summary(
+        db_session.add(Summary(
             id=test_id,
             url="https://en.wikipedia.org/wiki/Python",
             summary="Python is a programming language."
-        )
-
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = mock_summary
-        mock_db_session.query.return_value = mock_query
+        ))
+        await db_session.commit()
 
         # Act
-        result = summary_repository.get_summary_by_id(test_id)
+        result = await summary_repository.get_summary_by_id(test_id)
 
         # Assert
         assert result is not None
         assert result.id == test_id
         assert result.url == "https://en.wikipedia.org/wiki/Python"
         assert result.summary == "Python is a programming language."
-        mock_db_session.query.assert_called_once_with(Summary)
 
-    def test_get_summary_by_id_not_found(self, summary_repository, mock_db_session):
+    @pytest.mark.asyncio
+    async def test_get_summary_by_id_not_found(self, summary_repository):
         """Test getting non-existing summary by ID - FAIL case"""
-        # Arrange
-        test_id = "nonexistent123"
-
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        mock_db_session.query.return_value = mock_query
-
         # Act
-        result = summary_repository.get_summary_by_id(test_id)
+        result = await summary_repository.get_summary_by_id("nonexistent123")
 
         # Assert
         assert result is None
-        mock_db_session.query.assert_called_once_with(Summary)
 
-    def test_create_summary_success(self, summary_repository, mock_db_session):
+    @pytest.mark.asyncio
+    async def test_create_summary_success(self, summary_repository):
         """Test creating new summary - SUCCESS case"""
         # Arrange
         test_id = "new123abc456"
         test_url = "https://en.wikipedia.org/wiki/Machine_Learning"
         test_summary = "Machine learning is a subset of AI."
 
-        # Mock the behavior of db operations
-        def add_side_effect(obj):
-            obj.id = test_id
-            obj.url = test_url
-            obj.summary = test_summary
+        # Act
+        result = await summary_repository.create_summary(test_id, test_url, test_summary)
 
-        mock_db_session.add.side_effect = add_side_effect
-        mock_db_session.commit.return_value = None
-        mock_db_session.refresh.return_value = None
+        # Assert
+        assert isinstance(result, Summary)
+        assert result.created_at is not None
+        stored = await summary_repository.get_summary_by_id(test_id)
+        assert stored.summary == test_summary
+
+    @pytest.mark.asyncio
+    async def test_create_summary_returns_existing_on_conflict(self, summary_repository):
+        """Test creating a summary another worker already stored - returns existing"""
+        # Arrange
+        test_id = "dup123abc456"
+        test_url = "https://en.wikipedia.org/wiki/Dup"
+        await summary_repository.create_summary(test_id, test_url, "Stored first.")
 
         # Act
-        result = summary_repository.create_summary(test_id, test_url, test_summary)
+        result = await summary_repository.create_summary(test_id, test_url, "Stored second.")
 
         # Assert
-        assert result is not None
-        assert isinstance(result, Summary)
-        mock_db_session.add.assert_called_once()
-        mock_db_session.commit.assert_called_once()
-        mock_db_session.refresh.assert_called_once()
+        assert result.summary == "Stored first."
+
+    @pytest.mark.asyncio
+    async def test_get_summaries_by_ids_returns_only_stored(self, summary_repository):
+        """Test bulk lookup returns the stored subset of IDs"""
+        # Arrange
+        await summary_repository.create_summary("id1", "https://en.wikipedia.org/wiki/One", "One.")
+        await summary_repository.create_summary("id2", "https://en.wikipedia.org/wiki/Two", "Two.")
 
+        # Act
+        result = await summary_repository.get_summaries_by_ids(["id1", "id2", "missing"])
+
+        # Assert
+        assert sorted(row.id for row in result) == ["id1", "id2"]
+
+    @pytest.mark.asyncio
+    async def test_create_summaries_skips_rows_stored_concurrently(self, summary_repository):
+        """Test bulk insert keeps rows another worker already stored"""
+        # Arrange
+        await summary_repository.create_summary("id1", "https://en.wikipedia.org/wiki/One", "Stored first.")
+
+        # Act
+        result = await summary_repository.create_summaries([
+            ("id1", "https://en.wikipedia.org/wiki/One", "Stored second."),
+            ("id2", "https://en.wikipedia.org/wiki/Two", "Two."),
+        ])
+
+        # Assert
+        summaries = {row.id: row.summary for row in result}
+        assert summaries == {"id1": "Stored first.", "id2": "Two."}
+
+    @pytest.mark.asyncio
+    async def test_create_summaries_retries_conflicting_rows_one_at_a_time(self, summary_repository):
+        """Test a row failing its own insert after a conflict does not drop the others"""
+        # Arrange
+        await summary_repository.create_summary("id1", "https://en.wikipedia.org/wiki/One", "Stored first.")
+
+        # Act
+        result = await summary_repository.create_summaries([
+            ("id1", "https://en.wikipedia.org/wiki/One", "Stored second."),
+            ("id2", "https://en.wikipedia.org/wiki/Two", "Two."),
+            ("id3", "https://en.wikipedia.org/wiki/One", "Same URL as id1."),
+        ])
+
+        # Assert
+        summaries = {row.id: row.summary for row in result}
+        assert summaries == {"id1": "Stored first.", "id2": "Two."}
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_success(self, summary_repository):
+        """Test acquiring a free lease - SUCCESS case"""
+        # Act
+        acquired = await summary_repository.acquire_lease("abc123def456", "holder-1", 60)
+
+        # Assert
+        assert acquired is True
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_held_by_other_worker(self, summary_repository):
+        """Test acquiring a live lease held elsewhere - FAIL case"""
+        # Arrange
+        await summary_repository.acquire_lease("abc123def456", "holder-1", 60)
+
+        # Act
+        acquired = await summary_repository.acquire_lease("abc123def456", "holder-2", 60)
+
+        # Assert
+        assert acquired is False
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_takes_over_expired_lease(self, summary_repository, db_session):
+        """Test an expired lease can be claimed by another holder"""
+        # Arrange
+        db_session.add(SummaryLease(
+            id="abc123def456",
+            holder="holder-1",
+            expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+        ))
+        await db_session.commit()
+
+        # Act
+        acquired = await summary_repository.acquire_lease("abc123def456", "holder-2", 60)
+
+        # Assert
+        assert acquired is True
+
+    @pytest.mark.asyncio
+    async def test_release_lease_frees_summary_id(self, summary_repository):
+        """Test a released lease can be acquired again"""
+        # Arrange
+        await summary_repository.acquire_lease("abc123def456", "holder-1", 60)
+
+        # Act
+        await summary_repository.release_lease("abc123def456", "holder-1")
+
+        # Assert
+        assert await summary_repository.acquire_lease("abc123def456", "holder-2", 60) is True
+
+    @pytest.mark.asyncio
+    async def test_renew_lease_keeps_it_from_lapsing(self, summary_repository):
+        """Test a renewed lease cannot be taken over once its first ttl has passed"""
+        # Arrange
+        await summary_repository.acquire_lease("abc123def456", "holder-1", -1)
+
+        # Act
+        renewed = await summary_repository.renew_lease("abc123def456", "holder-1", 60)
+
+        # Assert
+        assert renewed is True
+        assert await summary_repository.acquire_lease("abc123def456", "holder-2", 60) is False
+
+    @pytest.mark.asyncio
+    async def test_renew_lease_taken_over_by_other_holder(self, summary_repository):
+        """Test a lease that lapsed to another holder is not renewed - FAIL case"""
+        # Arrange
+        await summary_repository.acquire_lease("abc123def456", "holder-1", -1)
+        await summary_repository.acquire_lease("abc123def456", "holder-2", 60)
+
+        # Act
+        renewed = await summary_repository.renew_lease("abc123def456", "holder-1", 60)
+
+        # Assert
+        assert renewed is False
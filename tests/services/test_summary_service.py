@@ -1,14 +1,17 @@
 """
 Tests for SummaryService
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
 from unittest.mock import Mock, AsyncMock, MagicMock
-from bs4 import BeautifulSoup
 
-from app.services.summary.summary import SummaryService
+from app.services.summary.summary import DegradedSummary, NoArticleTextError, SummaryService
 from app.services.summary.summary_repository import SummaryRepositoryInterface
 from app.services.scrap.scrap_service import ScrapService
 from app.services.language_models.language_models import LanguageModelsService
+from app.shared.concurrency.admission import AdmissionController, AdmissionMode, OverloadedError
 
 
 class TestSummaryService:
@@ -25,6 +28,7 @@ class TestSummaryService:
         """Create mock scrap service"""
         service = Mock(spec=ScrapService)
         service.scrap_data = AsyncMock()
+        service.extract_text = AsyncMock()
         return service
 
     @pytest.fixture
@@ -95,16 +99,9 @@ class TestSummaryService:
         mock_repository.get_summary_by_id.return_value = None
 
         # Mock scraped content
-        html_content = """
-        <html>
-            <div id="mw-content-text">
-                <p>Machine learning is a subset of AI.</p>
-                <p>It uses statistical techniques.</p>
-            </div>
-        </html>
-        """
-        mock_soup = BeautifulSoup(html_content, 'html.parser')
-        mock_scrap_service.scrap_data.return_value = mock_soup
+        mock_scrap_service.extract_text.return_value = (
+            "Machine learning is a subset of AI.\nIt uses statistical techniques."
+        )
 
         # Mock LLM summary
         mock_language_models_service.generate_summary.return_value = "Machine learning summary."
@@ -121,8 +118,10 @@ class TestSummaryService:
         # Assert
         assert result is not None
         assert result.summary == "Machine learning summary."
-        mock_scrap_service.scrap_data.assert_called_once_with(test_url)
-        mock_language_models_service.generate_summary.assert_called_once()
+        mock_scrap_service.extract_text.assert_called_once_with(test_url)
+        mock_language_models_service.generate_summary.assert_called_once_with(
+            "Machine learning is a subset of AI.\nIt uses statistical techniques.", test_words_limit
+        )
         mock_repository.create_summary.assert_called_once()
 
     @pytest.mark.asyncio
@@ -151,10 +150,374 @@ class TestSummaryService:
         assert result == mock_existing_summary
         assert result.summary == "Existing summary."
         # Should not call scraping or LLM services
-        mock_scrap_service.scrap_data.assert_not_called()
+        mock_scrap_service.extract_text.assert_not_called()
         mock_language_models_service.generate_summary.assert_not_called()
         mock_repository.create_summary.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_create_summary_coalesces_concurrent_calls(
+        self,
+        summary_service,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test concurrent creates for the same URL run the pipeline once"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Trending"
+        mock_repository.get_summary_by_id.return_value = None
+        mock_repository.acquire_lease.return_value = True
+        mock_scrap_service.extract_text.return_value = "Body."
+
+        async def slow_summary(text, words_limit):
+            await asyncio.sleep(0.01)
+            return "Trending summary."
+
+        mock_language_models_service.generate_summary.side_effect = slow_summary
+        mock_created_summary = MagicMock()
+        mock_created_summary.summary = "Trending summary."
+        mock_repository.create_summary.return_value = mock_created_summary
+
+        # Act
+        results = await asyncio.gather(*[summary_service.create_summary(test_url, 100) for _ in range(5)])
+
+        # Assert
+        assert all(result is mock_created_summary for result in results)
+        mock_scrap_service.extract_text.assert_called_once_with(test_url)
+        mock_language_models_service.generate_summary.assert_called_once()
+        mock_repository.create_summary.assert_called_once()
+        mock_repository.release_lease.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_coalesced_summary_runs_on_its_own_repository(
+        self,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test the shared computation outlives a cancelled leader on its own session"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Shared"
+        shared_repository = Mock(spec=SummaryRepositoryInterface)
+        shared_repository.get_summary_by_id.return_value = None
+        shared_repository.acquire_lease.return_value = True
+        mock_created_summary = MagicMock(summary="Shared summary.")
+        shared_repository.create_summary.return_value = mock_created_summary
+        scopes = []
+
+        @asynccontextmanager
+        async def repository_scope():
+            scopes.append("opened")
+            yield shared_repository
+            scopes.append("closed")
+
+        summary_service = SummaryService(
+            summary_repository=mock_repository,
+            scrap_service=mock_scrap_service,
+            language_models_service=mock_language_models_service,
+            repository_scope=repository_scope,
+        )
+        mock_repository.get_summary_by_id.return_value = None
+        mock_scrap_service.extract_text.return_value = "Body."
+
+        async def slow_summary(text, words_limit):
+            await asyncio.sleep(0.01)
+            return "Shared summary."
+
+        mock_language_models_service.generate_summary.side_effect = slow_summary
+
+        # Act
+        leader = asyncio.ensure_future(summary_service.create_summary(test_url, 100))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(summary_service.create_summary(test_url, 100))
+        await asyncio.sleep(0)
+        leader.cancel()
+        result = await follower
+
+        # Assert
+        assert result is mock_created_summary
+        assert scopes == ["opened", "closed"]
+        shared_repository.create_summary.assert_called_once()
+        shared_repository.release_lease.assert_called_once()
+        mock_repository.acquire_lease.assert_not_called()
+        mock_repository.create_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_summary_waits_for_other_worker(
+        self,
+        summary_service,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test a caller that loses the lease reuses the other worker's row"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Elsewhere"
+        summary_service.lease_poll_interval = 0
+        mock_existing_summary = MagicMock()
+        mock_existing_summary.summary = "Computed by another worker."
+        mock_repository.get_summary_by_id.side_effect = [None, mock_existing_summary]
+        mock_repository.acquire_lease.return_value = False
+
+        # Act
+        result = await summary_service.create_summary(test_url, 100)
+
+        # Assert
+        assert result is mock_existing_summary
+        mock_scrap_service.extract_text.assert_not_called()
+        mock_language_models_service.generate_summary.assert_not_called()
+        mock_repository.release_lease.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_summary_renews_lease_while_computing(
+        self,
+        summary_service,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test a pipeline slower than the lease ttl keeps renewing it until the row is stored"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Slow"
+        summary_service.lease_seconds = 0.03
+        mock_repository.get_summary_by_id.return_value = None
+        mock_repository.acquire_lease.return_value = True
+        mock_repository.renew_lease.return_value = True
+        mock_scrap_service.extract_text.return_value = "Body."
+
+        async def slow_summary(text, words_limit):
+            await asyncio.sleep(0.1)
+            return "Slow summary."
+
+        mock_language_models_service.generate_summary.side_effect = slow_summary
+
+        # Act
+        await summary_service.create_summary(test_url, 100)
+        renewals = mock_repository.renew_lease.call_count
+        await asyncio.sleep(0.05)
+
+        # Assert
+        assert renewals >= 2
+        assert mock_repository.renew_lease.call_count == renewals
+        summary_id, holder, ttl = mock_repository.renew_lease.call_args.args
+        assert (summary_id, ttl) == (summary_service._generate_summary_id(test_url), 0.03)
+        mock_repository.release_lease.assert_called_once_with(summary_id, holder)
+
+    @pytest.mark.asyncio
+    async def test_get_summaries_by_urls_single_query(self, summary_service, mock_repository):
+        """Test bulk lookup resolves every URL with one query - SUCCESS case"""
+        # Arrange
+        found_url = "https://en.wikipedia.org/wiki/Found"
+        empty_url = "https://en.wikipedia.org/wiki/Empty"
+        missing_url = "https://en.wikipedia.org/wiki/Missing"
+        found_id = summary_service._generate_summary_id(found_url)
+        empty_id = summary_service._generate_summary_id(empty_url)
+        mock_found = MagicMock(id=found_id, summary="Found summary.")
+        mock_repository.get_summaries_by_ids.return_value = [mock_found, MagicMock(id=empty_id, summary="")]
+
+        # Act
+        results = await summary_service.get_summaries_by_urls([missing_url, found_url, empty_url, found_url])
+
+        # Assert
+        assert results == {missing_url: None, found_url: mock_found, empty_url: None}
+        assert list(results) == [missing_url, found_url, empty_url]
+        mock_repository.get_summaries_by_ids.assert_called_once_with([
+            summary_service._generate_summary_id(missing_url), found_id, empty_id,
+        ])
+
+    @pytest.mark.asyncio
+    async def test_create_summaries_mixes_existing_created_and_failed(
+        self,
+        summary_service,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test batch creation resolves hits in one query and reports errors per item"""
+        # Arrange
+        existing_url = "https://en.wikipedia.org/wiki/Existing"
+        new_url = "https://en.wikipedia.org/wiki/New"
+        broken_url = "https://en.wikipedia.org/wiki/Broken"
+        existing_id = summary_service._generate_summary_id(existing_url)
+        new_id = summary_service._generate_summary_id(new_url)
+
+        mock_existing = MagicMock(id=existing_id, summary="Existing summary.")
+        mock_repository.get_summaries_by_ids.return_value = [mock_existing]
+        mock_scrap_service.extract_text.return_value = "Body."
+
+        async def generate(text, words_limit):
+            if words_limit == 13:
+                raise RuntimeError("Inference backend unavailable")
+            return "New summary."
+
+        mock_language_models_service.generate_summary.side_effect = generate
+        mock_repository.get_summary_by_id.return_value = None
+        mock_repository.acquire_lease.return_value = True
+        mock_repository.create_summary.return_value = MagicMock(id=new_id, summary="New summary.")
+
+        # Act
+        results = await summary_service.create_summaries([
+            (existing_url, 100),
+            (new_url, 100),
+            (broken_url, 13),
+        ])
+
+        # Assert
+        assert [r.summary for r in results] == ["Existing summary.", "New summary.", None]
+        assert [r.created for r in results] == [False, True, False]
+        assert results[2].error == "Summary could not be created."
+        mock_repository.get_summaries_by_ids.assert_called_once()
+        mock_repository.create_summary.assert_called_once_with(new_id, new_url, "New summary.")
+        assert mock_repository.release_lease.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_summaries_bounds_concurrency(
+        self,
+        summary_service,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test no more than batch_concurrency pipelines run at once"""
+        # Arrange
+        summary_service.batch_concurrency = 2
+        mock_repository.get_summaries_by_ids.return_value = []
+        mock_repository.get_summary_by_id.return_value = None
+        mock_scrap_service.extract_text.return_value = "Body."
+        running = []
+        peak = []
+
+        async def generate(text, words_limit):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return "Summary."
+
+        mock_language_models_service.generate_summary.side_effect = generate
+        items = [(f"https://en.wikipedia.org/wiki/Page_{i}", 100) for i in range(6)]
+
+        # Act
+        await summary_service.create_summaries(items)
+
+        # Assert
+        assert max(peak) == 2
+        assert mock_language_models_service.generate_summary.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_stream_summary_persists_final_summary(
+        self,
+        summary_service,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test streaming forwards chunk events and stores the final summary"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Streaming"
+        mock_repository.get_summary_by_id.return_value = None
+        mock_scrap_service.extract_text.return_value = "Body."
+
+        async def stream(text, words_limit):
+            yield {"event": "chunk", "index": 0, "summary": "Part one."}
+            yield {"event": "summary", "summary": "Final."}
+
+        mock_language_models_service.stream_summary = stream
+        mock_repository.create_summary.return_value = MagicMock(summary="Final.")
+
+        # Act
+        events = [event async for event in summary_service.stream_summary(test_url, 100)]
+
+        # Assert
+        assert events == [
+            {"event": "chunk", "index": 0, "summary": "Part one."},
+            {"event": "summary", "summary": "Final."},
+        ]
+        mock_repository.create_summary.assert_called_once_with(
+            summary_service._generate_summary_id(test_url), test_url, "Final."
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_summaries_joins_in_flight_summary(
+        self,
+        summary_service,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test a batch item already being computed by another request is not computed again"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Trending"
+        mock_repository.get_summaries_by_ids.return_value = []
+        mock_repository.get_summary_by_id.return_value = None
+        mock_repository.acquire_lease.return_value = True
+        mock_repository.create_summary.return_value = MagicMock(summary="Trending summary.")
+        mock_scrap_service.extract_text.return_value = "Body."
+
+        async def slow_summary(text, words_limit):
+            await asyncio.sleep(0.01)
+            return "Trending summary."
+
+        mock_language_models_service.generate_summary.side_effect = slow_summary
+
+        # Act
+        single = asyncio.ensure_future(summary_service.create_summary(test_url, 100))
+        await asyncio.sleep(0)
+        results = await summary_service.create_summaries([(test_url, 100)])
+        await single
+
+        # Assert
+        assert results[0].summary == "Trending summary."
+        mock_language_models_service.generate_summary.assert_called_once()
+        mock_repository.create_summary.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_summary_joins_in_flight_summary(
+        self,
+        summary_service,
+        mock_repository,
+        mock_scrap_service,
+        mock_language_models_service
+    ):
+        """Test streaming a URL already being computed only waits for its stored summary"""
+        # Arrange
+        test_url = "https://en.wikipedia.org/wiki/Trending"
+        mock_repository.get_summary_by_id.return_value = None
+        mock_repository.acquire_lease.return_value = True
+        mock_repository.create_summary.return_value = MagicMock(summary="Trending summary.")
+        mock_scrap_service.extract_text.return_value = "Body."
+
+        async def slow_summary(text, words_limit):
+            await asyncio.sleep(0.01)
+            return "Trending summary."
+
+        mock_language_models_service.generate_summary.side_effect = slow_summary
+        mock_language_models_service.stream_summary = Mock()
+
+        # Act
+        single = asyncio.ensure_future(summary_service.create_summary(test_url, 100))
+        await asyncio.sleep(0)
+        events = [event async for event in summary_service.stream_summary(test_url, 100)]
+        await single
+
+        # Assert
+        assert events == [{"event": "summary", "summary": "Trending summary."}]
+        mock_language_models_service.stream_summary.assert_not_called()
+        mock_repository.create_summary.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_summary_returns_existing(self, summary_service, mock_repository, mock_scrap_service):
+        """Test streaming an already stored summary emits it right away"""
+        # Arrange
+        mock_repository.get_summary_by_id.return_value = MagicMock(summary="Existing summary.")
+
+        # Act
+        events = [event async for event in summary_service.stream_summary("https://en.wikipedia.org/wiki/X", 100)]
+
+        # Assert
+        assert events == [{"event": "summary", "summary": "Existing summary."}]
+        mock_scrap_service.extract_text.assert_not_called()
+
     def test_generate_summary_id(self, summary_service):
         """Test URL to ID generation is consistent"""
         # Arrange
@@ -169,3 +532,112 @@ class TestSummaryService:
         assert len(id1) == 16  # SHA256 first 16 chars
         assert isinstance(id1, str)
 
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text, summary", [("  \n ", "unused"), ("Some article text.", "")])
+    async def test_create_summary_without_text_stores_nothing(
+        self, summary_service, mock_repository, mock_scrap_service, mock_language_models_service, text, summary
+    ):
+        """Test a page without article text, or with an empty summary, raises and stores nothing - ERROR case"""
+        # Arrange
+        mock_repository.get_summary_by_id.return_value = None
+        mock_repository.acquire_lease.return_value = True
+        mock_scrap_service.extract_text.return_value = text
+        mock_language_models_service.generate_summary.return_value = summary
+
+        # Act & Assert
+        with pytest.raises(NoArticleTextError):
+            await summary_service.create_summary("https://en.wikipedia.org/wiki/Empty", 100)
+        mock_repository.create_summary.assert_not_called()
+        mock_repository.release_lease.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_summary_rejected_when_overloaded(
+        self, mock_repository, mock_scrap_service, mock_language_models_service
+    ):
+        """Test a full backend refuses new pipelines in reject mode - ERROR case"""
+        # Arrange
+        admission = AdmissionController(max_in_flight=1)
+        admission.in_flight = 1
+        service = SummaryService(
+            mock_repository, mock_scrap_service, mock_language_models_service, admission=admission
+        )
+        mock_repository.get_summary_by_id.return_value = None
+        mock_scrap_service.extract_text.return_value = "Some article text."
+
+        # Act & Assert
+        with pytest.raises(OverloadedError) as exc_info:
+            await service.create_summary("https://en.wikipedia.org/wiki/Python", 100)
+        assert exc_info.value.retry_after == admission.retry_after_seconds
+        assert admission.rejected == 1
+        mock_scrap_service.extract_text.assert_not_called()
+        mock_language_models_service.generate_summary.assert_not_called()
+        mock_repository.release_lease.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_summary_without_degrade_is_rejected_in_degrade_mode(
+        self, mock_repository, mock_scrap_service, mock_language_models_service
+    ):
+        """Test callers needing a stored summary get OverloadedError instead of a degraded one - ERROR case"""
+        # Arrange
+        admission = AdmissionController(max_in_flight=1, mode=AdmissionMode.DEGRADE)
+        admission.in_flight = 1
+        service = SummaryService(
+            mock_repository, mock_scrap_service, mock_language_models_service, admission=admission
+        )
+        mock_repository.get_summary_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(OverloadedError):
+            await service.create_summary("https://en.wikipedia.org/wiki/Python", 100, degrade=False)
+        mock_scrap_service.extract_text.assert_not_called()
+        mock_repository.create_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_summary_degrades_when_overloaded(
+        self, mock_repository, mock_scrap_service, mock_language_models_service
+    ):
+        """Test degrade mode serves an unstored lead-paragraph summary"""
+        # Arrange
+        admission = AdmissionController(max_in_flight=1, mode=AdmissionMode.DEGRADE)
+        admission.in_flight = 1
+        service = SummaryService(
+            mock_repository, mock_scrap_service, mock_language_models_service, admission=admission
+        )
+        service.degraded_strategy = "lead"
+        mock_repository.get_summary_by_id.return_value = None
+        mock_scrap_service.extract_text.return_value = "Python is a programming language.\nSecond paragraph."
+
+        # Act
+        result = await service.create_summary("https://en.wikipedia.org/wiki/Python", 3)
+
+        # Assert
+        assert isinstance(result, DegradedSummary)
+        assert result.summary == "Python is a"
+        mock_language_models_service.generate_summary.assert_not_called()
+        mock_repository.create_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_summary_degrades_when_overloaded(
+        self, mock_repository, mock_scrap_service, mock_language_models_service
+    ):
+        """Test degrade mode streams a single summary event marked degraded"""
+        # Arrange
+        admission = AdmissionController(max_in_flight=1, mode=AdmissionMode.DEGRADE)
+        admission.in_flight = 1
+        service = SummaryService(
+            mock_repository, mock_scrap_service, mock_language_models_service, admission=admission
+        )
+        mock_repository.get_summary_by_id.return_value = None
+        mock_scrap_service.extract_text.return_value = (
+            "Python is a programming language. Python is popular. It rained in Amsterdam."
+        )
+
+        # Act
+        events = [event async for event in service.stream_summary("https://en.wikipedia.org/wiki/Python", 10)]
+
+        # Assert
+        assert len(events) == 1
+        assert events[0]["degraded"] is True
+        assert 0 < len(events[0]["summary"].split()) <= 10
+        mock_repository.create_summary.assert_not_called()
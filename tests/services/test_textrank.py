@@ -0,0 +1,118 @@
+"""
+Tests for TextRankSummarizer
+"""
+import time
+
+import pytest
+
+from app.services.language_models.textrank import TextRankSummarizer
+
+ARTICLE = (
+    "Python is a high-level programming language. "
+    "Python emphasizes code readability with significant indentation. "
+    "Guido van Rossum began working on Python in the late 1980s. "
+    "The weather in Amsterdam was rainy that year. "
+    "Python consistently ranks as one of the most popular programming languages.\n"
+    "Its standard library makes Python a popular language for programming tasks."
+)
+
+
+class TestTextRankSummarizer:
+    """Test the local extractive summarizer"""
+
+    @pytest.fixture
+    def summarizer(self):
+        return TextRankSummarizer()
+
+    def test_split_sentences(self, summarizer):
+        """Test sentences are split at punctuation and line breaks"""
+        # Act
+        sentences = summarizer.split_sentences("First one. Second (two)? Third!\nFourth line e.g. here")
+
+        # Assert
+        assert sentences == ["First one.", "Second (two)?", "Third!", "Fourth line e.g. here"]
+
+    def test_split_sentences_in_other_scripts(self, summarizer):
+        """Test Cyrillic capitals, citation marks and CJK full stops end sentences"""
+        # Act
+        russian = summarizer.split_sentences("Москва — столица России.[1] Город основан в 1147 году. т.е. давно")
+        japanese = summarizer.split_sentences("東京は日本の首都です。人口は多い！本当に？")
+
+        # Assert
+        assert russian == ["Москва — столица России.[1]", "Город основан в 1147 году. т.е. давно"]
+        assert japanese == ["東京は日本の首都です。", "人口は多い！", "本当に？"]
+
+    def test_words_are_unicode_terms(self, summarizer):
+        """Test accented words stay whole and every CJK character is its own term"""
+        # Act
+        vectors = summarizer.tfidf_matrix(["Größe der Straße", "Straße", "東京都"])
+
+        # Assert
+        assert vectors.shape == (3, 6)
+        assert vectors[0] @ vectors[1] > 0
+        assert vectors[2] @ vectors[0] == 0
+
+    def test_rank_prefers_central_sentences(self, summarizer):
+        """Test the off-topic sentence gets the lowest score"""
+        # Arrange
+        sentences = summarizer.split_sentences(ARTICLE)
+
+        # Act
+        scores = summarizer.rank(sentences)
+
+        # Assert
+        assert scores.sum() == pytest.approx(1.0)
+        assert sentences[scores.argmin()] == "The weather in Amsterdam was rainy that year."
+
+    def test_summarize_respects_words_limit_and_order(self, summarizer):
+        """Test chosen sentences fit the limit and keep the article order - SUCCESS case"""
+        # Act
+        summary = summarizer.summarize(ARTICLE, 20)
+
+        # Assert
+        assert 0 < len(summary.split()) <= 20
+        sentences = summarizer.split_sentences(summary)
+        positions = [ARTICLE.index(sentence) for sentence in sentences]
+        assert positions == sorted(positions)
+        assert "Amsterdam" not in summary
+
+    def test_summarize_clips_a_single_long_sentence(self, summarizer):
+        """Test a limit shorter than every sentence still returns words_limit words"""
+        # Act
+        summary = summarizer.summarize(ARTICLE, 3)
+
+        # Assert
+        assert len(summary.split()) == 3
+
+    def test_summarize_empty_text(self, summarizer):
+        """Test empty text gives an empty summary"""
+        # Act & Assert
+        assert summarizer.summarize("   ", 50) == ""
+
+    def test_summarize_large_article_is_fast(self, summarizer):
+        """Test an article of a few hundred sentences is summarized in well under a second"""
+        # Arrange
+        text = " ".join(f"Sentence {i} mentions topic{i % 17} and topic{i % 5} in Python." for i in range(400))
+
+        # Act
+        start = time.perf_counter()
+        summary = summarizer.summarize(text, 80)
+        elapsed = time.perf_counter() - start
+
+        # Assert
+        assert len(summary.split()) <= 80
+        assert elapsed < 1.0
+
+    def test_summarize_ranks_only_the_first_max_sentences(self):
+        """Test sentences past max_sentences are never split, ranked or returned"""
+        # Arrange
+        summarizer = TextRankSummarizer(max_sentences=3)
+        text = ARTICLE + " Amsterdam rain falls. Amsterdam rain falls again."
+
+        # Act
+        sentences = summarizer.split_sentences(text, summarizer.max_sentences)
+        summary = summarizer.summarize(text, 200)
+
+        # Assert
+        assert len(sentences) == 3
+        assert summary == " ".join(sentences)
@@ -0,0 +1,68 @@
+"""
+Tests for AdmissionController
+"""
+import asyncio
+
+import pytest
+
+from app.shared.concurrency.admission import AdmissionController, OverloadedError
+from app.shared.concurrency.inference_executor import InferenceExecutor
+
+
+class TestAdmissionController:
+    """Test admission control of summarization pipelines"""
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_max_in_flight(self):
+        """Test pipelines beyond max_in_flight are refused until one finishes"""
+        # Arrange
+        admission = AdmissionController(max_in_flight=1, retry_after_seconds=7)
+
+        # Act & Assert
+        async with admission.admit():
+            with pytest.raises(OverloadedError) as exc_info:
+                async with admission.admit():
+                    pass
+            assert exc_info.value.retry_after == 7
+        async with admission.admit():
+            pass
+        assert admission.stats() == {"in_flight": 0, "admitted": 2, "rejected": 1}
+
+    @pytest.mark.asyncio
+    async def test_refuses_while_inference_queue_is_slow(self):
+        """Test a long-waiting inference call closes admission until the queue drains"""
+        # Arrange
+        executor = InferenceExecutor("test", max_workers=1)
+        admission = AdmissionController(max_queue_wait_seconds=0.01, executor=executor)
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def blocked():
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+
+        running = asyncio.ensure_future(executor.run(blocked))
+        waiting = asyncio.ensure_future(executor.run(lambda: None))
+        await asyncio.sleep(0.03)
+
+        # Act & Assert
+        with pytest.raises(OverloadedError):
+            admission.check()
+        release.set()
+        await asyncio.gather(running, waiting)
+        admission.check()
+        executor.shutdown()
+
+    def test_unlimited_by_default(self):
+        """Test the default controller never refuses"""
+        # Arrange
+        admission = AdmissionController()
+        admission.in_flight = 10_000
+
+        # Act & Assert
+        admission.check()
+
+    def test_invalid_mode(self):
+        """Test an unknown mode is rejected - ERROR case"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            AdmissionController(mode="queue")
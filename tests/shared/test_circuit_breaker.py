@@ -0,0 +1,100 @@
+"""
+Tests for CircuitBreaker
+"""
+import pytest
+
+from app.shared.concurrency.admission import OverloadedError
+from app.shared.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test the consecutive-failure circuit breaker"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker("test", failure_threshold=2, reset_seconds=10, clock=clock)
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test the circuit opens at the threshold and fails fast - ERROR case"""
+        # Act
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert isinstance(exc_info.value, OverloadedError)
+        assert exc_info.value.retry_after == 10
+
+    def test_success_resets_the_failure_count(self, breaker):
+        """Test failures must be consecutive to open the circuit"""
+        # Act
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_one_trial(self, breaker, clock):
+        """Test one trial call is let through after the reset time"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10
+
+        # Act
+        breaker.before_call()
+
+        # Assert
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.before_call()
+
+    def test_failed_trial_reopens(self, breaker, clock):
+        """Test a failing trial call opens the circuit again"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10
+        breaker.before_call()
+
+        # Act
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_released_trial_lets_the_next_call_probe(self, breaker, clock):
+        """Test a trial ended without an outcome keeps the circuit half-open for a new trial"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.before_call() is True
+
+        # Act
+        breaker.release_trial()
+
+        # Assert
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.before_call() is True
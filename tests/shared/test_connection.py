@@ -0,0 +1,24 @@
+"""
+Tests for the async database connection helpers
+"""
+import pytest
+
+from app.shared.databases.connection import to_async_url
+
+
+class TestToAsyncUrl:
+    """Test mapping DATABASE_URL to async drivers"""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("postgresql://u:p@localhost:5432/db", "postgresql+asyncpg://u:p@localhost:5432/db"),
+        ("postgresql+psycopg2://u:p@localhost/db", "postgresql+asyncpg://u:p@localhost/db"),
+        ("postgresql+asyncpg://u:p@localhost/db", "postgresql+asyncpg://u:p@localhost/db"),
+        ("sqlite:///./local.db", "sqlite+aiosqlite:///./local.db"),
+    ])
+    def test_to_async_url(self, url, expected):
+        """Test sync URLs are rewritten and async ones kept"""
+        # Act
+        result = to_async_url(url)
+
+        # Assert
+        assert result == expected
@@ -0,0 +1,146 @@
+"""
+Tests for InferenceExecutor and TokenBucket
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.shared.concurrency.inference_executor import InferenceExecutor
+from app.shared.concurrency.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test the asyncio token bucket"""
+
+    @pytest.mark.asyncio
+    async def test_burst_passes_then_waits_for_refill(self):
+        """Test the capacity is granted at once and further tokens at the rate"""
+        # Arrange
+        bucket = TokenBucket(rate=50, capacity=2)
+
+        # Act
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert elapsed >= 0.035
+
+    def test_invalid_rate(self):
+        """Test a non-positive rate is rejected - ERROR case"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+
+class TestInferenceExecutor:
+    """Test the bounded inference executor"""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result(self):
+        """Test a call runs in the pool and its result is returned - SUCCESS case"""
+        # Arrange
+        executor = InferenceExecutor("test", max_workers=2)
+
+        def call(text, suffix):
+            return text + suffix, threading.current_thread().name
+
+        # Act
+        result, thread_name = await executor.run(call, "summary", suffix=".")
+
+        # Assert
+        assert result == "summary."
+        assert thread_name.startswith("inference-test")
+        assert executor.stats()["completed"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_waits_are_counted(self):
+        """Test no more than max_workers calls run at once and the rest queue"""
+        # Arrange
+        executor = InferenceExecutor("test", max_workers=2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+        depths = []
+
+        def call():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        # Act
+        tasks = [asyncio.ensure_future(executor.run(call)) for _ in range(6)]
+        await asyncio.sleep(0.005)
+        depths.append(executor.queue_depth)
+        await asyncio.gather(*tasks)
+        stats = executor.stats()
+
+        # Assert
+        assert peak == 2
+        assert depths == [4]
+        assert stats["queue_depth"] == 0
+        assert stats["completed"] == 6
+        assert stats["max_wait_seconds"] > 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_call_releases_its_slot(self):
+        """Test a failing call is counted and does not leak a slot - ERROR case"""
+        # Arrange
+        executor = InferenceExecutor("test", max_workers=1)
+
+        def fail():
+            raise RuntimeError("rate limited")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            await executor.run(fail)
+        result = await asyncio.wait_for(executor.run(lambda: "ok"), timeout=1)
+
+        # Assert
+        assert result == "ok"
+        assert executor.stats()["failed"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_call_keeps_its_slot_until_the_thread_finishes(self):
+        """Test a timed-out call still occupies its slot, so later callers queue visibly"""
+        # Arrange
+        executor = InferenceExecutor("test", max_workers=1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(executor.run(time.sleep, 0.2), timeout=0.05)
+
+        # Act
+        waiting = asyncio.ensure_future(executor.run(lambda: "ok"))
+        await asyncio.sleep(0.01)
+        depth_while_blocked = executor.queue_depth
+        result = await asyncio.wait_for(waiting, timeout=1)
+
+        # Assert
+        assert depth_while_blocked == 1
+        assert result == "ok"
+        assert executor.in_flight == 0
+        executor.shutdown()
+
+    def test_from_env_prefers_provider_settings(self, monkeypatch):
+        """Test provider-prefixed settings override the global ones"""
+        # Arrange
+        monkeypatch.setenv("INFERENCE_MAX_WORKERS", "3")
+        monkeypatch.setenv("INFERENCE_RATE_PER_SECOND", "1")
+        monkeypatch.setenv("HUGGINGFACE_INFERENCE_RATE_PER_SECOND", "5")
+
+        # Act
+        executor = InferenceExecutor.from_env("huggingface")
+
+        # Assert
+        assert executor.max_workers == 3
+        assert executor._bucket.rate == 5
+        executor.shutdown()
@@ -0,0 +1,127 @@
+"""
+Tests for the Prometheus metrics helpers
+"""
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.shared.databases.instrumented_pool import InstrumentedAsyncAdaptedQueuePool
+from app.shared.concurrency.inference_executor import InferenceExecutor
+from app.shared.metrics.metrics import ServiceStatsCollector, observe_stage, record_cache_lookup, timed_stage
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetrics:
+    """Test stage timers, cache counters and pool instrumentation"""
+
+    def test_observe_stage_records_duration(self):
+        """Test a timed block adds one observation to its stage"""
+        # Arrange
+        before = sample("summary_stage_seconds_count", stage="test_stage")
+
+        # Act
+        with observe_stage("test_stage"):
+            pass
+
+        # Assert
+        assert sample("summary_stage_seconds_count", stage="test_stage") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_timed_stage_decorator_records_failures_too(self):
+        """Test a decorated coroutine is timed even when it raises"""
+        # Arrange
+        @timed_stage("test_failing_stage")
+        async def fail():
+            raise RuntimeError("boom")
+
+        before = sample("summary_stage_seconds_count", stage="test_failing_stage")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            await fail()
+
+        # Assert
+        assert sample("summary_stage_seconds_count", stage="test_failing_stage") == before + 1
+
+    def test_record_cache_lookup(self):
+        """Test hits and misses are counted per cache"""
+        # Arrange
+        before_hits = sample("summary_cache_lookups_total", cache="test", result="hit")
+        before_misses = sample("summary_cache_lookups_total", cache="test", result="miss")
+
+        # Act
+        record_cache_lookup("test", hit=True, count=3)
+        record_cache_lookup("test", hit=False)
+
+        # Assert
+        assert sample("summary_cache_lookups_total", cache="test", result="hit") == before_hits + 3
+        assert sample("summary_cache_lookups_total", cache="test", result="miss") == before_misses + 1
+
+    @pytest.mark.asyncio
+    async def test_instrumented_pool_records_checkout_wait(self, tmp_path):
+        """Test every pool checkout is timed"""
+        # Arrange
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedAsyncAdaptedQueuePool
+        )
+        before = sample("db_pool_checkout_wait_seconds_count")
+
+        # Act
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        await engine.dispose()
+
+        # Assert
+        assert sample("db_pool_checkout_wait_seconds_count") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_executor_wait_is_observed(self):
+        """Test every executor call records its queue wait per provider"""
+        # Arrange
+        executor = InferenceExecutor("test_provider", max_workers=1)
+        before = sample("inference_executor_wait_seconds_count", provider="test_provider")
+
+        # Act
+        await executor.run(lambda: None)
+        executor.shutdown()
+
+        # Assert
+        assert sample("inference_executor_wait_seconds_count", provider="test_provider") == before + 1
+
+    def test_service_stats_collector_exports_registered_stats(self):
+        """Test registered stats() sources become gauges and counters at collect time"""
+        # Arrange
+        collector = ServiceStatsCollector()
+        collector.register("caller", "test", lambda: {
+            "retries": 2, "hedges": 1, "circuit": "open", "consecutive_failures": 5,
+        })
+        collector.register("cache", "chunk", lambda: {"hits": 3, "misses": 1, "hit_rate": 0.75})
+        collector.register("admission", "summary", lambda: {"in_flight": 4, "admitted": 10, "rejected": 2})
+
+        # Act
+        samples = {
+            (sample.name, tuple(sample.labels.values())): sample.value
+            for family in collector.collect()
+            for sample in family.samples
+        }
+
+        # Assert
+        assert samples[("inference_circuit_state", ("test",))] == 2
+        assert samples[("inference_circuit_consecutive_failures", ("test",))] == 5
+        assert samples[("inference_retries_total", ("test",))] == 2
+        assert samples[("summary_cache_hit_ratio", ("chunk",))] == 0.75
+        assert samples[("admission_in_flight", ("summary",))] == 4
+        assert samples[("admission_rejected_total", ("summary",))] == 2
+
+    def test_service_stats_collector_rejects_unknown_kind(self):
+        """Test registering a source under an unknown kind fails fast"""
+        # Arrange
+        collector = ServiceStatsCollector()
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            collector.register("unknown", "test", dict)
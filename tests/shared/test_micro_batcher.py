@@ -0,0 +1,79 @@
+"""
+Tests for MicroBatcher
+"""
+import asyncio
+
+import pytest
+
+from app.shared.concurrency.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Test the micro-batching of concurrent submissions"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_items_share_a_batch(self):
+        """Test items submitted within the window are sent together - SUCCESS case"""
+        # Arrange
+        batches = []
+
+        async def batch_fn(items):
+            batches.append(items)
+            return [item.upper() for item in items]
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=10, max_wait_seconds=0.01)
+
+        # Act
+        results = await asyncio.gather(*[batcher.submit(item) for item in ["a", "b", "c"]])
+
+        # Assert
+        assert results == ["A", "B", "C"]
+        assert batches == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self):
+        """Test reaching max_batch_size flushes at once"""
+        # Arrange
+        batches = []
+
+        async def batch_fn(items):
+            batches.append(items)
+            return items
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait_seconds=10)
+
+        # Act
+        results = await asyncio.wait_for(asyncio.gather(*[batcher.submit(i) for i in range(4)]), timeout=1)
+
+        # Assert
+        assert results == [0, 1, 2, 3]
+        assert batches == [[0, 1], [2, 3]]
+        assert batcher.stats() == {"batches": 2, "items": 4, "avg_batch_size": 2.0}
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self):
+        """Test a failing batch fails each of its callers - ERROR case"""
+        # Arrange
+        async def batch_fn(items):
+            raise ConnectionError("backend unavailable")
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=10, max_wait_seconds=0.001)
+
+        # Act
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(3)], return_exceptions=True)
+
+        # Assert
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_result_count_mismatch_is_an_error(self):
+        """Test a batch returning the wrong number of results fails its callers"""
+        # Arrange
+        async def batch_fn(items):
+            return items[:1]
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=10, max_wait_seconds=0.001)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await asyncio.gather(batcher.submit(1), batcher.submit(2))
@@ -0,0 +1,138 @@
+"""
+Tests for PageCache
+"""
+import os
+import sqlite3
+
+import pytest
+
+from app.shared.requests.page_cache import PageCache
+
+
+class TestPageCache:
+    """Test the content-addressed on-disk PageCache"""
+
+    @pytest.fixture
+    def page_cache(self, tmp_path):
+        """Create a page cache in a temporary directory"""
+        cache = PageCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        yield cache
+        cache.close()
+
+    def test_store_and_read_round_trip(self, page_cache):
+        """Test a stored body and its validators can be read back"""
+        # Arrange
+        body = b"<html>" + b"Python " * 1000 + b"</html>"
+
+        # Act
+        stored = page_cache.store("https://en.wikipedia.org/wiki/Python", body, '"v1"', None)
+        entry = page_cache.lookup("https://en.wikipedia.org/wiki/Python")
+
+        # Assert
+        assert entry == stored
+        assert entry.etag == '"v1"'
+        assert page_cache.read(entry.digest) == body
+        assert page_cache.size() < len(body)  # stored compressed
+
+    def test_identical_bodies_share_one_blob(self, page_cache):
+        """Test content addressing stores a body once for several URLs"""
+        # Arrange
+        body = b"<html>same</html>"
+
+        # Act
+        first = page_cache.store("https://en.wikipedia.org/wiki/A", body, '"a"', None)
+        size_after_first = page_cache.size()
+        second = page_cache.store("https://en.wikipedia.org/wiki/B", body, '"b"', None)
+
+        # Assert
+        assert first.digest == second.digest
+        assert page_cache.size() == size_after_first
+
+    def test_least_recently_used_page_is_evicted(self, tmp_path):
+        """Test the size cap evicts the least recently used URL and its derived text"""
+        # Arrange
+        page_cache = PageCache(tmp_path, max_bytes=2500)
+        bodies = {name: os.urandom(1000) for name in "ABC"}  # incompressible
+        a = page_cache.store("https://en.wikipedia.org/wiki/A", bodies["A"], '"a"', None)
+        page_cache.put_derived(a.digest, "text:lxml", "A text")
+        page_cache.store("https://en.wikipedia.org/wiki/B", bodies["B"], '"b"', None)
+        page_cache.lookup("https://en.wikipedia.org/wiki/A")  # A becomes most recently used
+
+        # Act
+        page_cache.store("https://en.wikipedia.org/wiki/C", bodies["C"], '"c"', None)
+
+        # Assert
+        assert page_cache.lookup("https://en.wikipedia.org/wiki/B") is None
+        assert page_cache.lookup("https://en.wikipedia.org/wiki/A") is not None
+        assert page_cache.get_derived(a.digest, "text:lxml") == "A text"
+        assert page_cache.size() <= 2500
+        page_cache.close()
+
+    def test_size_total_matches_stored_bytes(self, tmp_path):
+        """Test the running size total follows stores, replaced derived text and evictions"""
+        # Arrange
+        page_cache = PageCache(tmp_path, max_bytes=2500)
+        for name in "ABCD":
+            page = page_cache.store(f"https://en.wikipedia.org/wiki/{name}", os.urandom(1000), None, None)
+            page_cache.put_derived(page.digest, "text:lxml", name * 50)
+            page_cache.put_derived(page.digest, "text:lxml", name * 80)
+
+        # Act
+        total = page_cache.size()
+        page_cache.close()
+        reopened = PageCache(tmp_path, max_bytes=2500)
+
+        # Assert
+        recount = reopened._db.execute(
+            "SELECT (SELECT SUM(size) FROM blobs) + (SELECT SUM(LENGTH(data)) FROM derived)"
+        ).fetchone()[0]
+        assert total == recount == reopened.size()
+        assert total <= 2500
+        reopened.close()
+
+    def test_derived_text_requires_cached_body(self, page_cache):
+        """Test derived text is only kept next to a cached body"""
+        # Act
+        page_cache.put_derived("0" * 64, "text:lxml", "orphan")
+
+        # Assert
+        assert page_cache.get_derived("0" * 64, "text:lxml") is None
+
+    def test_derived_text_is_evicted_over_the_cap(self, tmp_path):
+        """Test storing derived text also evicts least recently used pages"""
+        # Arrange
+        page_cache = PageCache(tmp_path, max_bytes=2500)
+        page_cache.store("https://en.wikipedia.org/wiki/A", os.urandom(1000), '"a"', None)
+        b = page_cache.store("https://en.wikipedia.org/wiki/B", os.urandom(1000), '"b"', None)
+
+        # Act
+        page_cache.put_derived(b.digest, "text:lxml", os.urandom(600).hex())
+
+        # Assert
+        assert page_cache.lookup("https://en.wikipedia.org/wiki/A") is None
+        assert page_cache.lookup("https://en.wikipedia.org/wiki/B") is not None
+        assert page_cache.size() <= 2500
+        page_cache.close()
+
+    def test_locked_index_is_a_miss(self, page_cache, tmp_path):
+        """Test a locked index degrades to cache misses instead of raising - FAIL case"""
+        # Arrange
+        stored = page_cache.store("https://en.wikipedia.org/wiki/A", b"<html>A</html>", '"a"', None)
+        page_cache._db.execute("PRAGMA busy_timeout = 0")
+        other = sqlite3.connect(tmp_path / "index.sqlite3")
+        other.execute("BEGIN EXCLUSIVE")
+
+        # Act
+        results = [
+            page_cache.lookup("https://en.wikipedia.org/wiki/A"),
+            page_cache.store("https://en.wikipedia.org/wiki/B", b"<html>B</html>", '"b"', None),
+            page_cache.get_derived(stored.digest, "text:lxml"),
+            page_cache.put_derived(stored.digest, "text:lxml", "A text"),
+        ]
+        other.rollback()
+        other.close()
+
+        # Assert
+        assert results == [None, None, None, None]
+        assert page_cache.lookup("https://en.wikipedia.org/wiki/A") == stored
+        assert page_cache.lookup("https://en.wikipedia.org/wiki/B") is None
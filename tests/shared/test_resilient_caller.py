@@ -0,0 +1,217 @@
+"""
+Tests for ResilientCaller
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.shared.concurrency.inference_executor import InferenceExecutor
+from app.shared.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.shared.resilience.resilient_caller import QueueTimeoutError, ResilientCaller, RetryPolicy
+
+
+class Flaky:
+    """Callable failing ``failures`` times before returning ``result``"""
+    def __init__(self, failures, result="ok", error=ConnectionError):
+        self.failures = failures
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if call <= self.failures:
+            raise self.error("backend unavailable")
+        return self.result
+
+
+class TestResilientCaller:
+    """Test timeouts, retries, hedging and the circuit breaker"""
+
+    @pytest.fixture
+    def executor(self):
+        executor = InferenceExecutor("test", max_workers=4)
+        yield executor
+        executor.shutdown()
+
+    def make_caller(self, executor, **policy):
+        policy = {"attempts": 3, "base_delay": 0.001, "max_delay": 0.002, **policy}
+        return ResilientCaller(
+            executor,
+            RetryPolicy(**policy),
+            CircuitBreaker("test", failure_threshold=3, reset_seconds=60),
+            is_retryable=lambda exc: isinstance(exc, (ConnectionError, TimeoutError)),
+        )
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_errors(self, executor):
+        """Test transient failures are retried until success - SUCCESS case"""
+        # Arrange
+        caller = self.make_caller(executor)
+        fn = Flaky(failures=2)
+
+        # Act
+        result = await caller.call(fn)
+
+        # Assert
+        assert result == "ok"
+        assert fn.calls == 3
+        assert caller.stats()["retries"] == 2
+        assert caller.breaker.failures == 0
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_errors_are_raised_at_once(self, executor):
+        """Test a client error is not retried - ERROR case"""
+        # Arrange
+        caller = self.make_caller(executor)
+        fn = Flaky(failures=5, error=ValueError)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await caller.call(fn)
+        assert fn.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_retried(self, executor):
+        """Test an attempt slower than the timeout is abandoned and retried"""
+        # Arrange
+        caller = self.make_caller(executor, timeout_seconds=0.05)
+        calls = []
+
+        def slow_then_fast():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+            return "fast"
+
+        # Act
+        result = await caller.call(slow_then_fast)
+
+        # Assert
+        assert result == "fast"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_does_not_count_against_the_timeout(self):
+        """Test saturating a healthy backend neither times calls out nor opens the circuit - SUCCESS case"""
+        # Arrange
+        executor = InferenceExecutor("test", max_workers=2)
+        caller = self.make_caller(executor, timeout_seconds=0.15)
+
+        def healthy():
+            time.sleep(0.05)
+            return "ok"
+
+        # Act
+        results = await asyncio.gather(*[caller.call(healthy) for _ in range(20)])
+        executor.shutdown()
+
+        # Assert
+        assert results == ["ok"] * 20
+        assert caller.stats()["retries"] == 0
+        assert caller.breaker.state == CircuitState.CLOSED
+        assert max(caller.latencies._samples) < 0.15
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_is_not_a_backend_failure(self):
+        """Test a call that never gets a slot fails with QueueTimeoutError without touching the breaker"""
+        # Arrange
+        executor = InferenceExecutor("test", max_workers=1)
+        caller = self.make_caller(executor, timeout_seconds=1, queue_timeout_seconds=0.05)
+        release = threading.Event()
+        blocker = asyncio.ensure_future(caller.call(release.wait))
+        await asyncio.sleep(0.01)
+        fn = Flaky(failures=0)
+
+        # Act
+        with pytest.raises(QueueTimeoutError):
+            await caller.call(fn)
+        release.set()
+        await blocker
+        executor.shutdown()
+
+        # Assert
+        assert fn.calls == 0
+        assert caller.breaker.failures == 0
+        assert caller.stats()["retries"] == 0
+        assert executor.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(self, executor):
+        """Test the breaker stops calling a backend that keeps failing - ERROR case"""
+        # Arrange
+        caller = self.make_caller(executor)
+        fn = Flaky(failures=100)
+
+        # Act
+        with pytest.raises(ConnectionError):
+            await caller.call(fn)
+        with pytest.raises(CircuitOpenError):
+            await caller.call(fn)
+
+        # Assert
+        assert fn.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_half_open_trial_does_not_wedge_the_circuit(self, executor):
+        """Test cancelling the half-open trial lets a later call probe and close the circuit"""
+        # Arrange
+        caller = self.make_caller(executor)
+        caller.breaker.reset_seconds = 0
+        for _ in range(3):
+            caller.breaker.record_failure()
+        trial = asyncio.ensure_future(caller.call(time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+
+        # Act
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        result = await caller.call(Flaky(failures=0))
+
+        # Assert
+        assert result == "ok"
+        assert caller.breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_hedges_slow_calls(self, executor):
+        """Test a call slower than the latency percentile gets a duplicate that wins"""
+        # Arrange
+        caller = self.make_caller(executor, hedge_percentile=95, hedge_min_samples=5)
+        for _ in range(5):
+            caller.latencies.add(0.01)
+        calls = []
+
+        def first_call_stalls():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.3)
+                return "slow"
+            return "hedged"
+
+        # Act
+        start = time.monotonic()
+        result = await caller.call(first_call_stalls)
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert result == "hedged"
+        assert caller.stats()["hedges"] == 1
+        assert elapsed < 0.25
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test backoff delays stay within the exponential cap"""
+        # Arrange
+        policy = RetryPolicy(base_delay=1, max_delay=4)
+
+        # Act
+        delays = [policy.backoff(retry) for retry in (1, 2, 3, 4, 5) for _ in range(20)]
+
+        # Assert
+        assert all(0 <= delay <= 4 for delay in delays)
+        assert all(policy.backoff(1) <= 1 for _ in range(20))
@@ -0,0 +1,34 @@
+"""
+Tests for per-request stage timings
+"""
+import contextvars
+
+from app.shared.metrics.server_timing import format_server_timing, record_stage_timing, start_request_timing
+
+
+class TestServerTiming:
+    """Test the Server-Timing bookkeeping"""
+
+    def test_records_only_inside_a_timed_request(self):
+        """Test stages accumulate per request and are ignored outside one"""
+        # Arrange
+        def handle_request():
+            timings = start_request_timing()
+            record_stage_timing("fetch", 0.5)
+            record_stage_timing("fetch", 0.25)
+            return timings
+
+        # Act
+        record_stage_timing("fetch", 1.0)
+        timings = contextvars.copy_context().run(handle_request)
+
+        # Assert
+        assert timings == {"fetch": [0.75, 2]}
+
+    def test_format_server_timing(self):
+        """Test the header value lists stages in milliseconds plus the total"""
+        # Act
+        header = format_server_timing({"fetch": [0.0123, 1], "chunk_inference": [1.5, 4]}, 2.0)
+
+        # Assert
+        assert header == 'fetch;dur=12.3, chunk_inference;dur=1500.0;desc="4 calls", total;dur=2000.0'
@@ -0,0 +1,73 @@
+"""
+Tests for SingleFlight
+"""
+import asyncio
+
+import pytest
+
+from app.shared.concurrency.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test the SingleFlight request coalescer"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_computation(self):
+        """Test callers with the same key await a single run"""
+        # Arrange
+        single_flight = SingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        # Act
+        results = await asyncio.gather(*[single_flight.do("key", compute) for _ in range(5)])
+
+        # Assert
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert single_flight.in_flight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test callers with different keys do not share results"""
+        # Arrange
+        single_flight = SingleFlight()
+
+        async def compute(value):
+            await asyncio.sleep(0)
+            return value
+
+        # Act
+        results = await asyncio.gather(
+            single_flight.do("a", lambda: compute("a")),
+            single_flight.do("b", lambda: compute("b")),
+        )
+
+        # Assert
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_and_key_released(self):
+        """Test a failure reaches every caller and the next call runs again"""
+        # Arrange
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        # Act
+        results = await asyncio.gather(
+            single_flight.do("key", fail),
+            single_flight.do("key", fail),
+            return_exceptions=True,
+        )
+        retry = await single_flight.do("key", lambda: asyncio.sleep(0, result="ok"))
+
+        # Assert
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert retry == "ok"